@@ -0,0 +1,72 @@
+"""
+benchmarks.fluent
+~~~~~~~~~~~~~~~~~
+
+Number of fluent attribute chains, e.g. ``sp.green.bold.dots``, applied
+per second, each followed by the next frame reading the render state.
+
+The changes of a chain are composed into a single render state once it
+is read. For reference, the same chain is run with the state read after
+every step, which builds a state per step.
+
+Run with ``python benchmarks/fluent.py``.
+"""
+
+import io
+import time
+import warnings
+
+from yaspin import yaspin
+
+DURATION = 2.0
+
+CHAINS = [
+    ["green"],
+    ["green", "bold"],
+    ["dots"],
+    ["right"],
+    ["green", "bold", "dots"],
+    ["green", "on_blue", "bold", "underline", "arc", "right"],
+]
+
+
+def chained(steps):
+    def run(sp):
+        for step in steps:
+            sp = getattr(sp, step)
+        return sp._state
+
+    return run
+
+
+def per_step(steps):
+    def run(sp):
+        for step in steps:
+            state = getattr(sp, step)._state
+        return state
+
+    return run
+
+
+def bench(chain):
+    sp = yaspin(text="benchmark", stream=io.StringIO())
+    count = 0
+    t_end = time.perf_counter() + DURATION
+    while time.perf_counter() < t_end:
+        for _ in range(100):
+            chain(sp)
+        count += 100
+    return count / DURATION
+
+
+def main():
+    warnings.simplefilter("ignore")
+    for steps in CHAINS:
+        name = "sp." + ".".join(steps)
+        chain_us = 1e6 / bench(chained(steps))
+        step_us = 1e6 / bench(per_step(steps))
+        print(f"{name:>40}: {chain_us:>6.1f} µs per chain, {step_us:>6.1f} µs with a state per step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+benchmarks.memory
+~~~~~~~~~~~~~~~~~
+
+Memory taken by spinners that are created but never started, e.g. one
+per queued task. For reference, the same spinners are built from a copy
+of ``Yaspin`` without ``__slots__``, which keeps the attributes in the
+instance ``__dict__``.
+
+Run with ``python benchmarks/memory.py``.
+"""
+
+import gc
+import io
+import tracemalloc
+import warnings
+
+from yaspin.core import Yaspin
+from yaspin.spinners import Spinners
+
+COUNT = 10_000
+
+CASES = {
+    "default spinner": {},
+    "catalogue spinner": {"spinner": Spinners.dots12},
+    "colors and text": {"color": "cyan", "attrs": ["bold"], "text": "Waiting in the queue"},
+}
+
+
+def unslotted(cls):
+    """Copy the class without its slots, so the instances get a ``__dict__``."""
+    slots = {*cls.__slots__, "__slots__"}
+    namespace = {name: value for name, value in vars(cls).items() if name not in slots}
+    return type(f"Unslotted{cls.__name__}", cls.__bases__, namespace)
+
+
+def bench(cls, **kwargs):
+    stream = io.StringIO()
+    # Warm up caches shared by the instances
+    cls(stream=stream, **kwargs)
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    spinners = [cls(stream=stream, **kwargs) for _ in range(COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del spinners
+    return (after - before) / COUNT
+
+
+def main():
+    warnings.simplefilter("ignore")
+    reference = unslotted(Yaspin)
+    for name, kwargs in CASES.items():
+        size = bench(Yaspin, **kwargs)
+        unslotted_size = bench(reference, **kwargs)
+        change = (size - unslotted_size) / unslotted_size
+        print(
+            f"{name:>18}: {size:>6.0f} bytes per instance,"
+            f" {unslotted_size:>6.0f} without slots ({change:+.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
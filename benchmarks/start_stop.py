@@ -0,0 +1,39 @@
+"""
+benchmarks.start_stop
+~~~~~~~~~~~~~~~~~~~~~
+
+Number of start/stop pairs per second, with and without thread reuse.
+
+Run with ``python benchmarks/start_stop.py``.
+"""
+
+import io
+import time
+
+from yaspin import yaspin
+
+DURATION = 2.0
+
+
+def bench(**kwargs):
+    sp = yaspin(text="benchmark", stream=io.StringIO(), **kwargs)
+    count = 0
+    t_end = time.perf_counter() + DURATION
+    while time.perf_counter() < t_end:
+        sp.start()
+        sp.stop()
+        count += 1
+    sp.close()
+    return count / DURATION
+
+
+def main():
+    for name, kwargs in [
+        ("new thread per start", {}),
+        ("reused thread", {"reuse_thread": True}),
+    ]:
+        print(f"{name:>22}: {bench(**kwargs):>10.0f} start/stop pairs per second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+benchmarks.threads
+~~~~~~~~~~~~~~~~~~
+
+Number of updates per second applied to a running spinner shared by a
+growing number of threads. On free-threaded builds the setters scale with
+the threads, as no global lock is taken for them.
+
+Run with ``python benchmarks/threads.py``.
+"""
+
+import io
+import sys
+import threading
+import time
+import warnings
+
+from yaspin import yaspin
+
+OPS = 20_000
+
+THREADS = [1, 2, 4, 8]
+
+OPERATIONS = {
+    "text": lambda sp, i: setattr(sp, "text", f"text-{i}"),
+    "update": lambda sp, i: sp.update(text=f"text-{i}", reversal=bool(i % 2)),
+    "write": lambda sp, i: sp.write(f"msg-{i}"),
+}
+
+
+def bench(operation, threads):
+    barrier = threading.Barrier(threads + 1)
+    ops = OPS // threads
+
+    def worker():
+        barrier.wait()
+        for i in range(ops):
+            operation(sp, i)
+
+    with yaspin(text="benchmark", stream=io.StringIO()) as sp:
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    return ops * threads / elapsed
+
+
+def main():
+    warnings.simplefilter("ignore")
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+    for name, operation in OPERATIONS.items():
+        for threads in THREADS:
+            rate = bench(operation, threads)
+            print(f"{name:>8} x{threads}: {rate:>10.0f} updates per second")
+
+
+if __name__ == "__main__":
+    main()
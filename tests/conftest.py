@@ -5,6 +5,7 @@ tests.conftest
 Tests data.
 """
 
+import io
 import signal
 import sys
 
@@ -105,6 +106,14 @@ def isatty_true(monkeypatch):
     monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
 
 
+@pytest.fixture
+def tty_stream():
+    """In-memory stream posing as a terminal."""
+    stream = io.StringIO()
+    stream.isatty = lambda: True
+    return stream
+
+
 def color_id_func(case):
     if isinstance(case, tuple):
         color, _ = case
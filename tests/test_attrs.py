@@ -11,7 +11,7 @@ from termcolor import ATTRIBUTES
 
 import pytest
 
-from yaspin import yaspin
+from yaspin import core, yaspin
 from yaspin.constants import SPINNER_ATTRS
 from yaspin.spinners import Spinners
 
@@ -38,7 +38,7 @@ def test_color(monkeypatch, color_test_cases):
     else:
         getattr(sp, color)
         assert sp.color == expected
-        assert sp._color_func.keywords["color"] == expected
+        assert sp.style.color == expected
 
 
 # Values for ``on_color`` argument
@@ -57,7 +57,7 @@ def test_on_color(monkeypatch, on_color_test_cases):
     else:
         getattr(sp, on_color)
         assert sp.on_color == expected
-        assert sp._color_func.keywords["on_color"] == expected
+        assert sp.style.on_color == expected
 
 
 # Values for ``attrs`` argument
@@ -67,7 +67,7 @@ def test_attrs(monkeypatch, attr):
     sp = yaspin()
     getattr(sp, attr)
     assert sp.attrs == [attr]
-    assert sp._color_func.keywords["attrs"] == [attr]
+    assert sp.style.attrs == {attr}
 
 
 def id_func(case):
@@ -110,3 +110,20 @@ def test_side(side, expected):
     else:
         getattr(sp, side)
         assert sp.side == expected
+
+
+def test_fluent_table_is_read_only():
+    assert yaspin().bold.attrs == ["bold"]  # builds the table on first use
+    table = core._fluent_table
+    assert table is not None
+    assert table["red"] == {"color": "red"}
+    assert table["on_red"] == {"on_color": "on_red"}
+    assert table["bold"] == {"attrs": ("bold",)}
+    assert table["right"] == {"side": "right"}
+
+    with pytest.raises(TypeError):
+        table["red"] = {"color": "blue"}  # type: ignore[index]
+
+    # Once built, the table is reused
+    assert yaspin().red.color == "red"
+    assert core._fluent_table is table
@@ -0,0 +1,51 @@
+"""
+tests.test_bandwidth
+~~~~~~~~~~~~~~~~~~~~
+
+Test terminal bandwidth limit.
+"""
+
+import os
+import time
+
+import pytest
+
+from yaspin import Spinner, yaspin
+
+
+def test_bandwidth_unlimited_by_default(tty_stream):
+    sp = yaspin(stream=tty_stream)
+    assert sp._bandwidth is None
+
+
+@pytest.mark.parametrize("value, expected", [(0, None), (1200, 1200)])
+def test_bandwidth_explicit(value, expected, tty_stream):
+    sp = yaspin(stream=tty_stream, max_bandwidth=value)
+    assert sp._bandwidth == expected
+
+
+def test_bandwidth_negative():
+    with pytest.raises(ValueError):
+        yaspin(max_bandwidth=-1)
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires pty")
+def test_bandwidth_detected_from_baud_rate():
+    termios = pytest.importorskip("termios")
+    master, slave = os.openpty()
+    attrs = termios.tcgetattr(slave)
+    attrs[4] = attrs[5] = termios.B9600
+    termios.tcsetattr(slave, termios.TCSANOW, attrs)
+
+    with open(slave, "w", encoding="utf-8") as stream:
+        assert yaspin(stream=stream)._bandwidth == 960
+        assert yaspin(stream=stream, max_bandwidth=0)._bandwidth is None
+    os.close(master)
+
+
+def test_bandwidth_lowers_frame_rate(tty_stream):
+    # Full frame is 14 bytes, so the budget allows one frame per ~0.3s
+    sp = yaspin(Spinner("ab", 10), text="foo", timer=True, stream=tty_stream, max_bandwidth=50)
+    with sp:
+        time.sleep(0.5)
+    assert tty_stream.getvalue().count("\r\033[K\r") <= 3
@@ -0,0 +1,106 @@
+"""
+tests.test_context
+~~~~~~~~~~~~~~~~~~
+
+Test access to the current spinner.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import asyncio
+import io
+import threading
+
+from yaspin import current, yaspin
+from yaspin.context import NOOP_SPINNER
+
+
+def set_text(text):
+    current().text = text
+
+
+def test_noop_when_no_spinner():
+    sp = current()
+    assert sp is NOOP_SPINNER
+    assert not sp
+
+    # Everything is accepted and ignored
+    sp.text = "ignored"
+    sp.write("ignored")
+    sp.green.bold.ok("✔")
+    with sp.hidden():
+        pass
+
+
+def test_current_spinner():
+    with yaspin(stream=io.StringIO()) as sp:
+        assert current() is sp
+        set_text("deep down")
+        assert sp.text == "deep down"
+
+    assert current() is NOOP_SPINNER
+
+
+def test_nested_spinners():
+    stream = io.StringIO()
+    with yaspin(stream=stream) as outer:
+        with yaspin(stream=stream) as inner:
+            assert current() is inner
+        assert current() is outer
+
+
+def test_decorated_function():
+    sp = yaspin(stream=io.StringIO())
+
+    @sp
+    def task():
+        return current()
+
+    assert task() is sp
+
+
+def test_delayed_spinner():
+    with yaspin(delay=1, stream=io.StringIO()) as sp:
+        assert current() is sp
+    assert current() is NOOP_SPINNER
+
+
+def test_other_threads():
+    with yaspin(stream=io.StringIO()) as sp, ThreadPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(lambda _: current(), range(2))) == [sp, sp]
+
+
+def test_threads_with_own_spinners():
+    barrier = threading.Barrier(2)
+
+    def run(i):
+        with yaspin(stream=io.StringIO()) as sp:
+            barrier.wait(timeout=5)
+            found = current()
+            barrier.wait(timeout=5)
+            return found is sp
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(run, range(2))) == [True, True]
+
+
+def test_asyncio_tasks():
+    async def task(i):
+        with yaspin(stream=io.StringIO()) as sp:
+            await asyncio.sleep(0.05)
+            return current() is sp
+
+    async def main():
+        return await asyncio.gather(*(task(i) for i in range(3)))
+
+    assert asyncio.run(main()) == [True, True, True]
+
+
+def test_stopped_from_another_thread():
+    sp = yaspin(stream=io.StringIO())
+    sp.start()
+    thread = threading.Thread(target=sp.stop)
+    thread.start()
+    thread.join()
+
+    assert current() is NOOP_SPINNER
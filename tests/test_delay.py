@@ -0,0 +1,130 @@
+"""
+tests.test_delay
+~~~~~~~~~~~~~~~~
+
+Test delayed start and minimal visible time of the spinner.
+"""
+
+import io
+import threading
+import time
+
+import pytest
+
+from yaspin import yaspin
+from yaspin.scheduler import Scheduler
+
+
+def test_fast_block_leaves_no_output():
+    stream = io.StringIO()
+    with yaspin(text="fast", delay=0.5, stream=stream) as sp:
+        pass
+
+    assert stream.getvalue() == ""
+    assert sp._spin_thread is None
+    assert sp.elapsed_time < 0.5
+
+
+def test_slow_block_shows_spinner():
+    stream = io.StringIO()
+    with yaspin(text="slow", delay=0.05, stream=stream) as sp:
+        time.sleep(0.3)
+        assert sp._spin_thread is not None
+        assert sp._spin_thread.is_alive()
+
+    assert "slow" in stream.getvalue()
+
+
+def test_delayed_ok_prints_final_line():
+    stream = io.StringIO()
+    with yaspin(text="fast", delay=0.5, stream=stream) as sp:
+        sp.ok("✔")
+
+    assert stream.getvalue() == "✔ fast\n"
+
+
+def test_delayed_write():
+    stream = io.StringIO()
+    with yaspin(text="fast", delay=0.5, stream=stream) as sp:
+        sp.write("message")
+
+    assert "message\n" in stream.getvalue()
+    assert "fast" not in stream.getvalue()
+
+
+def test_delayed_start_hidden():
+    stream = io.StringIO()
+    sp = yaspin(text="hidden", delay=0.05, stream=stream)
+    sp.start()
+    sp.hide()
+    time.sleep(0.2)
+    assert "hidden" not in stream.getvalue()
+
+    sp.show()
+    time.sleep(0.2)
+    sp.stop()
+    assert "hidden" in stream.getvalue()
+
+
+def test_restart_after_cancelled_start():
+    stream = io.StringIO()
+    sp = yaspin(text="again", delay=0.05, stream=stream)
+    sp.start()
+    sp.stop()
+    sp.start()
+    time.sleep(0.2)
+    sp.stop()
+
+    assert "again" in stream.getvalue()
+
+
+def test_min_visible():
+    sp = yaspin(min_visible=0.2, stream=io.StringIO())
+    t1 = time.monotonic()
+    sp.start()
+    sp.stop()
+
+    assert time.monotonic() - t1 >= 0.2
+
+
+def test_min_visible_not_applied_when_not_shown():
+    sp = yaspin(delay=1, min_visible=1, stream=io.StringIO())
+    sp.start()
+    t1 = time.monotonic()
+    sp.stop()
+
+    assert time.monotonic() - t1 < 0.5
+
+
+@pytest.mark.parametrize("kwargs", [{"delay": -1}, {"min_visible": -0.1}])
+def test_negative_durations(kwargs):
+    with pytest.raises(ValueError):
+        yaspin(**kwargs)
+
+
+def test_scheduler_order_and_cancel():
+    scheduler = Scheduler()
+    calls = []
+    done = threading.Event()
+
+    # Start the scheduler thread beforehand
+    scheduler.call_later(0, lambda: None).wait()
+
+    # Keep the scheduler thread waiting until all the calls are armed
+    with scheduler._cond:
+        scheduler.call_later(0.02, lambda: calls.append(2))
+        scheduler.call_later(0.01, lambda: calls.append(1))
+        cancelled = scheduler.call_later(0.015, lambda: calls.append("cancelled"))
+        scheduler.call_later(0.03, done.set)
+        assert cancelled.cancel()
+
+    assert done.wait(1)
+    assert calls == [1, 2]
+
+
+def test_scheduler_cancel_after_run():
+    scheduler = Scheduler()
+    call = scheduler.call_later(0, lambda: None)
+    call.wait()
+
+    assert not call.cancel()
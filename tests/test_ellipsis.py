@@ -6,7 +6,7 @@ import time
 
 import pytest
 
-from yaspin import yaspin
+from yaspin import Spinner, yaspin
 
 
 def test_wo_ellipsis():
@@ -25,6 +25,18 @@ def test_with_ellipsis():
     assert sp._get_max_text_length(frame, timer) == max_len
 
 
+@patch("shutil.get_terminal_size")
+def test_wide_characters_truncated_by_width(mock_get_terminal_size):
+    mock_get_terminal_size.return_value.columns = 12
+    sp = yaspin(Spinner(["🌍"], 100), text="日本語のテキスト", ellipsis="…")
+
+    # 🌍 + space + 4 wide chars + ellipsis
+    line = sp._compose_out("🌍")
+    assert line == "\r🌍 日本語の…"
+    _, _, _, width = sp._compose_segments("🌍")
+    assert width == 12
+
+
 @patch("shutil.get_terminal_size")
 def test_terminal_size_called_once(mock_get_terminal_size):
     mock_get_terminal_size.return_value.columns = 80
@@ -0,0 +1,125 @@
+"""
+tests.test_fork
+~~~~~~~~~~~~~~~
+
+Test spinners running when the process forks.
+"""
+
+import io
+import os
+import threading
+import time
+
+import pytest
+
+from yaspin import context, core, Spinner, yaspin
+from yaspin.scheduler import scheduler
+
+pytestmark = [
+    pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork"),
+    # Forking a multi-threaded process is what is tested here
+    pytest.mark.filterwarnings("ignore::DeprecationWarning"),
+]
+
+
+def run_in_child(check):
+    """Fork, run the check in the child and return its exit code."""
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            check()
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def test_child_gets_stopped_spinner():
+    stream = io.StringIO()
+    with yaspin(Spinner("ab", 10), text="parent", stream=stream, reuse_thread=True) as sp:
+        time.sleep(0.05)
+
+        def check():
+            assert not sp._is_active()
+            assert sp._spin_thread is None
+            assert not context._running
+            assert not core._spinner_stacks
+            # Nothing is drawn, locks are free
+            assert sp._stream_lock.acquire(timeout=1)
+            sp._stream_lock.release()
+            sp.text = "child"
+
+        assert run_in_child(check) == 0
+        # The parent keeps spinning
+        assert sp._is_spinning()
+        assert sp.text == "parent"
+    sp.close()
+
+
+def test_child_can_restart_spinner():
+    stream = io.StringIO()
+    with yaspin(Spinner("ab", 10), text="parent", stream=stream) as sp:
+
+        def check():
+            with sp:
+                time.sleep(0.05)
+                assert sp._is_spinning()
+            assert "parent" in stream.getvalue()
+
+        assert run_in_child(check) == 0
+
+
+def test_fork_while_stream_lock_is_held():
+    stream = io.StringIO()
+    held = threading.Event()
+    release = threading.Event()
+
+    with yaspin(stream=stream) as sp:
+
+        def hold():
+            with sp._stream_lock:
+                held.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait()
+        try:
+            # The lock holder does not exist in the child
+            assert run_in_child(lambda: sp.write("message")) == 0
+        finally:
+            release.set()
+            thread.join()
+
+
+def test_buffered_output_is_not_duplicated():
+    r, w = os.pipe()
+    stream = open(w, "w", encoding="utf-8")  # noqa: SIM115
+    with yaspin(Spinner("ab", 10), stream=stream):
+        stream.write("pending")
+
+        def check():
+            stream.flush()
+
+        assert run_in_child(check) == 0
+    stream.close()
+
+    with open(r, encoding="utf-8") as out:
+        assert out.read().count("pending") == 1
+
+
+def test_child_drops_scheduled_starts():
+    sp = yaspin(stream=io.StringIO(), delay=10)
+    sp.start()
+    try:
+
+        def check():
+            assert not scheduler._queue
+            assert not sp._is_active()
+
+        assert run_in_child(check) == 0
+        assert sp._is_active()
+    finally:
+        sp.stop()
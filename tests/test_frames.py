@@ -0,0 +1,112 @@
+"""
+tests.test_frames
+~~~~~~~~~~~~~~~~~
+
+Test spinner frames produced on the fly.
+"""
+
+from collections import deque
+
+import io
+import itertools
+import os
+import time
+
+import pytest
+
+from yaspin import Spinner, yaspin
+from yaspin.core import FRAME_CACHE_WINDOW
+from yaspin.frames import generate_frames, is_streamed, stream_frames
+
+
+@pytest.mark.parametrize(
+    "frames, expected",
+    [
+        ("ab", False),
+        (["a", "b"], False),
+        (("a", "b"), False),
+        (b"ab", False),
+        (iter(["a", "b"]), True),
+        (deque(["a", "b"]), True),
+        (lambda tick, elapsed, width: "a", True),
+    ],
+)
+def test_is_streamed(frames, expected):
+    assert is_streamed(frames) is expected
+
+
+def test_stream_iterable_frames():
+    frames = stream_frames(deque(["a", "b"]))
+    assert list(itertools.islice(frames, 5)) == ["a", "b", "a", "b", "a"]
+
+
+def test_stream_iterator_frames():
+    # One-shot iterators keep showing the last frame
+    frames = stream_frames(iter(["a", "b"]))
+    assert list(itertools.islice(frames, 4)) == ["a", "b", "b", "b"]
+
+    frames = stream_frames(iter([]))
+    assert next(frames) == ""
+
+
+def test_generate_frames():
+    frames = generate_frames(
+        lambda tick, elapsed, width: f"{tick}/{elapsed}/{width}", lambda: 1.5, lambda: 80
+    )
+    assert list(itertools.islice(frames, 2)) == ["0/1.5/80", "1/1.5/80"]
+
+
+def bar(tick, elapsed, width):
+    # Bouncing bar of the fixed width
+    pos = abs(tick % 6 - 3)
+    return "[" + " " * pos + "=" + " " * (3 - pos) + "]"
+
+
+def test_frame_function():
+    sp = yaspin(Spinner(bar, 80))
+    assert sp._state.streamed
+    assert sp._state.frame_widths == {}
+
+    frames = [next(sp._state.cycle) for _ in range(4)]
+    assert frames == ["[   =]", "[  = ]", "[ =  ]", "[=   ]"]
+
+
+def test_frame_function_gets_terminal_width():
+    widths = []
+    sp = yaspin(Spinner(lambda tick, elapsed, width: widths.append(width) or "x", 80))
+    next(sp._state.cycle)
+    assert widths == [sp._terminal_width]
+
+
+def test_endless_generator_is_not_materialized():
+    stream = io.StringIO()
+    frames = (str(i % 10) for i in itertools.count())
+    with yaspin(Spinner(frames, 10), text="counting", stream=stream):
+        time.sleep(0.1)
+
+    out = stream.getvalue()
+    assert "0 counting" in out
+    assert "1 counting" in out
+
+
+def test_streamed_frames_are_not_reversed():
+    sp = yaspin(Spinner(bar, 80), reversal=True, pad_frames=True)
+    assert next(sp._state.cycle) == "[   =]"
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires pty")
+def test_streamed_frames_cache_is_bounded():
+    master, slave = os.openpty()
+    stream = open(slave, "w", encoding="utf-8")  # noqa: SIM115
+    sp = yaspin(Spinner(lambda tick, elapsed, width: str(tick), 80), stream=stream)
+    state = sp._state
+
+    for i in range(2 * FRAME_CACHE_WINDOW):
+        sp._render_frame(str(i), None, state)
+        os.read(master, 1024)
+    assert len(state.frame_cache) == FRAME_CACHE_WINDOW
+    # The most recent frames are kept
+    assert (str(2 * FRAME_CACHE_WINDOW - 2), str(2 * FRAME_CACHE_WINDOW - 1)) in state.frame_cache
+
+    stream.close()
+    os.close(master)
@@ -0,0 +1,97 @@
+"""
+tests.test_idle
+~~~~~~~~~~~~~~~
+
+Test the slowdown of idle spinners.
+"""
+
+import io
+import re
+import time
+
+import pytest
+
+from yaspin import Spinner, yaspin
+from yaspin.core import IDLE_DECAY
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"idle_after": -1},
+        {"idle_after": 1, "idle_fps": 0},
+        {"idle_after": 1, "idle_fps": -2},
+    ],
+)
+def test_invalid_idle_settings(kwargs):
+    with pytest.raises(ValueError):
+        yaspin(**kwargs)
+
+
+def test_slowdown_is_disabled_by_default():
+    sp = yaspin()
+    assert sp._activity is None
+    assert sp._slow_down(0.1, 0) == 0
+
+
+def test_interval_decays_to_floor():
+    sp = yaspin(idle_after=0, idle_fps=2)
+    intervals = [0.0]
+    for _ in range(10):
+        intervals.append(sp._slow_down(0.1, intervals[-1]))
+
+    assert intervals[1] == pytest.approx(0.1 * IDLE_DECAY)
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == pytest.approx(0.5)
+
+
+def test_activity_resets_slowdown():
+    sp = yaspin(idle_after=10)
+    sp._last_activity = time.monotonic() - 20
+    assert sp._slow_down(0.1, 0) > 0
+
+    sp.text = "changed"
+    assert sp._slow_down(0.1, 0) == 0
+
+
+def count_frames(stream, text):
+    return stream.getvalue().count(text)
+
+
+@pytest.mark.parametrize("activity", ["text", "write", "show"])
+def test_snaps_back_on_activity(activity):
+    stream = io.StringIO()
+    with yaspin(Spinner("ab", 20), text="x", stream=stream, idle_after=0.2, idle_fps=4) as sp:
+        # Slowed down to the floor of 4 frames per second
+        time.sleep(1.0)
+        idle_frames = count_frames(stream, " x")
+        time.sleep(0.2)
+        assert count_frames(stream, " x") - idle_frames <= 1
+
+        idle_frames = count_frames(stream, " x")
+        if activity == "text":
+            sp.text = "y"
+        elif activity == "write":
+            sp.write("message")
+        else:
+            sp.hide()
+            sp.show()
+        time.sleep(0.1)
+        # Back to the full frame rate without waiting for the idle frame
+        if activity == "text":
+            assert count_frames(stream, " y") >= 3
+        else:
+            assert count_frames(stream, " x") - idle_frames >= 3
+
+
+def test_idle_timer_is_accurate():
+    stream = io.StringIO()
+    with yaspin(Spinner("ab", 20), text="x", stream=stream, timer=True, idle_after=0, idle_fps=4):
+        time.sleep(1.6)
+
+    # At the floor, the frames are drawn as the displayed time changes
+    times = [float(t) for t in re.findall(r"\(0:00:(\d+\.\d+)\)", stream.getvalue())]
+    idle_times = [t for t in times if t > 1]
+    assert idle_times
+    for t in idle_times:
+        assert min(t % 0.25, 0.25 - t % 0.25) <= 0.02
@@ -6,6 +6,7 @@ Checks that all input data is converted to unicode.
 And all output data is converted to builtin str type.
 """
 
+import dataclasses
 import re
 import sys
 import time
@@ -19,12 +20,12 @@ def test_input_converted_to_unicode(text, frames, interval, reversal, side):
     sp = Spinner(frames, interval)
     sp = yaspin(sp, text, side=side, reversal=reversal)
 
-    assert not isinstance(sp._frames, bytes)
+    assert not isinstance(sp._state.frames, bytes)
 
-    if isinstance(sp._frames, list | tuple):
-        assert isinstance(sp._frames[0], str)
+    if isinstance(sp._state.frames, list | tuple):
+        assert isinstance(sp._state.frames[0], str)
 
-    assert isinstance(sp._text, str)
+    assert isinstance(sp._state.text, str)
 
 
 def test_out_converted_to_builtin_str(text, frames, interval, reversal, side):
@@ -32,7 +33,7 @@ def test_out_converted_to_builtin_str(text, frames, interval, reversal, side):
     sp = yaspin(sp, text, side=side, reversal=reversal)
 
     for _ in range(len(frames)):
-        frame = next(sp._cycle)
+        frame = next(sp._state.cycle)
         out = sp._compose_out(frame)
         assert isinstance(out, str)
 
@@ -108,8 +109,8 @@ def test_show_jupyter(monkeypatch, capsys):
 
     out, _ = capsys.readouterr()
     # check spinner line was correctly overridden with whitespaces
-    # r = \r, s = spinner char, w = space, 12345 = printed chars
-    assert "12345\r" + " " * len("rsw12345") + "\r123" in out
+    # s = spinner char, w = space, 12345 = printed chars
+    assert "12345\r" + " " * len("sw12345") + "\r123" in out
 
 
 def test_hide_show(monkeypatch, capsys, text, request, isatty_fixture):
@@ -173,7 +174,7 @@ def test_spinner_write_race_condition(capsys):
 
     sp = yaspin(text="aaaa")
     sp.start()
-    sp._interval = 0.0
+    sp._render_state = dataclasses.replace(sp._state, interval=0.0)
     start_time = time.time()
     while time.time() - start_time < 3.0:
         sp.write("bbbb")
@@ -197,7 +198,7 @@ def test_spinner_hiding_with_context_manager(monkeypatch, capsys, isatty_fixture
         sp.write(HIDDEN_START)
 
         # give the spinner some time to spin if it would not be hidden
-        time.sleep(3 * sp._interval)
+        time.sleep(3 * sp._state.interval)
 
         sp.write(HIDDEN_END)
 
@@ -224,7 +225,7 @@ def test_spinner_nested_hiding_with_context_manager(monkeypatch, capsys, isatty_
             assert sp._hidden_level == 2
             with sp.hidden():
                 assert sp._hidden_level == 3
-                time.sleep(3 * sp._interval)
+                time.sleep(3 * sp._state.interval)
 
         assert sp._hidden_level == 1
         assert sp._hide_spin.is_set()
@@ -277,3 +278,68 @@ def test_write_non_str_objects(monkeypatch, capsys, obj, obj_str, isatty_fixture
         assert out == f"\r\033[K{obj_str}\n"
     else:
         assert out == f"\r\r{obj_str}\n"
+
+
+def test_writelines(monkeypatch, capsys, isatty_fixture):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: isatty_fixture)
+    sp = yaspin()
+    capsys.readouterr()
+    sp.writelines(["foo", b"bar", 23])
+    out, _ = capsys.readouterr()
+    if isatty_fixture:
+        assert out == "\r\033[Kfoo\nbar\n23\n"
+    else:
+        assert out == "\r\rfoo\nbar\n23\n"
+
+
+def test_writelines_streams_generators(monkeypatch, capsys):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    lines = (f"line {i}" for i in range(3000))
+    sp = yaspin()
+    capsys.readouterr()
+    sp.writelines(lines)
+    out, _ = capsys.readouterr()
+    out = out.replace("\r\x1b[K", "")
+    assert out.split("\n")[:-1] == [f"line {i}" for i in range(3000)]
+
+
+def test_writelines_redraws_spinner(monkeypatch, capsys):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    sp = yaspin(text="spinning")
+    sp.start()
+    time.sleep(0.1)
+    capsys.readouterr()
+    sp.writelines(["foo", "bar"])
+    out, _ = capsys.readouterr()
+    sp.stop()
+    assert out.startswith("\r\033[Kfoo\nbar\n\r")
+    assert "spinning" in out
+
+
+def test_writelines_keeps_lines_taken_before_error(monkeypatch, capsys):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+
+    def lines():
+        yield from ("foo", "bar")
+        raise OSError("read failed")
+
+    sp = yaspin(text="spinning")
+    sp.start()
+    time.sleep(0.1)
+    capsys.readouterr()
+    with pytest.raises(OSError):
+        sp.writelines(lines())
+    out, _ = capsys.readouterr()
+    sp.stop()
+    assert out.startswith("\r\033[Kfoo\nbar\n\r")
+    assert "spinning" in out
+
+
+@pytest.mark.parametrize("data", [b"foo\nbar", b"foo\nbar\n", "Загрузка\n".encode()])
+def test_write_bytes(monkeypatch, capsys, data):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    sp = yaspin()
+    capsys.readouterr()
+    sp.write_bytes(data)
+    out, _ = capsys.readouterr()
+    assert out == "\r\033[K" + data.decode().rstrip("\n") + "\n"
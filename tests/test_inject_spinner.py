@@ -49,7 +49,7 @@ def test_spinner_customization(simple_spinner: Spinner) -> None:
         assert isinstance(spinner, Yaspin)
         assert spinner.color == "green"
         assert spinner.text == "Testing"
-        assert spinner.spinner.frames == ["A", "B", "C"]
+        assert spinner.spinner.frames == ("A", "B", "C")
         assert spinner.spinner.interval == 100
 
     with assert_no_yaspin_errors():
@@ -0,0 +1,177 @@
+"""
+tests.test_jobs
+~~~~~~~~~~~~~~~
+
+Test spinners of the processes put in the background by job control.
+"""
+
+import io
+import os
+import select
+import signal
+import time
+
+import pytest
+
+from yaspin import core, current, signals, Spinner, yaspin
+from yaspin.signals import dispatcher
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "openpty") or not hasattr(signal, "SIGTSTP"), reason="requires job control"
+)
+
+
+@pytest.fixture
+def tty():
+    master, slave = os.openpty()
+    stream = open(slave, "w", encoding="utf-8")  # noqa: SIM115
+    yield master, stream
+    stream.close()
+    os.close(master)
+
+
+@pytest.fixture
+def background(monkeypatch):
+    state = {"background": True}
+
+    def tcgetpgrp(fd):
+        return os.getpgrp() + 1 if state["background"] else os.getpgrp()
+
+    monkeypatch.setattr(core.os, "tcgetpgrp", tcgetpgrp)
+    return state
+
+
+def read_all(master):
+    # The running spinner keeps writing, so only the pending output is read
+    out = b""
+    while select.select([master], [], [], 0)[0]:
+        out += os.read(master, 4096)
+    return out.decode()
+
+
+def test_not_controlling_terminal_is_foreground(tty):
+    master, stream = tty
+    # The pty is not the controlling terminal of the test process
+    assert core._is_foreground(stream.fileno())
+
+
+def test_no_job_control_for_other_streams():
+    sp = yaspin(stream=io.StringIO())
+    assert sp._job_fd is None
+    assert sp._continued is None
+
+
+def test_background_spinner_writes_nothing(tty, background):
+    master, stream = tty
+    with yaspin(Spinner("ab", 20), text="job", stream=stream) as sp:
+        time.sleep(0.2)
+        read_all(master)
+        time.sleep(0.3)
+        assert "job" not in read_all(master)
+        assert sp._backgrounded
+
+        sp.text = "refreshed"
+        assert "refreshed" not in read_all(master)
+
+
+def test_resumes_on_sigcont(tty, background):
+    master, stream = tty
+    with yaspin(Spinner("ab", 20), text="job", stream=stream) as sp:
+        time.sleep(0.1)
+        read_all(master)
+
+        background["background"] = False
+        os.kill(os.getpid(), signal.SIGCONT)
+        # Well before the next periodic check
+        time.sleep(0.1)
+        out = read_all(master)
+        assert "\033[?25l" in out
+        assert "job" in out
+        assert not sp._backgrounded
+
+
+def test_stop_in_background_leaves_line(tty, background):
+    master, stream = tty
+    with yaspin(text="job", stream=stream):
+        time.sleep(0.1)
+        read_all(master)
+    # Only the cursor is shown again
+    assert read_all(master) == "\033[?25h"
+
+
+def routes(sig):
+    return dispatcher._routes.get(sig, [])
+
+
+def test_job_handlers_are_routed(tty):
+    master, stream = tty
+    with yaspin(stream=stream) as sp:
+        assert (sp, core._on_job_continue) in routes(signal.SIGCONT)
+        assert routes(signal.SIGTSTP) == []
+    assert all(owner is not sp for owner, _ in routes(signal.SIGCONT))
+
+
+def test_handled_signals_are_kept(tty):
+    master, stream = tty
+
+    def handler(signum, frame):
+        pass
+
+    with yaspin(stream=stream, sigmap={signal.SIGCONT: handler}) as sp:
+        assert [handler.func for owner, handler in routes(signal.SIGCONT) if owner is sp] == [handler]
+
+
+def test_stop_signal_keeps_default_action(tty):
+    master, stream = tty
+    assert signal.getsignal(signal.SIGTSTP) == signal.SIG_DFL
+    with yaspin(stream=stream), yaspin(stream=stream):
+        assert signal.getsignal(signal.SIGTSTP) == signal.SIG_DFL
+    assert not dispatcher.installed(signal.SIGTSTP)
+
+
+def test_default_job_handlers_are_restored(tty, monkeypatch):
+    master, stream = tty
+    # SIGCONT may be kept installed by the spinners handling it in sigmap
+    previous = signal.signal(signal.SIGCONT, signal.SIG_DFL)
+    monkeypatch.setattr(dispatcher, "_previous", {})
+    try:
+        with yaspin(stream=stream):
+            with yaspin(stream=stream):
+                assert signal.getsignal(signal.SIGCONT) == dispatcher._handle
+            # Still handled for the outer spinner
+            assert signal.getsignal(signal.SIGCONT) == dispatcher._handle
+        assert signal.getsignal(signal.SIGCONT) == signal.SIG_DFL
+        assert not dispatcher.installed(signal.SIGCONT)
+    finally:
+        signal.signal(signal.SIGCONT, previous)
+
+
+def test_installed_job_signals_are_kept(tty):
+    master, stream = tty
+    signals.install(signal.SIGCONT)
+    with yaspin(stream=stream):
+        pass
+    assert dispatcher.installed(signal.SIGCONT)
+    assert signal.getsignal(signal.SIGTSTP) == signal.SIG_DFL
+
+
+def test_spinner_of_closed_stream_is_cleaned_up(tty):
+    master, stream = tty
+    previous = signal.getsignal(signal.SIGCONT)
+
+    def handler(signum, frame, spinner):
+        pass
+
+    with yaspin(Spinner("ab", 10), stream=stream, sigmap={signal.SIGUSR1: handler}) as sp:
+        # Not while a frame is written, which would fail on the closed fd
+        with sp._stream_lock:
+            stream.close()
+        # The spin thread ends once the stream is closed
+        sp._spin_thread.join(timeout=1)
+        assert not sp._spin_thread.is_alive()
+
+    assert signal.getsignal(signal.SIGTSTP) == signal.SIG_DFL
+    assert signal.getsignal(signal.SIGCONT) == previous
+    assert all(owner is not sp for owner, _ in routes(signal.SIGUSR1))
+    assert current() is not sp
+    assert all(sp not in stack for stack in core._spinner_stacks.values())
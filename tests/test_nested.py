@@ -0,0 +1,100 @@
+"""
+tests.test_nested
+~~~~~~~~~~~~~~~~~
+
+Test nested spinners sharing the same stream.
+"""
+
+import io
+import time
+
+from yaspin import Spinner, yaspin
+from yaspin.core import _spinner_stacks
+
+
+def test_inner_spinner_takes_over_line():
+    stream = io.StringIO()
+    with yaspin(Spinner("ab", 20), text="outer", stream=stream) as outer:
+        time.sleep(0.1)
+        with yaspin(Spinner("cd", 20), text="inner", stream=stream) as inner:
+            assert _spinner_stacks[id(stream)] == [outer, inner]
+            assert not outer._resume_spin.is_set()
+
+            pos = len(stream.getvalue())
+            phase = outer._spin_frame
+            time.sleep(0.2)
+            # Outer spinner neither renders nor spins while suspended
+            assert "outer" not in stream.getvalue()[pos:]
+            assert outer._spin_frame == phase
+            assert "inner" in stream.getvalue()[pos:]
+
+        assert outer._resume_spin.is_set()
+        pos = len(stream.getvalue())
+        time.sleep(0.2)
+        assert "outer" in stream.getvalue()[pos:]
+
+    assert id(stream) not in _spinner_stacks
+
+
+def test_outer_write_goes_through_inner():
+    stream = io.StringIO()
+    with yaspin(text="outer", stream=stream) as outer, yaspin(text="inner", stream=stream):
+        outer.write("message")
+        outer.writelines(["line 1", "line 2"])
+        outer.write_bytes(b"bytes")
+
+    out = stream.getvalue()
+    assert out.index("message\n") < out.index("line 1\nline 2\n") < out.index("bytes\n")
+    # Outer spinner is not redrawn over the inner one
+    assert "outer" not in out[out.index("inner") :]
+
+
+def test_outer_stopped_first():
+    stream = io.StringIO()
+    outer = yaspin(text="outer", stream=stream)
+    inner = yaspin(text="inner", stream=stream)
+    outer.start()
+    inner.start()
+
+    outer.stop()
+    assert not outer._spin_thread.is_alive()
+    assert _spinner_stacks[id(stream)] == [inner]
+    # The line still belongs to the inner spinner
+    assert not stream.getvalue().endswith("\r")
+
+    inner.stop()
+    assert id(stream) not in _spinner_stacks
+
+
+def test_outer_finalizer_goes_through_inner():
+    stream = io.StringIO()
+    outer = yaspin(text="outer", stream=stream)
+    outer.start()
+    with yaspin(Spinner("cd", 20), text="inner", stream=stream):
+        time.sleep(0.1)
+        outer.ok("OK")
+        time.sleep(0.1)
+
+    out = stream.getvalue()
+    final = out.index("OK outer\n")
+    # The line of the inner spinner is cleared first, and drawn again
+    assert out[:final].endswith("\r")
+    assert "inner" in out[final:]
+
+
+def test_different_streams_do_not_interfere():
+    stream1, stream2 = io.StringIO(), io.StringIO()
+    with yaspin(stream=stream1) as sp1, yaspin(stream=stream2):
+        assert sp1._resume_spin.is_set()
+        assert _spinner_stacks[id(stream1)] == [sp1]
+
+
+def test_delayed_inner_spinner():
+    stream = io.StringIO()
+    with yaspin(text="outer", stream=stream) as outer:
+        with yaspin(text="fast", delay=0.5, stream=stream):
+            # Not shown yet, outer keeps spinning
+            assert outer._resume_spin.is_set()
+        assert outer._resume_spin.is_set()
+
+    assert "fast" not in stream.getvalue()
@@ -25,20 +25,20 @@ def test_spinner_getter(frames, interval):
 def test_spinner_setter(frames, interval):
     sp = yaspin()
     assert sp._spinner == default_spinner
-    assert isinstance(sp._frames, str)
-    assert sp._interval == sp._spinner.interval * 0.001
+    assert isinstance(sp._state.frames, str)
+    assert sp._state.interval == sp._spinner.interval * 0.001
     assert isinstance(repr(sp), str)
 
     new_spinner = Spinner(frames, interval)
     sp.spinner = new_spinner
     assert sp._spinner == sp._set_spinner(new_spinner)
 
-    assert not isinstance(sp._frames, bytes)
+    assert not isinstance(sp._state.frames, bytes)
 
-    if isinstance(sp._frames, list | tuple):
-        assert isinstance(sp._frames[0], str)
+    if isinstance(sp._state.frames, list | tuple):
+        assert isinstance(sp._state.frames[0], str)
 
-    assert sp._interval == sp._spinner.interval * 0.001
+    assert sp._state.interval == sp._spinner.interval * 0.001
     assert isinstance(repr(sp), str)
 
 
@@ -52,8 +52,8 @@ def test_text_getter(text):
 def test_text_setter(text):
     sp = yaspin()
     sp.text = text
-    assert isinstance(sp._text, str)
-    assert sp._text == to_unicode(text)
+    assert isinstance(sp._state.text, str)
+    assert sp._state.text == to_unicode(text)
 
 
 # Yaspin.side
@@ -69,14 +69,14 @@ def test_side_getter(side):
 )
 def test_side_setter(side, expected):
     sp = yaspin()
-    assert sp._side == "left"
+    assert sp._state.side == "left"
 
     if isinstance(expected, Exception):
         with pytest.raises(type(expected)):
             sp.side = side
     else:
         sp.side = side
-        assert sp._side == expected
+        assert sp._state.side == expected
 
 
 # Yaspin.reversal
@@ -89,10 +89,47 @@ def test_reversal_getter(reversal):
 def test_reversal_setter(reversal):
     sp = yaspin()
     sp.reversal = reversal
-    assert isinstance(sp._frames, str)
+    assert isinstance(sp._state.frames, str)
     assert sp._reversal == reversal
 
 
+# Yaspin.pad_frames
+#
+def test_pad_frames_getter():
+    sp = yaspin(pad_frames=True)
+    assert sp.pad_frames is True
+
+
+@pytest.mark.parametrize(
+    "frames, padded",
+    [
+        (("·", "··", "···"), ("·  ", "·· ", "···")),
+        (("🕐", "x"), ("🕐", "x ")),
+        # frames of equal width are kept as is
+        ("-\\|/", "-\\|/"),
+    ],
+)
+def test_pad_frames_setter(frames, padded):
+    sp = yaspin(Spinner(frames, 80))
+    assert sp._state.frames == frames
+
+    sp.pad_frames = True
+    assert sp._state.frames == padded
+    assert len(set(sp._state.frame_widths.values())) == 1
+
+    sp.reversal = True
+    assert sp._state.frames == padded[::-1]
+
+    sp.pad_frames = False
+    assert sp._state.frames == frames[::-1]
+
+
+def test_pad_frames_line_length():
+    sp = yaspin(Spinner(["·", "···"], 80), text="foo", pad_frames=True)
+    widths = {sp._compose_segments(frame)[3] for frame in sp._state.frames}
+    assert widths == {7}
+
+
 # Yaspin.color
 #
 def test_color_getter(supported_colors):
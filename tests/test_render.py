@@ -0,0 +1,148 @@
+"""
+tests.test_render
+~~~~~~~~~~~~~~~~~
+
+Test differential rendering of the spinner line.
+"""
+
+import io
+import os
+import select
+import time
+
+import pytest
+
+from yaspin import core, Spinner, yaspin
+from yaspin.core import FULL_REDRAW_INTERVAL
+from yaspin.render import diff_cells, render_cells, to_cells
+
+
+def render(sp, frame):
+    stream = sp._stream._stream
+    pos = stream.tell()
+    sp._render_frame(frame)
+    return stream.getvalue()[pos:]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", ()),
+        ("ab", (("", "a"), ("", "b"))),
+        ("\033[31ma\033[0mb", (("\033[31m", "a"), ("", "b"))),
+        ("\033[1m\033[31ma\033[m", (("\033[1m\033[31m", "a"),)),
+        ("日x", (("", "日"), ("", ""), ("", "x"))),
+        ("e\u0301", (("", "e\u0301"),)),
+        ("\u0301", None),
+        ("a\nb", None),
+        ("a\tb", None),
+        ("\033]8;;url\033\\a", None),
+    ],
+)
+def test_to_cells(text, expected):
+    assert to_cells(text) == expected
+
+
+@pytest.mark.parametrize("text", ["abc", "\033[31mab\033[0mc", "a\033[1m\033[34mbc\033[0m"])
+def test_render_cells_roundtrip(text):
+    assert render_cells(to_cells(text)) == text
+
+
+@pytest.mark.parametrize(
+    "old, new, expected",
+    [
+        ("abc", "abc", ""),
+        ("abc", "xbc", "\rx"),
+        ("abcdefghijkl", "abcdefghijkX", "\033[12GX"),
+        # close changes are merged into a single run
+        ("abcdef", "xbcdeX", "\rxbcdeX"),
+        ("abcdefghijkl", "xbcdefghijkX", "\rx\033[12GX"),
+        ("abc", "abcde", "\033[4Gde"),
+        ("abcde", "abc", "\033[4G\033[K"),
+        ("abc", "\033[31ma\033[0mbc", "\r\033[31ma\033[0m"),
+        # columns are counted in cells
+        ("日本x", "日本y", "\033[5Gy"),
+        ("日本", "日x", "\033[3Gx\033[K"),
+    ],
+)
+def test_diff_cells(old, new, expected):
+    assert diff_cells(to_cells(old), to_cells(new), limit=100) == expected
+
+
+def test_diff_cells_limit():
+    assert diff_cells(to_cells("abc"), to_cells("xyz"), limit=3) is None
+
+
+def test_frame_only_changed(tty_stream):
+    sp = yaspin(Spinner("ab", 80), text="foo", stream=tty_stream)
+
+    assert render(sp, "a") == "\r\033[K\ra foo"
+    assert render(sp, "b") == "\rb"
+    assert render(sp, "b") == ""
+
+    # the whole line differs, but is not longer than the clear sequence
+    sp.side = "right"
+    assert render(sp, "a") == "\rfoo a"
+    assert render(sp, "b") == "\033[5Gb"
+
+
+def test_text_and_timer_changes(tty_stream):
+    sp = yaspin(Spinner("ab", 80), text="foo", stream=tty_stream)
+    render(sp, "a")
+
+    sp.text = "fox"
+    assert render(sp, "a") == "\033[5Gx"
+    sp.text = "fo"
+    assert render(sp, "a") == "\033[5G\033[K"
+
+    sp._timer = sp._set_timer(True)
+    sp._start_time = sp._stop_time = 0
+    assert render(sp, "a") == "\033[5G (0:00:00.00)"
+
+
+def test_full_rewrite_after_clear(tty_stream):
+    sp = yaspin(Spinner("ab", 80), text="foo", stream=tty_stream)
+    render(sp, "a")
+    sp.write("msg")
+    assert render(sp, "b") == "\r\033[K\rb foo"
+
+
+def test_periodic_full_rewrite(monkeypatch, tty_stream):
+    sp = yaspin(Spinner("ab", 80), text="foo", stream=tty_stream)
+    render(sp, "a")
+    assert render(sp, "b") == "\rb"
+
+    monkeypatch.setattr(core.time, "monotonic", lambda: sp._full_redraw_at)
+    assert render(sp, "a") == "\r\033[K\ra foo"
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires pty")
+def test_line_restored_after_external_output():
+    master, slave = os.openpty()
+    with open(slave, "w", encoding="utf-8") as stream:
+        with yaspin(Spinner("ab", 20), text="foo", stream=stream):
+            time.sleep(0.1)
+            # Written past the spinner, e.g. by logging to stderr
+            stream.write("\nexternal log line\n")
+            stream.flush()
+            time.sleep(FULL_REDRAW_INTERVAL + 0.2)
+        out = b""
+        while select.select([master], [], [], 0)[0]:
+            out += os.read(master, 4096)
+    os.close(master)
+
+    after = out.decode().split("external log line", 1)[1]
+    assert "foo" in after
+
+
+def test_full_rewrite_for_control_sequences(tty_stream):
+    sp = yaspin(Spinner("ab", 80), text="foo\tbar", stream=tty_stream)
+    assert render(sp, "a") == "\r\033[K\ra foo\tbar"
+    assert render(sp, "b") == "\r\033[K\rb foo\tbar"
+
+
+def test_full_rewrite_for_non_tty():
+    stream = io.StringIO()
+    sp = yaspin(Spinner("ab", 80), text="foo", stream=stream)
+    render(sp, "a")
+    assert render(sp, "b") == "\r     \r\rb foo"
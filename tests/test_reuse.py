@@ -0,0 +1,93 @@
+"""
+tests.test_reuse
+~~~~~~~~~~~~~~~~
+
+Test spin thread reuse across start/stop cycles.
+"""
+
+import io
+import time
+
+import pytest
+
+from yaspin import yaspin
+
+
+def test_thread_reused():
+    stream = io.StringIO()
+    sp = yaspin(text="reuse", stream=stream, reuse_thread=True)
+
+    sp.start()
+    thread, stop_spin = sp._spin_thread, sp._stop_spin
+    time.sleep(0.1)
+    sp.stop()
+
+    # Thread is parked between the runs
+    assert thread.is_alive()
+    assert not sp._is_spinning()
+
+    sp.start()
+    assert sp._spin_thread is thread
+    assert sp._stop_spin is stop_spin
+    assert sp._is_spinning()
+    sp.stop()
+
+    sp.close()
+    assert not thread.is_alive()
+    assert "reuse" in stream.getvalue()
+
+
+def test_reused_spinner_output():
+    stream = io.StringIO()
+    sp = yaspin(text="run", stream=stream, reuse_thread=True)
+    for i in range(3):
+        with sp:
+            sp.text = f"run {i}"
+            time.sleep(0.1)
+            sp.write(f"done {i}")
+    sp.close()
+
+    out = stream.getvalue()
+    for i in range(3):
+        assert f"run {i}" in out
+        assert f"done {i}\n" in out
+
+
+def test_hide_parked_spinner():
+    sp = yaspin(stream=io.StringIO(), reuse_thread=True)
+    with sp:
+        pass
+    # Hiding a stopped spinner does nothing
+    sp.hide()
+    assert not sp._hide_spin.is_set()
+    sp.close()
+
+
+def test_close():
+    sp = yaspin(stream=io.StringIO(), reuse_thread=True)
+    sp.start()
+    thread = sp._spin_thread
+
+    sp.close()
+    assert not thread.is_alive()
+    with pytest.raises(RuntimeError):
+        sp.start()
+
+
+def test_close_without_reuse():
+    sp = yaspin(stream=io.StringIO())
+    sp.start()
+    sp.close()
+    assert not sp._spin_thread.is_alive()
+
+    # Closing a stopped spinner is a no-op
+    sp.close()
+
+
+def test_start_stop_cycles():
+    sp = yaspin(stream=io.StringIO(), reuse_thread=True)
+    for _ in range(200):
+        sp.start()
+        sp.stop()
+    assert not sp._is_spinning()
+    sp.close()
@@ -6,11 +6,27 @@ Test Yaspin signals handling.
 """
 
 import functools
+import io
+import os
 import signal
+import subprocess
+import sys
+import threading
+import time
+import warnings
 
 import pytest
 
-from yaspin import kbi_safe_yaspin, yaspin
+from yaspin import kbi_safe_yaspin, signals, yaspin
+from yaspin.signals import dispatcher
+
+
+def routed_handler(sp, sig):
+    """Return the handler the signal is routed to for the spinner, if any."""
+    for owner, handler in dispatcher._routes.get(sig, ()):
+        if owner is sp:
+            return handler
+    return None
 
 
 def test_sigmap_setting(sigmap_test_cases):
@@ -34,7 +50,9 @@ def test_sigmap_signals_get_registered(sigmap_test_cases):
     try:
         sp.start()
         for sig, sig_handler in sigmap.items():
-            handler = signal.getsignal(sig)
+            # Signals are routed by the dispatcher, installed once
+            assert signal.getsignal(sig) == dispatcher._handle
+            handler = routed_handler(sp, sig)
             is_partial = isinstance(handler, functools.partial)
 
             if callable(sig_handler) and is_partial:
@@ -57,7 +75,7 @@ def test_raise_exception_for_sigkill():
         sp.stop()
 
 
-def test_default_handlers_are_set_at_cleanup_stage(sigmap_test_cases):
+def test_handlers_are_removed_at_cleanup_stage(sigmap_test_cases):
     sigmap = sigmap_test_cases
     if not sigmap:
         pytest.skip(f"{sigmap!r} - unsupported case")
@@ -67,8 +85,7 @@ def test_default_handlers_are_set_at_cleanup_stage(sigmap_test_cases):
     sp.stop()
 
     for sig in sigmap:
-        handler = signal.getsignal(sig)
-        assert handler == sp._dfl_sigmap[sig]
+        assert routed_handler(sp, sig) is None
 
 
 def test_kbi_safe_yaspin():
@@ -77,9 +94,142 @@ def test_kbi_safe_yaspin():
     try:
         sp.start()
 
-        handler = signal.getsignal(signal.SIGINT)
+        handler = routed_handler(sp, signal.SIGINT)
         # Handler function is wrapped into ``partial`` and
         # is accessible via ``func`` attribute.
         assert handler.func == sp._sigmap[signal.SIGINT]
     finally:
         sp.stop()
+
+
+def test_previous_handler_is_called_without_spinners():
+    calls = []
+    previous = signal.signal(signal.SIGUSR1, lambda signum, frame: calls.append("previous"))
+    try:
+        handler = functools.partial(lambda signum, frame, spinner: calls.append("spinner"))
+        with yaspin(sigmap={signal.SIGUSR1: handler}):
+            os.kill(os.getpid(), signal.SIGUSR1)
+            time.sleep(0.1)
+        assert calls == ["spinner"]
+
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(0.1)
+        assert calls == ["spinner", "previous"]
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+
+def test_handlers_run_off_main_thread():
+    threads = []
+
+    def handler(signum, frame, spinner):
+        threads.append(threading.current_thread())
+
+    with yaspin(sigmap={signal.SIGUSR1: handler}):
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(0.1)
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+
+
+def test_handler_error_is_raised_in_main_thread():
+    def handler(signum, frame, spinner):
+        spinner.stop()
+        sys.exit(3)
+
+    sp = yaspin(sigmap={signal.SIGUSR1: handler})
+    with pytest.raises(SystemExit) as exc_info:
+        sp.start()
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(1)
+    assert exc_info.value.code == 3
+    assert not sp._is_active()
+
+
+def test_handler_error_interrupts_blocking_call():
+    script = (
+        "import sys, time\n"
+        "from yaspin import kbi_safe_yaspin\n"
+        "with kbi_safe_yaspin(stream=sys.stderr):\n"
+        "    print('ready', flush=True)\n"
+        "    time.sleep(6)\n"
+    )
+    proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        assert proc.stdout.readline() == b"ready\n"
+        start = time.monotonic()
+        proc.send_signal(signal.SIGINT)
+        assert proc.wait(timeout=10) == 0
+        # Rather than once the sleep is over
+        assert time.monotonic() - start < 3
+    finally:
+        proc.kill()
+        proc.stdout.close()
+
+
+def test_handler_does_not_block_interrupted_main_thread():
+    # The signal arrives while the main thread holds the stream lock,
+    # e.g. writing a message; finalization waits for the lock elsewhere
+    stream = io.StringIO()
+    sp = yaspin(stream=stream, sigmap={signal.SIGUSR1: lambda signum, frame, spinner: spinner.fail("✘")})
+    sp.start()
+    with sp._stream_lock:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(0.1)
+        assert "✘" not in stream.getvalue()
+    time.sleep(0.1)
+    assert "✘" in stream.getvalue()
+    assert not sp._is_active()
+
+
+def test_spinner_started_from_worker_thread():
+    calls = []
+    signals.install(signal.SIGUSR2)
+
+    def run():
+        with yaspin(sigmap={signal.SIGUSR2: lambda signum, frame, spinner: calls.append(spinner)}) as sp:
+            os.kill(os.getpid(), signal.SIGUSR2)
+            time.sleep(0.1)
+        calls.append(sp)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert len(calls) == 2
+    assert calls[0] is calls[1]
+
+
+def test_worker_thread_warns_about_uninstalled_signals():
+    errors = []
+
+    def run():
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                with yaspin(sigmap={signal.SIGWINCH: signal.SIG_IGN}):
+                    pass
+            except ValueError as exc:
+                errors.append(exc)
+        errors.extend(w.message for w in caught)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
+    assert isinstance(errors[0], RuntimeWarning)
+    assert "SIGWINCH" in str(errors[0])
+
+
+def test_install_from_worker_thread():
+    errors = []
+
+    def run():
+        try:
+            signals.install(signal.SIGWINCH)
+        except ValueError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
@@ -5,16 +5,21 @@ tests.test_spinners
 Tests for spinners collection.
 """
 
-from collections import OrderedDict
+from collections import namedtuple, OrderedDict
 
+import dataclasses
+import gc
 import json
+import weakref
 
 import pytest
 
+from yaspin import core, Spinner, yaspin
 from yaspin.spinners import Spinners, SPINNERS_DATA
 
 spinners_dict = OrderedDict(json.loads(SPINNERS_DATA))
-test_cases = [(name, v["frames"], v["interval"]) for name, v in spinners_dict.items()]
+# Frames of the catalogue spinners are immutable
+test_cases = [(name, tuple(v["frames"]), v["interval"]) for name, v in spinners_dict.items()]
 
 
 def test_len():
@@ -22,8 +27,75 @@ def test_len():
 
 
 # Entry example:
-# ('balloon', [' ', '.', 'o', 'O', '@', '*', ' '], 140)
+# ('balloon', (' ', '.', 'o', 'O', '@', '*', ' '), 140)
 @pytest.mark.parametrize("name, frames, interval", test_cases)
 def test_spinners(name, frames, interval):
     assert getattr(Spinners, name).frames == frames
     assert getattr(Spinners, name).interval == interval
+
+
+@pytest.mark.parametrize("name, frames, interval", test_cases[:3])
+def test_spinners_unpack_as_tuples(name, frames, interval):
+    spinner = getattr(Spinners, name)
+    assert tuple(spinner) == (frames, interval)
+    assert spinner[0] == frames
+    assert spinner[-1] == interval
+    assert len(spinner) == 2
+
+
+def test_spinner_is_immutable():
+    sp = Spinner(["a", "b"], 80)
+    assert sp.frames == ("a", "b")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sp.interval = 100  # type: ignore[misc]
+
+
+def test_equal_spinners_share_frames():
+    first = yaspin(Spinner(["a", "b"], 80))
+    second = yaspin(Spinner(("a", "b"), 80))
+    assert first.spinner == second.spinner
+    # Frames and their widths are measured once
+    assert first._state.frames is second._state.frames
+    assert first._state.frame_widths is second._state.frame_widths
+
+    # Cycles are not shared
+    assert first._state.cycle is not second._state.cycle
+
+    # Catalogue spinners are interned
+    assert yaspin(Spinner(Spinners.arc.frames, Spinners.arc.interval)).spinner is Spinners.arc
+
+
+def test_application_spinners_are_not_interned():
+    interned = len(core._interned_spinners)
+    for n in range(100):
+        yaspin(Spinner(["a", "b"], [n + 1, 1]))
+    assert len(core._interned_spinners) == interned
+
+
+def test_any_spinner_object_is_converted():
+    legacy = namedtuple("Spinner", "frames interval")(["a", "b"], 80)
+    sp = yaspin(legacy)
+    assert type(sp.spinner) is Spinner
+    assert sp.spinner == Spinner(["a", "b"], 80)
+    assert sp._state.frames is yaspin(Spinner(["a", "b"], 80))._state.frames
+
+    legacy = namedtuple("Spinner", "frames interval")(Spinners.arc.frames, Spinners.arc.interval)
+    assert yaspin(legacy).spinner is Spinners.arc
+
+
+def frame_function():
+    return lambda tick, elapsed, width: "ab"[tick % 2]
+
+
+def frame_generator():
+    return (frame for frame in "ab")
+
+
+@pytest.mark.parametrize("make_frames", [frame_function, frame_generator])
+def test_streamed_spinners_are_collected(make_frames):
+    sp = yaspin(Spinner(make_frames(), 80))
+    ref = weakref.ref(sp.spinner.frames)
+    sp.update(text="new")
+    del sp
+    gc.collect()
+    assert ref() is None
@@ -6,6 +6,7 @@ Tests for the stream parameter functionality in yaspin.
 """
 
 import io
+import os
 import sys
 import threading
 import time
@@ -13,7 +14,7 @@ import warnings
 
 import pytest
 
-from yaspin import yaspin
+from yaspin import Spinner, yaspin
 
 
 def test_stream_parameter_default():
@@ -255,3 +256,138 @@ def test_warn_on_closed_stream_enabled():
         # Second write should not emit another warning (rate limiting)
         sp.write("second message")
         assert len(w) == 1  # Still just one warning
+
+
+def read_all(fd):
+    chunks = []
+    while True:
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks).decode()
+
+
+def test_stream_without_fd_uses_text_path():
+    sp = yaspin(stream=io.StringIO())
+    assert sp._stream.fd is None
+
+
+def test_stream_fd_frames_written_directly():
+    r, w = os.pipe()
+    stream = open(w, "w", encoding="utf-8")  # noqa: SIM115
+    sp = yaspin(stream=stream, text="Piped")
+    assert sp._stream.fd == w
+
+    with sp:
+        sp.write("message")
+        time.sleep(0.2)
+    stream.close()
+
+    out = read_all(r)
+    os.close(r)
+    assert "Piped" in out
+    assert "message\n" in out
+    # frames of non-TTY streams are not cached
+    assert not sp._state.frame_cache
+
+
+class UpperWrapper:
+    """Wrapper converting its writes, which delegates ``fileno()`` to the file."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        return self.stream.write(text.upper())
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def test_wrapper_delegating_fd_is_written_through():
+    r, w = os.pipe()
+    stream = open(w, "w", encoding="utf-8")  # noqa: SIM115
+    sp = yaspin(Spinner("ab", 20), text="wrapped", stream=UpperWrapper(stream))
+    assert sp._stream.fd == w
+    assert not sp._stream.direct
+
+    with sp:
+        sp.write("message")
+        time.sleep(0.1)
+    stream.close()
+
+    out = read_all(r)
+    os.close(r)
+    assert "WRAPPED" in out
+    assert "MESSAGE\n" in out
+    assert "wrapped" not in out
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires pty")
+def test_stream_fd_frames_cached_for_tty():
+    master, slave = os.openpty()
+    stream = open(slave, "w", encoding="utf-8")  # noqa: SIM115
+    sp = yaspin(Spinner("ab", 20), text="Terminal", stream=stream)
+
+    with sp:
+        time.sleep(0.2)
+        # (previous frame, frame) pairs
+        assert set(sp._state.frame_cache) == {(None, "a"), ("a", "b"), ("b", "a")}
+        data, _ = sp._state.frame_cache[(None, "a")]
+        assert data == b"\r\033[K\ra Terminal"
+        data, _ = sp._state.frame_cache[("a", "b")]
+        assert data == b"\rb"
+
+        sp.text = "Changed"
+        assert not sp._state.frame_cache
+        time.sleep(0.1)
+    stream.close()
+    os.close(master)
+
+
+def test_spin_thread_ends_on_closed_stream():
+    stream = io.StringIO()
+    sp = yaspin(Spinner("ab", 10), stream=stream)
+    sp.start()
+    time.sleep(0.05)
+    assert not sp.stream_closed
+
+    stream.close()
+    sp._spin_thread.join(timeout=1)
+    assert not sp._spin_thread.is_alive()
+    assert sp.stream_closed
+    sp.stop()
+
+
+def test_spin_thread_ends_on_broken_pipe():
+    r, w = os.pipe()
+    stream = open(w, "w", encoding="utf-8")  # noqa: SIM115
+    sp = yaspin(Spinner("ab", 10), text="Piped", stream=stream)
+    sp.start()
+    # The reader is gone, e.g. ``| head`` exited
+    os.close(r)
+    sp._spin_thread.join(timeout=1)
+
+    assert not sp._spin_thread.is_alive()
+    assert sp._stream.broken
+    assert sp.stream_closed
+    # Writes are dropped rather than raising
+    sp.write("dropped")
+    sp.stop()
+    stream.close()
+
+
+def test_reused_thread_is_parked_on_broken_pipe():
+    r, w = os.pipe()
+    stream = open(w, "w", encoding="utf-8")  # noqa: SIM115
+    sp = yaspin(Spinner("ab", 10), stream=stream, reuse_thread=True)
+    sp.start()
+    os.close(r)
+
+    assert sp._parked_spin.wait(timeout=1)
+    assert sp._spin_thread.is_alive()
+    sp.stop()
+    sp.close()
+    assert not sp._spin_thread.is_alive()
+    stream.close()
@@ -0,0 +1,239 @@
+"""
+tests.test_styles
+~~~~~~~~~~~~~~~~~
+
+Test ANSI styles compilation.
+"""
+
+import io
+import sys
+import warnings
+
+import pytest
+
+from yaspin import Spinner, yaspin
+from yaspin.styles import (
+    ColorDepth,
+    detect_color_depth,
+    gradient,
+    palette_to_rgb,
+    parse_color,
+    pulse,
+    rainbow,
+    rgb_to_16,
+    rgb_to_256,
+    Style,
+)
+
+
+@pytest.fixture
+def color_env(monkeypatch):
+    for var in ("ANSI_COLORS_DISABLED", "NO_COLOR", "FORCE_COLOR", "COLORTERM"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("TERM", "xterm")
+    return monkeypatch
+
+
+@pytest.mark.parametrize(
+    "env, isatty, expected",
+    [
+        ({}, True, ColorDepth.ANSI16),
+        ({}, False, ColorDepth.NONE),
+        ({"TERM": "xterm-256color"}, True, ColorDepth.ANSI256),
+        ({"COLORTERM": "truecolor"}, True, ColorDepth.TRUECOLOR),
+        ({"TERM": "dumb"}, True, ColorDepth.NONE),
+        ({"NO_COLOR": "1"}, True, ColorDepth.NONE),
+        ({"ANSI_COLORS_DISABLED": "1"}, True, ColorDepth.NONE),
+        ({"FORCE_COLOR": "1"}, False, ColorDepth.ANSI16),
+    ],
+)
+def test_detect_color_depth(color_env, env, isatty, expected):
+    for var, value in env.items():
+        color_env.setenv(var, value)
+    stream = io.StringIO()
+    stream.isatty = lambda: isatty
+    assert detect_color_depth(stream) == expected
+
+
+@pytest.mark.parametrize(
+    "value, highlight, expected",
+    [
+        ("red", False, "red"),
+        ("on_red", True, "on_red"),
+        (0, False, 0),
+        (255, True, 255),
+        ((1, 2, 3), False, (1, 2, 3)),
+        ("#ff8000", False, (255, 128, 0)),
+        ("on_red", False, ValueError()),
+        ("red", True, ValueError()),
+        (256, False, ValueError()),
+        (-1, False, ValueError()),
+        (True, False, ValueError()),
+        ((1, 2), False, ValueError()),
+        ((1, 2, 300), False, ValueError()),
+        ("#ff80zz", False, ValueError()),
+    ],
+)
+def test_parse_color(value, highlight, expected):
+    if isinstance(expected, Exception):
+        with pytest.raises(ValueError):
+            parse_color(value, highlight)
+    else:
+        assert parse_color(value, highlight) == expected
+
+
+@pytest.mark.parametrize(
+    "style, depth, prefix",
+    [
+        (Style("red"), ColorDepth.ANSI16, "\033[31m"),
+        (Style("red", "on_white", frozenset({"bold"})), ColorDepth.ANSI16, "\033[31;107;1m"),
+        (Style(208), ColorDepth.ANSI256, "\033[38;5;208m"),
+        (Style(on_color=208), ColorDepth.ANSI256, "\033[48;5;208m"),
+        (Style((255, 128, 0)), ColorDepth.TRUECOLOR, "\033[38;2;255;128;0m"),
+        # Downgrades
+        (Style((255, 135, 0)), ColorDepth.ANSI256, "\033[38;5;208m"),
+        (Style((255, 0, 0)), ColorDepth.ANSI16, "\033[91m"),
+        (Style(196), ColorDepth.ANSI16, "\033[91m"),
+        (Style(on_color=1), ColorDepth.ANSI16, "\033[41m"),
+    ],
+)
+def test_style_codes(style, depth, prefix):
+    assert style.codes(depth) == (prefix, "\033[0m")
+    assert style.apply("x", depth) == f"{prefix}x\033[0m"
+
+
+def test_style_codes_empty():
+    assert not Style()
+    assert Style().codes(ColorDepth.TRUECOLOR) == ("", "")
+    assert Style("red").codes(ColorDepth.NONE) == ("", "")
+
+
+def test_style_codes_shared():
+    assert Style("red").codes(ColorDepth.ANSI16) is Style("red").codes(ColorDepth.ANSI16)
+
+
+@pytest.mark.parametrize("index", [0, 7, 15, 16, 100, 231, 232, 255])
+def test_palette_roundtrip(index):
+    r, g, b = palette_to_rgb(index)
+    if index >= 16:
+        assert rgb_to_256(r, g, b) == index
+    else:
+        assert rgb_to_16(r, g, b) == index
+
+
+def test_spinner_uses_compiled_style(color_env):
+    color_env.setenv("TERM", "xterm-256color")
+    sp = yaspin(color=208, on_color="#000000", attrs=["bold"])
+    assert sp._state.style_codes == ("\033[38;5;208;48;5;16;1m", "\033[0m")
+
+    out = sp._compose_out("/")
+    assert out.startswith("\r\033[38;5;208;48;5;16;1m/\033[0m ")
+
+
+def test_spinner_style_reuse():
+    style = yaspin().red.on_blue.bold.style
+    sp = yaspin(attrs=["underline"])
+    sp.style = style
+    assert sp.style == style
+    assert sp._attrs == {"bold"}
+
+
+def test_spinner_no_style_no_codes():
+    sp = yaspin()
+    assert sp._state.style_codes is None
+    assert sp._compose_out("/") == "\r/ "
+
+
+def test_color_warning_emitted_once(monkeypatch):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        sp = yaspin(color="red", attrs=["bold"])
+        sp.on_color = "on_blue"
+        sp.color = "green"
+    assert len(w) == 1
+    assert sp._state.style_codes is None
+
+
+# Animated colors
+#
+def test_gradient_helpers():
+    assert gradient("#000000", "#ffffff", 3) == [(0, 0, 0), (127, 127, 127), (255, 255, 255)]
+    assert gradient("red", "blue", 1) == [(205, 0, 0)]
+    assert pulse(0, 15, 3) == [(0, 0, 0), (127, 127, 127), (255, 255, 255), (127, 127, 127)]
+    assert len(rainbow(12)) == 12
+    assert rainbow(3)[0] == (255, 0, 0)
+
+
+def test_palette_table(color_env):
+    sp = yaspin(Spinner("ab", 80), palette=["red", "green", "blue"])
+    assert sp.palette == ("red", "green", "blue")
+
+    # lcm(2, 3) precomputed frames, then the table repeats
+    painted = [next(sp._state.painted_cycle) for _ in range(12)]
+    assert painted[:6] == [
+        ("a", "\033[31ma\033[0m"),
+        ("b", "\033[32mb\033[0m"),
+        ("a", "\033[34ma\033[0m"),
+        ("b", "\033[31mb\033[0m"),
+        ("a", "\033[32ma\033[0m"),
+        ("b", "\033[34mb\033[0m"),
+    ]
+    assert painted[6:] == painted[:6]
+
+    frame, styled = painted[0]
+    assert sp._compose_out(frame, painted=styled) == "\r\033[31ma\033[0m "
+
+
+def test_palette_keeps_highlight_and_attrs(color_env):
+    sp = yaspin(Spinner("a", 80), palette=[1], on_color="on_white", attrs=["bold"])
+    assert next(sp._state.painted_cycle) == ("a", "\033[31;107;1ma\033[0m")
+
+
+def test_palette_streamed_frames(color_env):
+    sp = yaspin(Spinner(iter("abc"), 80), palette=["red", "green"])
+    painted = [next(sp._state.painted_cycle) for _ in range(4)]
+    assert painted == [
+        ("a", "\033[31ma\033[0m"),
+        ("b", "\033[32mb\033[0m"),
+        ("c", "\033[31mc\033[0m"),
+        ("c", "\033[32mc\033[0m"),
+    ]
+
+
+def test_palette_rebuilt_on_change(color_env):
+    sp = yaspin(Spinner("ab", 80), palette=["red"])
+    sp.spinner = Spinner("xyz", 80)
+    assert [next(sp._state.painted_cycle)[0] for _ in range(3)] == ["x", "y", "z"]
+
+    sp.palette = None
+    assert sp._state.painted_cycle is None
+
+
+def test_palette_disabled_without_colors(monkeypatch):
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    with pytest.warns(UserWarning):
+        sp = yaspin(palette=rainbow(6), text_palette=rainbow(6))
+    assert sp._state.painted_cycle is None
+    assert sp._state.text_codes is None
+
+
+@pytest.mark.parametrize("palette", [["red", "foo"], [(1, 2)], ["on_red"]])
+def test_palette_unsupported_value(palette):
+    with pytest.raises(ValueError):
+        yaspin(palette=palette)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("abcd", "\033[31mab\033[0m\033[34mcd\033[0m"),
+        ("abc", "\033[31mab\033[0m\033[34mc\033[0m"),
+        ("a", "\033[31ma\033[0m"),
+    ],
+)
+def test_text_palette(color_env, text, expected):
+    sp = yaspin(text=text, text_palette=["red", "blue"])
+    assert sp._compose_out("/") == f"\r/ {expected}"
+    # Painted text is cached
+    assert sp._painted_text == (text, sp._state.text_codes, expected)
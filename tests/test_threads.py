@@ -0,0 +1,103 @@
+"""
+tests.test_threads
+~~~~~~~~~~~~~~~~~~
+
+Stress test a running spinner shared by many threads, which run in
+parallel on free-threaded builds.
+"""
+
+import io
+import re
+import sys
+import threading
+import time
+
+import pytest
+
+from yaspin import Spinner, yaspin
+
+THREADS = 8
+OPS = 400
+
+SPINNERS = [Spinner("ab", 1), Spinner(["-", "\\", "|", "/"], 1)]
+
+# The GIL may be enabled on free-threaded builds, e.g. by an extension
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def hammer(sp, n, ops):
+    """Run the operations of the n-th thread on the spinner."""
+    for i in range(ops):
+        op = i % 5
+        if op == 0:
+            sp.text = f"text-{n}-{i}"
+        elif op == 1:
+            sp.update(spinner=SPINNERS[i % 2], reversal=bool(i % 3))
+        elif op == 2:
+            sp.write(f"msg-{n}-{i}")
+        elif op == 3:
+            with sp.hidden():
+                sp.side = "right" if i % 2 else "left"
+        else:
+            sp.hide()
+            sp.show()
+
+
+def run_threads(sp, threads, ops):
+    """Hammer the spinner from the threads, return the errors and the elapsed time."""
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def worker(n):
+        barrier.wait()
+        try:
+            hammer(sp, n, ops)
+        except Exception as exc:
+            errors.append(exc)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return errors, time.perf_counter() - start
+
+
+def test_output_integrity():
+    stream = io.StringIO()
+    with yaspin(SPINNERS[0], text="start", stream=stream) as sp:
+        errors, _ = run_threads(sp, THREADS, OPS)
+    assert not errors
+
+    lines = stream.getvalue().split("\n")
+    # Each message ends a line of its own, spinner frames are not mixed in
+    messages = [line.rsplit("\r", 1)[-1] for line in lines[:-1]]
+    assert all(re.fullmatch(r"msg-\d+-\d+", message) for message in messages)
+
+    expected = {f"msg-{n}-{i}" for n in range(THREADS) for i in range(2, OPS, 5)}
+    assert len(messages) == len(expected)
+    assert set(messages) == expected
+
+    # The spinner is stopped visible and the line state is consistent
+    assert not sp._is_active()
+    assert sp._hidden_level == 0
+
+
+def test_hidden_level_is_balanced():
+    with yaspin(stream=io.StringIO()) as sp:
+        errors, _ = run_threads(sp, THREADS, OPS)
+        assert not errors
+        assert sp._hidden_level == 0
+        assert not sp._hide_spin.is_set()
+
+
+@pytest.mark.skipif(GIL_ENABLED, reason="requires free-threaded build")
+def test_throughput_scales():
+    # No global lock is taken for the text and style setters, so running
+    # them in parallel must not be slower than running them in turn
+    with yaspin(stream=io.StringIO()) as sp:
+        _, single = run_threads(sp, 1, OPS * THREADS)
+        errors, parallel = run_threads(sp, THREADS, OPS)
+    assert not errors
+    assert parallel < single * 1.5
@@ -0,0 +1,79 @@
+"""
+tests.test_timeline
+~~~~~~~~~~~~~~~~~~~
+
+Test spinners with per-frame durations.
+"""
+
+import io
+import itertools
+import time
+
+import pytest
+
+from yaspin import Spinner, yaspin
+
+
+def test_timeline_is_immutable():
+    sp = Spinner("ab", [300, 100])
+    assert sp.interval == (300, 100)
+
+
+@pytest.mark.parametrize(
+    "frames, interval",
+    [
+        ("ab", [100]),
+        (["a", "b"], [100, 100, 100]),
+        ("ab", [100, 0]),
+        ("ab", [100, -1]),
+    ],
+)
+def test_invalid_timeline(frames, interval):
+    with pytest.raises(ValueError):
+        Spinner(frames, interval)
+
+
+def test_timeline_state():
+    sp = yaspin(Spinner("abc", [500, 80, 120]))
+    assert sp._state.interval == pytest.approx(0.08)
+    assert list(itertools.islice(sp._state.timeline, 4)) == pytest.approx([0.5, 0.08, 0.12, 0.5])
+
+    sp.reversal = True
+    assert next(sp._state.cycle) == "c"
+    assert list(itertools.islice(sp._state.timeline, 3)) == pytest.approx([0.12, 0.08, 0.5])
+
+
+def test_no_timeline_for_single_interval():
+    sp = yaspin(Spinner("ab", 80))
+    assert sp._state.timeline is None
+
+
+def test_timeline_of_streamed_frames_repeats():
+    sp = yaspin(Spinner(lambda tick, elapsed, width: str(tick), [100, 200]))
+    assert list(itertools.islice(sp._state.timeline, 3)) == pytest.approx([0.1, 0.2, 0.1])
+
+
+def test_timeline_starts_over_with_styles():
+    sp = yaspin(Spinner("ab", [300, 100]))
+    next(sp._state.cycle)
+    next(sp._state.timeline)
+
+    sp.text = "text only"
+    assert next(sp._state.cycle) == "b"
+    assert next(sp._state.timeline) == pytest.approx(0.1)
+
+    sp.attrs = ["bold"]
+    assert next(sp._state.cycle) == "a"
+    assert next(sp._state.timeline) == pytest.approx(0.3)
+
+
+def test_frame_is_held():
+    stream = io.StringIO()
+    # The first frame is held, the second one is short
+    with yaspin(Spinner("AB", [300, 20]), text="x", stream=stream):
+        time.sleep(0.5)
+
+    out = stream.getvalue()
+    # A single interval of 20ms would draw about 25 frames
+    assert 1 <= out.count("A x") <= 3
+    assert out.count("B x") <= 2
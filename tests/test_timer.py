@@ -10,7 +10,8 @@ import time
 
 import pytest
 
-from yaspin import yaspin
+from yaspin import TimerFormat, yaspin
+from yaspin.timer import Timer
 
 
 def test_no_timer():
@@ -53,7 +54,7 @@ def test_timer_rounding(interval, expected):
     sp.start()
     sp.stop()
 
-    sp._stop_time = sp._start_time + interval
+    sp._stop_time = sp._start_time + round(interval * 1e9)
     sp._freeze("")
 
     assert expected in sp._last_frame
@@ -78,3 +79,61 @@ def test_timer_finished():
     sp._freeze("")
 
     assert re.search(r"\(\d+:\d{2}:\d{2}.\d{2}\)", sp._last_frame) is not None
+
+
+@pytest.mark.parametrize(
+    "fmt, elapsed, expected",
+    [
+        (TimerFormat(), 0, " (0:00:00.00)"),
+        (TimerFormat(), 83.456, " (0:01:23.46)"),
+        (TimerFormat(), 3723.004, " (1:02:03.00)"),
+        (TimerFormat(), 90000, " (1 day, 1:00:00.00)"),
+        (TimerFormat(), 2 * 86400, " (2 days, 0:00:00.00)"),
+        (TimerFormat(precision=0), 83.5, " (0:01:24)"),
+        (TimerFormat(precision=1), 83.44, " (0:01:23.4)"),
+        (TimerFormat(precision=6), 1.0000005, " (0:00:01.000001)"),
+        (TimerFormat(compact=True), 5.5, " (5.50s)"),
+        (TimerFormat(compact=True), 83.456, " (1m23.46s)"),
+        (TimerFormat(compact=True, precision=0), 3723, " (1h02m03s)"),
+        (TimerFormat(threshold=1.5), 1.4, ""),
+        (TimerFormat(threshold=1.5), 1.5, " (0:00:01.50)"),
+    ],
+)
+def test_timer_format(fmt, elapsed, expected):
+    timer = Timer(fmt)
+    assert timer(round(elapsed * 1e9)) == expected
+
+
+def test_timer_prefix_cached():
+    timer = Timer(TimerFormat())
+    assert timer(1_250_000_000) == " (0:00:01.25)"
+    prefix = timer._prefix[1]
+
+    assert timer(1_500_000_000) == " (0:00:01.50)"
+    assert timer._prefix[1] is prefix
+
+    assert timer(2_000_000_000) == " (0:00:02.00)"
+    assert timer._prefix == (2, " (0:00:02")
+
+
+@pytest.mark.parametrize("kwargs", [{"precision": -1}, {"precision": 10}, {"threshold": -1}])
+def test_timer_format_invalid(kwargs):
+    with pytest.raises(ValueError):
+        TimerFormat(**kwargs)
+
+
+def test_timer_format_argument():
+    sp = yaspin(timer=TimerFormat(compact=True, precision=1))
+    sp._freeze("")
+
+    assert "(0.0s)" in sp._last_frame
+
+
+def test_timer_is_monotonic(monkeypatch):
+    sp = yaspin(timer=True)
+    sp.start()
+    sp.stop()
+
+    # Wall clock adjustments do not affect the timer
+    monkeypatch.setattr(time, "time", lambda: 0)
+    assert 0 <= sp.elapsed_time < 1
@@ -0,0 +1,129 @@
+"""
+tests.test_update
+~~~~~~~~~~~~~~~~~
+
+Test batched updates of the spinner properties.
+"""
+
+import io
+import time
+
+import pytest
+
+from yaspin import Spinner, yaspin
+from yaspin.core import Yaspin
+from yaspin.spinners import Spinners
+
+
+def test_update_several_properties():
+    sp = yaspin(text="old")
+    sp.update(text="new", spinner=Spinners.arc, side="right", ellipsis="…", reversal=True)
+
+    assert sp.text == "new"
+    assert sp.spinner == Spinners.arc
+    assert sp.side == "right"
+    assert sp.ellipsis == "…"
+    assert sp.reversal
+    assert sp._state.frames == Spinners.arc.frames[::-1]
+
+
+def test_update_replaces_state():
+    sp = yaspin(text="old")
+    state = sp._state
+    sp.update(text="new")
+
+    assert sp._state is not state
+    assert state.text == "old"
+
+
+def test_update_keeps_frame_cycle_on_text_change():
+    sp = yaspin(text="old")
+    cycle = sp._state.cycle
+    sp.update(text="new")
+    assert sp._state.cycle is cycle
+
+    sp.update(spinner=Spinners.arc)
+    assert sp._state.cycle is not cycle
+
+
+@pytest.mark.parametrize("changes", [{"color": "red"}, {"side": "right"}, {"text": "new"}])
+def test_update_keeps_painted_frames(changes):
+    sp = yaspin(palette=["red", "blue"], text_palette=["green"])
+    state = sp._state
+    sp.update(**changes)
+
+    assert sp._state.cycle is state.cycle
+    assert sp._state.painted_cycle is state.painted_cycle
+    assert sp._state.text_codes is state.text_codes
+
+
+def test_update_repaints_frames_on_palette_change():
+    sp = yaspin(palette=["red", "blue"])
+    state = sp._state
+    sp.update(palette=["green"])
+
+    assert sp._state.painted_cycle is not state.painted_cycle
+    assert sp._state.style_codes is state.style_codes
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"text": "new", "color": "bad-color"},
+        {"text": "new", "side": "top"},
+        {"spinner": Spinners.arc, "attrs": ["bad-attr"]},
+    ],
+)
+def test_update_invalid_value_changes_nothing(changes):
+    sp = yaspin(text="old")
+    state = sp._state
+
+    with pytest.raises(ValueError):
+        sp.update(**changes)
+    assert sp._state is state
+    assert sp.spinner != Spinners.arc
+
+
+def test_update_unknown_property():
+    sp = yaspin()
+    with pytest.raises(TypeError, match="'frames'"):
+        sp.update(text="new", frames="ab")
+
+
+def test_fluent_interface_replaces_state():
+    sp = yaspin()
+    state = sp._state
+
+    assert sp.bold.arc is sp
+    assert sp._state is not state
+    assert sp.attrs == ["bold"]
+    assert sp._state.frames == Spinners.arc.frames
+
+
+def test_fluent_chain_composes_single_state(monkeypatch):
+    sp = yaspin()
+    composed = []
+    compose_state = Yaspin._compose_state
+    monkeypatch.setattr(Yaspin, "_compose_state", lambda *args: composed.append(args) or compose_state(*args))
+    assert sp.green.bold.arc.right is sp
+
+    assert not composed
+    assert sp._state.side == "right"
+    assert sp._state.frames == Spinners.arc.frames
+    assert len(composed) == 1
+
+
+def test_update_redraws_running_spinner():
+    stream = io.StringIO()
+    # The next frame is far away, so only the update can redraw the line
+    with yaspin(Spinner("ab", 10_000), text="old", stream=stream) as sp:
+        time.sleep(0.1)
+        sp.update(text="new")
+        assert stream.getvalue().endswith("\ra new")
+
+
+def test_update_when_not_running_draws_nothing():
+    stream = io.StringIO()
+    sp = yaspin(text="old", stream=stream)
+    sp.update(text="new")
+    assert stream.getvalue() == ""
@@ -0,0 +1,75 @@
+"""
+tests.test_width
+~~~~~~~~~~~~~~~~
+
+Test display width of the text in terminal cells.
+"""
+
+import pytest
+
+from yaspin.width import char_width, clusters, text_width, truncate
+
+
+@pytest.mark.parametrize(
+    "char, width",
+    [
+        ("a", 1),
+        ("⠋", 1),
+        ("日", 2),
+        ("Ｆ", 2),
+        ("🌍", 2),
+        ("🕐", 2),
+        ("\u0301", 0),  # combining acute accent
+        ("\ufe0f", 0),  # variation selector-16
+        ("\u200d", 0),  # zero width joiner
+    ],
+)
+def test_char_width(char, width):
+    assert char_width(char) == width
+    # cached lookup
+    assert char_width(char) == width
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("ab", [("a", 1), ("b", 1)]),
+        ("e\u0301x", [("e\u0301", 1), ("x", 1)]),
+        ("日本", [("日", 2), ("本", 2)]),
+        ("\U0001f468\u200d\U0001f469", [("\U0001f468\u200d\U0001f469", 2)]),
+        ("\U0001f1fa\U0001f1e6\U0001f1fa", [("\U0001f1fa\U0001f1e6", 2), ("\U0001f1fa", 1)]),
+        ("\u0301a", [("\u0301", 0), ("a", 1)]),
+    ],
+)
+def test_clusters(text, expected):
+    assert list(clusters(text)) == expected
+
+
+@pytest.mark.parametrize(
+    "text, width",
+    [
+        ("", 0),
+        ("foo", 3),
+        ("日本語", 6),
+        ("🌍 earth", 8),
+        ("cafe\u0301", 4),
+    ],
+)
+def test_text_width(text, width):
+    assert text_width(text) == width
+
+
+@pytest.mark.parametrize(
+    "text, max_width, expected",
+    [
+        ("foobar", 3, ("foo", 3)),
+        ("foo", 10, ("foo", 3)),
+        ("日本語", 5, ("日本", 4)),
+        ("日本語", 1, ("", 0)),
+        ("cafe\u0301s", 4, ("cafe\u0301", 4)),
+        ("a🌍b", 2, ("a", 1)),
+    ],
+)
+def test_truncate(text, max_width, expected):
+    assert truncate(text, max_width) == expected
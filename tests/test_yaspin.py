@@ -6,6 +6,12 @@ Basic unittests.
 """
 
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import io
+import signal
+import threading
+import time
 
 import pytest
 
@@ -46,8 +52,137 @@ def test_set_spinner(spinner, expected):
     assert sp.spinner == expected
 
 
+def test_instance_is_slotted():
+    sp = yaspin()
+    assert not hasattr(sp, "__dict__")
+    with pytest.raises(AttributeError):
+        sp.unknown_attribute = 42  # type: ignore[attr-defined]
+
+
+def test_unstarted_instance_is_compact():
+    sp = yaspin(text="queued")
+    assert sp._resume_spin is None
+    assert sp._hidden_lock is None
+    assert sp._calls_lock is None
+    assert sp._render_state is None
+
+    # Composed once read, e.g. by the first frame
+    assert sp._state.text == "queued"
+    with sp:
+        assert sp._resume_spin is not None
+        assert sp._hidden_lock is not None
+
+
 def test_decorator_usage():
     @yaspin()
     def decorated_func(): ...
 
     decorated_func()
+
+
+def test_decorator_concurrent_calls():
+    stream = io.StringIO()
+    sp = yaspin(text="working", stream=stream)
+    barrier = threading.Barrier(4)
+
+    @sp
+    def task(i):
+        barrier.wait(timeout=5)
+        time.sleep(0.1)
+        return i
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert list(pool.map(task, range(4))) == [0, 1, 2, 3]
+
+    assert sp._calls == 0
+    assert not sp._spin_thread.is_alive()
+    assert "working (×4)" in stream.getvalue()
+
+
+def test_decorator_call_during_stop():
+    sp = yaspin(stream=io.StringIO(), min_visible=0.5)
+    entered = []
+
+    @sp
+    def task(wait_restart=False):
+        entered.append(time.monotonic())
+        if wait_restart:
+            # Started again once the stop of the first call completes
+            stopping = sp._spin_thread
+            deadline = time.monotonic() + 5
+            while sp._spin_thread is stopping and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return sp._is_spinning()
+        return None
+
+    # The first call keeps the spinner visible for a while as it stops
+    first = threading.Thread(target=task)
+    first.start()
+    while not entered:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    assert task(wait_restart=True)
+    # Not held up by the stop of the first call
+    assert entered[1] - start < 0.2
+    first.join()
+
+    assert sp._calls == 0
+    assert not sp._calls_stopping
+    assert not sp._is_active()
+
+
+def test_decorator_recursive_calls():
+    sp = yaspin(stream=io.StringIO())
+    threads = set()
+
+    @sp
+    def countdown(n):
+        threads.add(sp._spin_thread)
+        assert sp._calls == 4 - n
+        return countdown(n - 1) if n > 1 else n
+
+    assert countdown(3) == 1
+    # Started by the outermost call only
+    assert len(threads) == 1
+    assert not sp._spin_thread.is_alive()
+
+
+def test_decorator_ok_inside_call():
+    stream = io.StringIO()
+    sp = yaspin(text="task", stream=stream)
+
+    @sp
+    def task():
+        sp.ok("✔")
+
+    task()
+    task()
+    assert stream.getvalue().count("✔ task\n") == 2
+
+
+def test_decorator_exception():
+    sp = yaspin(stream=io.StringIO())
+
+    @sp
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        fail()
+    assert sp._calls == 0
+    assert not sp._spin_thread.is_alive()
+
+
+def test_decorator_start_failure():
+    sp = yaspin(stream=io.StringIO(), sigmap={signal.SIGKILL: signal.SIG_DFL})
+
+    @sp
+    def task():
+        pass
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            task()
+        assert sp._calls == 0
@@ -1,6 +1,9 @@
 # :copyright: (c) 2021 by Pavlo Dmytrenko.
 # :license: MIT, see LICENSE for more details.
 from .api import inject_spinner, kbi_safe_yaspin, yaspin
+from .context import current
 from .core import Spinner
+from .styles import Style
+from .timer import TimerFormat
 
-__all__ = ("yaspin", "kbi_safe_yaspin", "Spinner", "inject_spinner")
+__all__ = ("yaspin", "kbi_safe_yaspin", "Spinner", "Style", "TimerFormat", "current", "inject_spinner")
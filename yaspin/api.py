@@ -27,15 +27,24 @@ def yaspin(*args: Any, **kwargs: Any) -> Yaspin:
     Arguments:
         spinner (core.Spinner, optional): Spinner object to use.
         text (str, optional): Text to show along with spinner.
-        color (str, optional): Spinner color.
-        on_color (str, optional): Color highlight for the spinner.
+        color (str | int | tuple, optional): Spinner color: color name,
+            256-color palette index, RGB tuple or ``#rrggbb`` string.
+        on_color (str | int | tuple, optional): Color highlight for the
+            spinner, specified in the same way as ``color``.
         attrs (list, optional): Color attributes for the spinner.
+        palette (list, optional): Colors cycled over the spinner frames,
+            one color per frame. Overrides ``color``.
+        text_palette (list, optional): Colors spread over the text
+            characters, e.g. a gradient.
         reversal (bool, optional): Reverse spin direction.
         side (str, optional): Place spinner to the right or left end
             of the text string.
         sigmap (dict, optional): Maps POSIX signals to their respective
-            handlers.
-        timer (bool, optional): Prints a timer showing the elapsed time.
+            handlers. Handlers are called in a separate thread, see
+            ``yaspin.signals``.
+        timer (bool | TimerFormat, optional): Prints a timer showing the
+            elapsed time. Pass ``TimerFormat`` to set precision, compact
+            format or threshold for showing the timer.
         ellipsis (str, optional): Sets a custom ellipsis to signal text
             truncation due to overflow.
         stream (TextIO, optional): Output stream for the spinner. Defaults
@@ -44,6 +53,24 @@ def yaspin(*args: Any, **kwargs: Any) -> Yaspin:
         warn_on_closed_stream (bool, optional): If True, emits a warning
             when attempting to write to a closed stream. Useful for debugging
             stream lifecycle issues. Defaults to False for silent operation.
+        max_bandwidth (int, optional): Output budget in bytes per second.
+            When limited, frame rate is lowered. Detected from the terminal
+            baud rate by default; 0 disables the limit.
+        pad_frames (bool, optional): Pad spinner frames with spaces to the
+            width of the widest frame, so the text does not jitter.
+        delay (float, optional): Seconds to wait before showing the spinner.
+            Spinners stopped earlier write nothing to the stream.
+        min_visible (float, optional): Minimal number of seconds the spinner
+            stays on the screen once shown; ``stop()`` waits for the rest.
+        reuse_thread (bool, optional): Keep the spin thread parked between
+            ``stop()`` and the next ``start()``. Call ``close()`` once the
+            spinner is no longer needed.
+        idle_after (float, optional): Seconds of unchanged text after which
+            the frame rate of the spinner decays to ``idle_fps``. The full
+            rate is back on the next change of text, ``write()`` or
+            ``show()``. Disabled by default.
+        idle_fps (float, optional): Frame rate of the idle spinner.
+            Defaults to 1 frame per second.
 
     Returns:
         core.Yaspin: instance of the Yaspin class.
@@ -55,6 +82,10 @@ def yaspin(*args: Any, **kwargs: Any) -> Yaspin:
             is specified.
         ValueError: If trying to register handler for SIGKILL signal.
         ValueError: If unsupported ``side`` is specified.
+        ValueError: If ``TimerFormat`` precision or threshold is out of range.
+        ValueError: If ``delay``, ``min_visible`` or ``idle_after``
+            is negative.
+        ValueError: If ``idle_fps`` is not positive.
 
     Available text colors:
         red, green, yellow, blue, magenta, cyan, white.
@@ -66,6 +97,9 @@ def yaspin(*args: Any, **kwargs: Any) -> Yaspin:
     Available attributes:
         bold, dark, underline, blink, reverse, concealed.
 
+    256-color and RGB values are downgraded to the color depth
+    supported by the terminal.
+
     Example::
 
         # Use as a context manager
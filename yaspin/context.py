@@ -0,0 +1,123 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.context
+~~~~~~~~~~~~~~
+
+Access to the current spinner from anywhere in the call stack.
+
+The spinner started in the current thread or asyncio task is kept in a
+context variable, so code deep down the call stack can update it without
+passing the spinner around.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from typing import Any, TYPE_CHECKING
+
+import contextlib
+import os
+import threading
+
+if TYPE_CHECKING:
+    from .core import Yaspin
+
+
+class NoopSpinner:
+    """Stand-in for the spinner when no spinner is running.
+
+    Accepts any attribute assignment and method call and does nothing,
+    so the code using ``current()`` does not need to check for a spinner.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> NoopSpinner:
+        # Methods and fluent attributes, e.g. ``current().green.ok()``
+        return self
+
+    def __call__(self, *args: Any, **kwargs: Any) -> NoopSpinner:
+        return self
+
+    def __enter__(self) -> NoopSpinner:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "<NoopSpinner>"
+
+
+NOOP_SPINNER = NoopSpinner()
+
+_current: ContextVar[Yaspin | None] = ContextVar("yaspin_current", default=None)
+
+# Running spinners in the order of start, for threads that do not share
+# the context with the thread that started the spinner.
+_running: list[Yaspin] = []
+_running_lock = threading.Lock()
+
+
+def current() -> Yaspin | NoopSpinner:
+    """Return the spinner running in the current context.
+
+    Falls back to the most recently started spinner if the current thread
+    or task did not start one, and to a no-op object if no spinner is
+    running at all.
+
+    Example::
+
+        def parse(path):
+            current().text = f"Parsing {path}"
+
+
+        with yaspin():
+            parse("data.csv")
+    """
+    sp = _current.get()
+    if sp is not None and sp._is_active():
+        return sp
+    if _running:
+        with _running_lock:
+            if _running:
+                return _running[-1]
+    return NOOP_SPINNER
+
+
+def _enter(sp: Yaspin) -> Token[Yaspin | None]:
+    with _running_lock:
+        if sp not in _running:
+            _running.append(sp)
+    return _current.set(sp)
+
+
+def _exit(sp: Yaspin, token: Token[Yaspin | None] | None) -> None:
+    with _running_lock:
+        if sp in _running:
+            _running.remove(sp)
+    if token is None:
+        return
+    # Stopped from another context, e.g. a signal handler or another
+    # thread; current() skips spinners which are not active anymore.
+    with contextlib.suppress(ValueError):
+        _current.reset(token)
+
+
+def _after_fork_in_child() -> None:
+    """Forget the spinners of the parent process, which do not run in the child."""
+    global _running_lock
+    _running.clear()
+    _running_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
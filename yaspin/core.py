@@ -10,10 +10,10 @@ A lightweight terminal spinner.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Iterator, Sequence
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence, Set as AbstractSet
 from contextlib import contextmanager
-from dataclasses import dataclass
-from datetime import timedelta
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     Any,
     cast,
@@ -22,11 +22,16 @@ from typing import (
     runtime_checkable,
     TextIO,
     TYPE_CHECKING,
+    TypeGuard,
     TypeVar,
 )
 
 import functools
+import io
 import itertools
+import math
+import os
+import re
 import shutil
 import signal
 import sys
@@ -34,11 +39,24 @@ import threading
 import time
 import warnings
 
-from termcolor import ATTRIBUTES, colored, COLORS, HIGHLIGHTS
+try:
+    import termios
+except ImportError:  # pragma: no cover (Windows)
+    termios = None  # type: ignore[assignment]
 
+from termcolor import ATTRIBUTES, COLORS, HIGHLIGHTS
+
+from . import context, signals
 from .constants import SPINNER_ATTRS
+from .frames import FrameFunction, generate_frames, is_streamed, stream_frames
+from .render import Cell, diff_cells, line_cells
+from .scheduler import ScheduledCall, scheduler
+from .styles import Color, ColorDepth, detect_color_depth, parse_color, Style
+from .timer import NS_PER_SEC, Timer, TimerFormat
+from .width import text_width, truncate
 
 if TYPE_CHECKING:
+    from contextvars import Token
     from types import FrameType, TracebackType
 
     SignalHandlers = Callable[[int, FrameType | None], Any] | int | None
@@ -47,34 +65,196 @@ Fn = TypeVar("Fn", bound=Callable[..., Any])
 
 ENCODING: Final[str] = "utf-8"
 
+# Number of lines joined into a single stream write by ``Yaspin.writelines``
+WRITE_CHUNK_SIZE: Final[int] = 1024
+
+# Maps termios speed constants to baud rates, e.g. termios.B9600 to 9600
+BAUD_RATES: Final[dict[int, int]] = (
+    {getattr(termios, name): int(name[1:]) for name in dir(termios) if re.fullmatch(r"B\d+", name)}
+    if termios is not None
+    else {}
+)
+
+
+# Shared by the spinners without color attributes
+NO_ATTRS: Final[frozenset[str]] = frozenset()
+
+# Sets of color attributes used by the spinners, keyed by themselves.
+# Bounded by the number of combinations of the attributes.
+_interned_attrs: dict[frozenset[str], frozenset[str]] = {}
+
+# Shared by the spinners without signal handlers
+NO_SIGNALS: Final[Mapping[signal.Signals, SignalHandlers]] = MappingProxyType({})
+
+# Pending changes of the spinners created with the default text, side and
+# ellipsis, which compose their first render state from these defaults
+NO_CHANGES: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Properties accepted by ``Yaspin.update``
+UPDATE_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        "spinner",
+        "text",
+        "color",
+        "on_color",
+        "attrs",
+        "style",
+        "palette",
+        "text_palette",
+        "side",
+        "reversal",
+        "ellipsis",
+        "pad_frames",
+    }
+)
+# Properties that change the frames of the spinner, the style of the frame,
+# the frames painted with the palette, and the styles of the text
+FRAME_KEYS: Final[frozenset[str]] = frozenset({"spinner", "reversal", "pad_frames"})
+STYLE_KEYS: Final[frozenset[str]] = frozenset({"color", "on_color", "attrs", "style"})
+PAINT_KEYS: Final[frozenset[str]] = frozenset({"palette", "on_color", "attrs", "style"})
+TEXT_STYLE_KEYS: Final[frozenset[str]] = frozenset({"text_palette"})
+ALL_STYLE_KEYS: Final[frozenset[str]] = STYLE_KEYS | PAINT_KEYS | TEXT_STYLE_KEYS
+
+
+# Maps the names of the fluent interface to the changes they apply,
+# e.g. ``sp.red.bold`` applies {"color": "red"} and {"attrs": ("bold",)}.
+# Built on first use, as spinners are loaded from the JSON data file.
+_fluent_table: Mapping[str, Mapping[str, Any]] | None = None
+
+
+# Number of the encoded frames cached for the spinners with streamed
+# frames, which may never repeat
+FRAME_CACHE_WINDOW: Final[int] = 64
+
+
+# Seconds between the full rewrites of the spinner line on TTY streams.
+# Only the changed cells are rewritten in between, so the line spoiled by
+# the output written past the spinner, e.g. logging to stderr, is restored.
+FULL_REDRAW_INTERVAL: Final[float] = 1.0
+
+
+# Growth of the frame interval on every frame of an idle spinner
+IDLE_DECAY: Final[float] = 1.5
+
+
+# Interval of the foreground checks of the spinner in a background job;
+# SIGCONT, e.g. sent by ``fg``, triggers the check right away
+BACKGROUND_POLL: Final[float] = 0.5
+
+
+# Spinners shown on each output stream, keyed by the stream id, the
+# innermost one last. Only the innermost spinner renders, while the
+# outer ones are suspended until it stops.
+_spinner_stacks: dict[int, list[Yaspin]] = {}
+_spinner_stacks_lock = threading.Lock()
+
+
+# Seconds to wait for a frame being written when the process forks
+FORK_LOCK_TIMEOUT: Final[float] = 0.5
+
+# Spinners running when the process forks, and whether their stream lock
+# is held by the fork
+_forking: list[tuple[Yaspin, bool]] = []
+
 
 class SafeStreamWrapper:
-    """A wrapper that handles closed streams gracefully."""
+    """A wrapper that handles closed and broken streams gracefully."""
+
+    # One per spinner, see ``Yaspin.__slots__``
+    __slots__ = (
+        "_stream",
+        "_warn_on_closed",
+        "_warned_already",
+        "broken",
+        "fd",
+        "direct",
+        "encoding",
+        "errors",
+    )
 
     def __init__(self, stream: TextIO, warn_on_closed: bool = False) -> None:
         self._stream = stream
         self._warn_on_closed = warn_on_closed
         self._warned_already = False  # Avoid warning spam
+        # Set once the reader of the pipe is gone, e.g. ``| head`` exited
+        self.broken = False
+        self.fd = self._get_fd(stream)
+        # Output is written into the file descriptor only for the streams
+        # which are plain text files themselves. Wrappers delegating
+        # ``fileno()`` to the file, e.g. of colorama or ipykernel, convert
+        # or capture what is written through them.
+        self.direct = self.fd is not None and type(stream) is io.TextIOWrapper
+        self.encoding: str = getattr(stream, "encoding", None) or ENCODING
+        self.errors: str = getattr(stream, "errors", None) or "strict"
 
     def write(self, text: str) -> None:
         """Write to stream, optionally warning if stream is closed."""
-        if not self._stream.closed:
-            self._stream.write(text)
-        elif self._warn_on_closed and not self._warned_already:
+        if not self.lost:
+            with self._catch_broken_pipe():
+                self._stream.write(text)
+        else:
+            self._warn_closed()
+
+    def write_bytes(self, data: bytes) -> None:
+        """Write raw bytes, bypassing the text layer when the stream allows it."""
+        if self.lost:
+            self._warn_closed()
+            return
+
+        buffer = getattr(self._stream, "buffer", None)
+        with self._catch_broken_pipe():
+            if buffer is None:
+                encoding = getattr(self._stream, "encoding", None) or ENCODING
+                self._stream.write(data.decode(encoding))
+                return
+
+            # Text written earlier may still sit in the text layer buffer
+            self._stream.flush()
+            buffer.write(data)
+
+    def write_fd(self, data: bytes) -> None:
+        """Write bytes directly into the file descriptor of the stream.
+
+        Must only be used if ``direct`` is set.
+        """
+        if self.lost:
+            self._warn_closed()
+            return
+
+        with self._catch_broken_pipe():
+            # Keep the output ordered with text that is still buffered
+            # by the text layer; no-op if the buffer is empty.
+            self._stream.flush()
+            fd = cast(int, self.fd)
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+
+    def flush(self) -> None:
+        """Flush stream, silently ignoring if stream is closed or broken."""
+        if not self.lost:
+            with self._catch_broken_pipe():
+                self._stream.flush()
+        # Note: don't warn on flush - it is often called during cleanup
+
+    @contextmanager
+    def _catch_broken_pipe(self) -> Generator[None, None, None]:
+        """Drop the output written to the pipe without a reader."""
+        try:
+            yield
+        except BrokenPipeError:
+            self.broken = True
+
+    def _warn_closed(self) -> None:
+        if self._warn_on_closed and not self._warned_already:
             warnings.warn(
                 "Attempted to write to closed stream. Output ignored. "
                 "This may indicate a stream lifecycle management issue.",
                 UserWarning,
-                stacklevel=3,
+                stacklevel=4,
             )
             self._warned_already = True
 
-    def flush(self) -> None:
-        """Flush stream, silently ignoring if stream is closed."""
-        if not self._stream.closed:
-            self._stream.flush()
-        # Note: don't warn on flush - it is often called during cleanup
-
     def isatty(self) -> bool:
         """Check if stream is a TTY, returning False if closed."""
         return not self._stream.closed and self._stream.isatty()
@@ -84,10 +264,140 @@ class SafeStreamWrapper:
         """Check if the underlying stream is closed."""
         return self._stream.closed
 
+    @property
+    def lost(self) -> bool:
+        """Check if the stream is closed, or its pipe is broken."""
+        return self.broken or self._stream.closed
+
     def __getattr__(self, name: str) -> Any:
         """Delegate other attributes to the underlying stream."""
         return getattr(self._stream, name)
 
+    @staticmethod
+    def _get_fd(stream: TextIO) -> int | None:
+        """Return file descriptor backing the stream, if there is any."""
+        try:
+            return stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            # io.UnsupportedOperation for in-memory streams
+            return None
+
+
+def _is_set(value: Color | None) -> TypeGuard[Color]:
+    """Check if the color value is specified; 0 is a valid palette index."""
+    return value is not None and value != ""
+
+
+def _detect_bandwidth(fd: int) -> int | None:
+    """Estimate terminal bandwidth in bytes per second from its baud rate."""
+    if termios is None:
+        return None
+    try:
+        ospeed = termios.tcgetattr(fd)[5]
+    except (termios.error, OSError):
+        return None
+    baud = BAUD_RATES.get(ospeed)
+    # 10 bits per byte: 8 data bits plus start and stop bits
+    return baud // 10 if baud else None
+
+
+def _is_foreground(fd: int) -> bool:
+    """Check if the process is in the foreground process group of the terminal."""
+    try:
+        return os.tcgetpgrp(fd) == os.getpgrp()
+    except OSError:
+        # Not the controlling terminal of the process, no job control
+        return True
+
+
+def _job_spinners() -> list[Yaspin]:
+    """Return the spinners rendering on terminals, which are subject to job control."""
+    with _spinner_stacks_lock:
+        return [stack[-1] for stack in _spinner_stacks.values() if stack and stack[-1]._job_fd is not None]
+
+
+def _on_job_continue(signum: int, frame: FrameType | None) -> None:
+    """
+    Wake up the spinners to check if they are back in the foreground, and
+    redraw their lines, which the shell may have written over meanwhile.
+    """
+    for sp in _job_spinners():
+        sp._backgrounded = True
+        if sp._continued is not None:
+            sp._continued.set()
+
+
+def _before_fork() -> None:
+    """
+    Quiesce the running spinners: no frame is half-written when the process
+    forks, and nothing is left in the stream buffers to be written twice.
+    """
+    with context._running_lock:
+        spinners = list(context._running)
+    for sp in spinners:
+        # A lock held for long, e.g. by the forking thread itself, is
+        # not waited for; the child gets a new one anyway
+        locked = sp._stream_lock.acquire(timeout=FORK_LOCK_TIMEOUT)
+        _forking.append((sp, locked))
+        if locked:
+            sp._stream.flush()
+
+
+def _after_fork_in_parent() -> None:
+    """Resume the spinners of the parent process."""
+    for sp, locked in _forking:
+        if locked:
+            sp._stream_lock.release()
+    _forking.clear()
+
+
+def _after_fork_in_child() -> None:
+    """Stop the copies of the running spinners, whose threads do not exist in the child."""
+    global _spinner_stacks_lock
+    _spinner_stacks.clear()
+    _spinner_stacks_lock = threading.Lock()
+    for sp, _ in _forking:
+        sp._after_fork_in_child()
+    _forking.clear()
+
+
+def _fluent_changes(name: str) -> Mapping[str, Any] | None:
+    """Look up the changes applied by the fluent attribute, None if unknown."""
+    global _fluent_table
+    table = _fluent_table
+    if table is None:
+        # Building the table twice in concurrent threads is harmless
+        table = _fluent_table = _build_fluent_table()
+    return table.get(name)
+
+
+def _build_fluent_table() -> Mapping[str, Mapping[str, Any]]:
+    from .spinners import Spinners
+
+    table: dict[str, dict[str, Any]] = {side: {"side": side} for side in ("left", "right")}
+    # Changes of a name found in several groups are merged
+    for name in ATTRIBUTES:
+        table.setdefault(name, {})["attrs"] = (name,)
+    for name in COLORS:
+        table.setdefault(name, {})["color"] = name
+    for name in HIGHLIGHTS:
+        table.setdefault(name, {})["on_color"] = name
+    # CLI spinners take precedence over the rest
+    for name in SPINNER_ATTRS:
+        table[name] = {"spinner": _intern_spinner(getattr(Spinners, name))}
+    # The changes are plain dicts, which are merged into the pending changes
+    # several times faster than read-only proxies; they are never modified
+    return MappingProxyType(table)
+
+
+@functools.lru_cache(maxsize=256)
+def _style_codes(
+    color: Color | None, on_color: Color | None, attrs: frozenset[str], depth: ColorDepth
+) -> tuple[str, str] | None:
+    """Compile the color specification, None if there is nothing to apply."""
+    style = Style(color, on_color, attrs)
+    return style.codes(depth) if style else None
+
 
 def to_unicode(text_type: str | bytes, encoding: str = ENCODING) -> str:
     if isinstance(text_type, bytes):
@@ -95,10 +405,118 @@ def to_unicode(text_type: str | bytes, encoding: str = ENCODING) -> str:
     return text_type
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Spinner:
-    frames: str
-    interval: int
+    """Frames of the spinner along with the interval between them, in milliseconds.
+
+    The interval is either the same for all frames, or a timeline of the
+    durations of each frame, e.g. to hold on a keyframe. Timelines of
+    the frames given as a string or a sequence match their length, while
+    those of the frames produced on the fly are repeated.
+
+    The frames are a string, a sequence of strings, any other iterable,
+    e.g. a generator, or a function of the frame number, the elapsed time
+    in seconds and the terminal width, see ``yaspin.frames``. Frames of
+    iterables and functions are produced one at a time, and are neither
+    reversed nor padded.
+
+    Spinners are immutable, so the frames given as a list are kept as
+    a tuple. Spinners equal to the entries of the catalogue are replaced
+    by them, and equal spinners share the measured frames.
+
+    Like the named tuples of the catalogue they replace, spinners unpack
+    into, and are indexed as, ``(frames, interval)``.
+    """
+
+    frames: str | Sequence[str] | Iterable[str] | FrameFunction
+    interval: int | Sequence[int]
+    # Spinners are looked up in the caches on every change of the spinner,
+    # so the hash of the frames is computed once
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((self.frames, self.interval)))
+        return cast(int, self._hash)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.frames, self.interval))
+
+    def __getitem__(self, index: int) -> Any:
+        return (self.frames, self.interval)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __post_init__(self) -> None:
+        if isinstance(self.frames, list):
+            object.__setattr__(self, "frames", tuple(self.frames))
+        if isinstance(self.interval, list | tuple):
+            timeline = tuple(self.interval)
+            object.__setattr__(self, "interval", timeline)
+            if any(duration <= 0 for duration in timeline):
+                raise ValueError(f"{timeline!r}: frame durations should be positive numbers")
+            if timeline and isinstance(self.frames, str | tuple) and len(timeline) != len(self.frames):
+                raise ValueError(
+                    f"{len(timeline)} frame durations are given for {len(self.frames)} frames, "
+                    "the timeline should match the frames"
+                )
+
+
+# Entries of the catalogue, keyed by themselves. Only these are interned,
+# as the spinners built by the application, e.g. one per task, would be
+# kept alive for good; equal ones share the measured frames regardless.
+_interned_spinners: dict[Spinner, Spinner] = {}
+
+
+def _register_spinner(spinner: Spinner) -> Spinner:
+    """Intern the entry of the catalogue."""
+    return _interned_spinners.setdefault(spinner, spinner)
+
+
+def _intern_spinner(spinner: Spinner) -> Spinner:
+    """Return the entry of the catalogue equal to the spinner, if any."""
+    if type(spinner) is not Spinner:
+        # Any object with frames and interval, e.g. a named tuple
+        spinner = Spinner(spinner.frames, spinner.interval)
+    return _interned_spinners.get(spinner, spinner)
+
+
+@dataclass(slots=True)
+class RenderState:
+    """Everything the spin thread reads to render a frame.
+
+    Changes of the spinner properties build a new state, which replaces
+    the old one at once, so a frame is never rendered from a half-applied
+    change. States are never modified once built; they are not frozen,
+    as a frozen dataclass takes several times longer to build.
+    """
+
+    text: str
+    side: str
+    ellipsis: str
+    frames: str | Sequence[str] | Iterable[str] | FrameFunction
+    frame_widths: dict[str, int]
+    # Frames are produced on the fly, and not known in advance
+    streamed: bool
+    # Shortest duration of a frame, in seconds
+    interval: float
+    cycle: Iterator[str]
+    # Durations of the frames in seconds, taken in step with the frames,
+    # or None if all of them take ``interval``
+    timeline: Iterator[float] | None
+    # Precomputed (frame, styled frame) table for animated colors
+    painted_cycle: Iterator[tuple[str, str]] | None
+    style_codes: tuple[str, str] | None
+    # Styles applied to the text characters, from left to right
+    text_codes: list[tuple[str, str]] | None
+    # Maps (previous frame, frame) pairs to the encoded output, along with
+    # the cells of the drawn line. Only created for TTY streams with a file
+    # descriptor. Each state gets its own cache, so output composed from
+    # the stale state never gets into the new one.
+    frame_cache: dict[tuple[str | None, str], tuple[bytes, tuple[Cell, ...]]] | None = field(
+        default=None, compare=False
+    )
 
 
 default_spinner = Spinner("⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏", 80)
@@ -139,6 +557,78 @@ class Yaspin:
     during context execution.
     """
 
+    # Threads share the spinner without a lock on the hot path, which holds
+    # on free-threaded builds too: what the spin thread reads is immutable
+    # and replaced as a whole (the render state, the last frame, the text
+    # caches), while the drawn line, e.g. ``_cur_line_len`` and
+    # ``_drawn_cells``, is only touched with ``_stream_lock`` held, and
+    # ``_hidden_level`` with ``_hidden_lock``.
+    #
+    # Thousands of spinners may be created and never started, e.g. one
+    # per queued task, so the instances are kept compact
+    __slots__ = (
+        "__weakref__",
+        "_activity",
+        "_ansi_codes",
+        "_attrs",
+        "_backgrounded",
+        "_bandwidth",
+        "_calls",
+        "_calls_lock",
+        "_calls_stopping",
+        "_closing",
+        "_color",
+        "_color_depth",
+        "_color_warned",
+        "_context_token",
+        "_continued",
+        "_cur_line_len",
+        "_delay",
+        "_drawn_cells",
+        "_drawn_key",
+        "_fitted_text",
+        "_frame_cache_enabled",
+        "_full_redraw_at",
+        "_hidden_level",
+        "_hidden_lock",
+        "_hide_spin",
+        "_idle_after",
+        "_idle_floor",
+        "_idle_text",
+        "_idling",
+        "_job_fd",
+        "_last_activity",
+        "_last_frame",
+        "_min_visible",
+        "_on_color",
+        "_pad_frames",
+        "_painted_text",
+        "_palette",
+        "_parked_spin",
+        "_pending",
+        "_pending_start",
+        "_resume_spin",
+        "_render_state",
+        "_reuse_thread",
+        "_reversal",
+        "_shown_at",
+        "_sigmap",
+        "_spin_frame",
+        "_spin_thread",
+        "_spinner",
+        "_start_time",
+        "_started",
+        "_stop_spin",
+        "_stop_time",
+        "_stream",
+        "_stream_lock",
+        "_terminal_width",
+        "_text_palette",
+        "_timer",
+        "_update_lock",
+        "_wake_spin",
+    )
+
     # When Python finds its output attached to a terminal,
     # it sets the sys.stdout.encoding attribute to the terminal's encoding.
     # The print statement's handler will automatically encode unicode
@@ -147,61 +637,139 @@ class Yaspin:
         self,
         spinner: Spinner = default_spinner,
         text: str = "",
-        color: str | None = None,
-        on_color: str | None = None,
+        color: Color | None = None,
+        on_color: Color | None = None,
         attrs: Sequence[str] | None = None,
+        palette: Sequence[Color] | None = None,
+        text_palette: Sequence[Color] | None = None,
         reversal: bool = False,
         side: str = "left",
         sigmap: dict[signal.Signals, SignalHandlers] | None = None,
-        timer: bool = False,
+        timer: bool | TimerFormat = False,
         ellipsis: str = "",
         stream: TextIO | None = None,
         warn_on_closed_stream: bool = False,
+        max_bandwidth: int | None = None,
+        pad_frames: bool = False,
+        delay: float = 0,
+        min_visible: float = 0,
+        reuse_thread: bool = False,
+        idle_after: float | None = None,
+        idle_fps: float = 1,
     ) -> None:
         # Stream
         raw_stream = stream or sys.stdout
         self._stream = SafeStreamWrapper(raw_stream, warn_on_closed=warn_on_closed_stream)
+        # Unlike the rest of the locks and events, created on start, the
+        # stream and update locks guard the spinners that are never started
         self._stream_lock = threading.Lock()
+        # Frame cache of the render state holds the output written into
+        # the file descriptor, so it is used for such TTY streams only
+        self._frame_cache_enabled = self._stream.direct and self._stream.isatty()
 
         # Spinner
         self._spinner = self._set_spinner(spinner)
-        self._frames = self._set_frames(self._spinner, reversal)
-        self._interval = self._set_interval(self._spinner)
-        self._cycle = self._set_cycle(self._frames)
+        self._reversal = reversal
+        self._pad_frames = pad_frames
         # Color Specification
-        self._color = self._set_color(color) if color else color
-        self._on_color = self._set_on_color(on_color) if on_color else on_color
-        self._attrs = self._set_attrs(attrs) if attrs else set()
-        self._color_func = self._compose_color_func()
+        # Terminal capabilities are checked once, styles are compiled
+        # into escape sequences on every change of color specification.
+        self._ansi_codes = self._supports_ansi_codes()
+        self._color_depth = detect_color_depth(raw_stream) if self._ansi_codes else ColorDepth.NONE
+        self._color_warned = False
+        self._color = self._set_color(color) if _is_set(color) else color
+        self._on_color = self._set_on_color(on_color) if _is_set(on_color) else on_color
+        self._attrs = self._set_attrs(attrs) if attrs else NO_ATTRS
+        self._palette = self._set_palette(palette) if palette else None
+        self._text_palette = self._set_palette(text_palette) if text_palette else None
+        # (text, text codes, painted text) of the last painted text
+        self._painted_text: tuple[str, list[tuple[str, str]], str] | None = None
+
+        # Render state, replaced as a whole once the changes applied since
+        # it was composed are read, see ``_state``. The first one is only
+        # composed once read, so spinners that are never started take no
+        # frame cycles.
+        self._set_side(side)
+        self._render_state: RenderState | None = None
+        self._pending: Mapping[str, Any] | None = NO_CHANGES
+        if text or ellipsis or side != "left":
+            self._pending = {"text": text, "side": side, "ellipsis": ellipsis}
+        self._update_lock = threading.Lock()
 
         # Other
-        self._text = text
-        self._side = self._set_side(side)
-        self._reversal = reversal
-        self._timer = timer
-        self._ellipsis = ellipsis
+        self._timer = self._set_timer(timer)
         self._terminal_width: int = shutil.get_terminal_size().columns
-        self._start_time: float | None = None
-        self._stop_time: float | None = None
+        # (text, max width, ellipsis, truncated text, its width) of the last fit
+        self._fitted_text: tuple[str, int, str, str, int] | None = None
+        # Monotonic clock readings, in nanoseconds
+        self._start_time: int | None = None
+        self._started = False
+        self._stop_time: int | None = None
+
+        # Delayed start
+        self._delay = self._set_duration("delay", delay)
+        self._min_visible = self._set_duration("min_visible", min_visible)
+        self._pending_start: ScheduledCall | None = None
+        # Restores the previous current spinner of the context on stop
+        self._context_token: Token[Yaspin | None] | None = None
+        self._shown_at: float | None = None
+
+        # Idle slowdown; the event wakes up the idle spinner on activity,
+        # and is only created if the slowdown is enabled
+        self._idle_after = self._set_duration("idle_after", idle_after) if idle_after is not None else None
+        self._idle_floor = self._set_idle_floor(idle_fps)
+        self._activity = threading.Event() if idle_after is not None else None
+        self._last_activity = 0.0
+        self._idling = False
+        self._idle_text: str | None = None
 
         # Helper flags
         self._stop_spin: threading.Event | None = None
         self._hide_spin: threading.Event | None = None
         self._spin_thread: threading.Thread | None = None
+        # Cleared while a nested spinner takes over the line
+        self._resume_spin: threading.Event | None = None
+        # Parked spin thread, kept between runs if ``reuse_thread`` is set.
+        # The events are only created for such spinners.
+        self._reuse_thread = reuse_thread
+        self._wake_spin = threading.Event() if reuse_thread else None
+        self._parked_spin = threading.Event() if reuse_thread else None
+        self._closing = False
         self._last_frame: str | None = None
+        # (frame, painted frame) drawn last by the spin thread, replaced as
+        # a whole, so other threads never see a frame with another's colors
+        self._spin_frame: tuple[str, str | None] | None = None
         self._hidden_level = 0
+        self._hidden_lock: threading.Lock | None = None
+        # Calls of the decorated functions in flight; the lock is created
+        # once the spinner decorates a function
+        self._calls = 0
+        self._calls_lock: threading.Lock | None = None
+        # Set while the last call in flight stops the spinner
+        self._calls_stopping = False
         self._cur_line_len = 0
+        # Job control; frames are not written while the process is in the
+        # background. Only checked for terminals with a file descriptor.
+        is_terminal = self._stream.fd is not None and self._stream.isatty()
+        self._job_fd = self._stream.fd if is_terminal and hasattr(os, "tcgetpgrp") else None
+        self._continued: threading.Event | None = None
+        self._backgrounded = False
+        # Output budget in bytes per second, None for unlimited
+        self._bandwidth = self._set_bandwidth(max_bandwidth)
+        # Cells of the line drawn by the last frame (TTY streams only), and
+        # the frame key if the cells can be looked up in the frame cache.
+        self._drawn_cells: tuple[Cell, ...] | None = None
+        self._drawn_key: str | None = None
+        # Monotonic time of the next full rewrite of the line
+        self._full_redraw_at = 0.0
 
         # Signals
-        self._sigmap = sigmap if sigmap else {}
-        # Maps signals to their default handlers in order to reset
-        # custom handlers set by ``sigmap`` at the cleanup phase.
-        self._dfl_sigmap: dict[signal.Signals, SignalHandlers] = {}
+        self._sigmap = sigmap if sigmap else NO_SIGNALS
 
     # Dunders
     #
     def __repr__(self) -> str:
-        return f"<Yaspin frames={self._frames!s}>"
+        return f"<Yaspin frames={self._state.frames!s}>"
 
     def __enter__(self) -> Yaspin:
         self.start()
@@ -213,83 +781,102 @@ class Yaspin:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if self._spin_thread is None:
+        if self._spin_thread is None and self._stop_spin is None:
             raise RuntimeError("spin thread is None")
         # Avoid stop() execution for the 2nd time
-        if self._spin_thread.is_alive():
+        if self._is_active():
             self.stop()
 
     def __call__(self, fn: Fn) -> Fn:
+        # Concurrent and recursive calls share the spinner: it is started
+        # by the first call in flight and stopped by the last one, while
+        # the text shows the number of calls in flight.
+        if self._calls_lock is None:
+            self._calls_lock = threading.Lock()
+
         @functools.wraps(fn)
         def inner(*args: Any, **kwargs: Any) -> Fn:
-            with self:
+            # Looked up on every call, as the lock is replaced in the child
+            # process after a fork
+            calls_lock = cast(threading.Lock, self._calls_lock)
+            with calls_lock:
+                self._calls += 1
+                # The spinner being stopped is started again by the call
+                # stopping it, see below
+                if self._calls == 1 and not self._calls_stopping:
+                    try:
+                        self.start()
+                    except BaseException:
+                        # The next call starts the spinner over
+                        self._calls -= 1
+                        raise
+            try:
                 return fn(*args, **kwargs)
+            finally:
+                with calls_lock:
+                    self._calls -= 1
+                    # Avoid stop() execution for the 2nd time
+                    stopping = self._calls == 0 and not self._calls_stopping and self._is_active()
+                    self._calls_stopping = stopping
+                # Stopped without the lock, as it may take a while, e.g. to
+                # keep the spinner visible for ``min_visible``, so the calls
+                # made in the meantime are not held up
+                if stopping:
+                    try:
+                        self.stop()
+                    finally:
+                        with calls_lock:
+                            self._calls_stopping = False
+                            if self._calls:
+                                self.start()
 
         return cast(Fn, inner)
 
     def __getattr__(self, name: str) -> Yaspin:
-        # CLI spinners
-        if name in SPINNER_ATTRS:
-            from .spinners import Spinners
-
-            sp = getattr(Spinners, name)
-            self.spinner = sp
-        # Color Attributes: "color", "on_color", "attrs"
-        elif name in set(key for d in [ATTRIBUTES, COLORS, HIGHLIGHTS] for key in d):
-            # Call appropriate property setters;
-            # _color_func is updated automatically by setters.
-            if name in ATTRIBUTES:
-                self.attrs = [name]  # calls property setter
-            if name in COLORS:
-                self.color = name  # calls property setter
-            if name in HIGHLIGHTS:
-                self.on_color = name  # calls property setter
-        # Side: "left" or "right"
-        elif name in ("left", "right"):
-            self.side = name  # calls property setter
-        # Common error for unsupported attributes
-        else:
+        # Fluent interface: CLI spinners, colors, highlights, attributes
+        # and sides. Goes through the same validation and state swap
+        # as ``update``.
+        changes = _fluent_changes(name)
+        if changes is None:
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute: '{name}'")
+        self._apply(changes)
         return self
 
     # Properties
     #
+    # Setters go through the same validation and state swap as ``update``,
+    # while the change is picked up by the next frame.
     @property
     def spinner(self) -> Spinner:
         return self._spinner
 
     @spinner.setter
     def spinner(self, sp: Spinner) -> None:
-        self._spinner = self._set_spinner(sp)
-        self._frames = self._set_frames(self._spinner, self._reversal)
-        self._interval = self._set_interval(self._spinner)
-        self._cycle = self._set_cycle(self._frames)
+        self._apply({"spinner": sp})
 
     @property
     def text(self) -> str:
-        return self._text
+        return self._state.text
 
     @text.setter
     def text(self, txt: str) -> None:
-        self._text = txt
+        self._apply({"text": txt})
 
     @property
-    def color(self) -> str | None:
+    def color(self) -> Color | None:
         return self._color
 
     @color.setter
-    def color(self, value: str) -> None:
-        self._color = self._set_color(value) if value else value
-        self._color_func = self._compose_color_func()  # update
+    def color(self, value: Color | None) -> None:
+        self._apply({"color": value})
 
     @property
-    def on_color(self) -> str | None:
+    def on_color(self) -> Color | None:
         return self._on_color
 
     @on_color.setter
-    def on_color(self, value: str) -> None:
-        self._on_color = self._set_on_color(value) if value else value
-        self._color_func = self._compose_color_func()  # update
+    def on_color(self, value: Color | None) -> None:
+        self._apply({"on_color": value})
 
     @property
     def attrs(self) -> Sequence[str]:
@@ -297,25 +884,51 @@ class Yaspin:
 
     @attrs.setter
     def attrs(self, value: Sequence[str]) -> None:
-        new_attrs = self._set_attrs(value) if value else set()
-        self._attrs = self._attrs.union(new_attrs)
-        self._color_func = self._compose_color_func()  # update
+        self._apply({"attrs": value})
+
+    @property
+    def style(self) -> Style:
+        return Style(
+            self._color if _is_set(self._color) else None,
+            self._on_color if _is_set(self._on_color) else None,
+            self._attrs,
+        )
+
+    @style.setter
+    def style(self, value: Style) -> None:
+        self._apply({"style": value})
+
+    @property
+    def palette(self) -> Sequence[Color] | None:
+        return self._palette
+
+    @palette.setter
+    def palette(self, value: Sequence[Color] | None) -> None:
+        self._apply({"palette": value})
+
+    @property
+    def text_palette(self) -> Sequence[Color] | None:
+        return self._text_palette
+
+    @text_palette.setter
+    def text_palette(self, value: Sequence[Color] | None) -> None:
+        self._apply({"text_palette": value})
 
     @property
     def side(self) -> str:
-        return self._side
+        return self._state.side
 
     @side.setter
     def side(self, value: str) -> None:
-        self._side = self._set_side(value)
+        self._apply({"side": value})
 
     @property
     def ellipsis(self) -> str:
-        return self._ellipsis
+        return self._state.ellipsis
 
     @ellipsis.setter
     def ellipsis(self, value: str) -> None:
-        self._ellipsis = value
+        self._apply({"ellipsis": value})
 
     @property
     def reversal(self) -> bool:
@@ -323,20 +936,60 @@ class Yaspin:
 
     @reversal.setter
     def reversal(self, value: bool) -> None:
-        self._reversal = value
-        self._frames = self._set_frames(self._spinner, self._reversal)
-        self._cycle = self._set_cycle(self._frames)
+        self._apply({"reversal": value})
+
+    @property
+    def pad_frames(self) -> bool:
+        return self._pad_frames
+
+    @pad_frames.setter
+    def pad_frames(self, value: bool) -> None:
+        self._apply({"pad_frames": value})
 
     @property
     def elapsed_time(self) -> float:
-        if self._start_time is None:
-            return 0
-        if self._stop_time is None:
-            return time.time() - self._start_time
-        return self._stop_time - self._start_time
+        return self._elapsed_ns() / NS_PER_SEC
+
+    @property
+    def stream_closed(self) -> bool:
+        return self._stream.lost
+
+    @property
+    def _state(self) -> RenderState:
+        # The pending changes are composed into a new state on read, e.g. by
+        # the next frame, so a chain of changes such as ``sp.red.bold.dots``
+        # builds a single state
+        if self._pending is not None:
+            with self._update_lock:
+                self._compose_pending()
+        # There is no state until the first one is composed above
+        return cast(RenderState, self._render_state)
 
     # Public
     #
+    def update(self, **changes: Any) -> None:
+        """
+        Change several properties of the spinner at once.
+
+        Accepts the properties as keyword arguments: ``spinner``, ``text``,
+        ``color``, ``on_color``, ``attrs``, ``style``, ``palette``,
+        ``text_palette``, ``side``, ``reversal``, ``ellipsis`` and
+        ``pad_frames``. All of the values are validated before any of them
+        is applied, then the new render state replaces the old one at once,
+        and the running spinner is redrawn.
+
+        Example::
+
+            sp.update(text="Downloading", color="cyan", spinner=Spinners.arc)
+
+        Raises:
+            TypeError: If an unknown property is passed.
+            ValueError: If any of the values is not supported. None of the
+                properties are changed in this case.
+        """
+        self._apply(changes)
+        self._refresh(changes)
+
     def start(self) -> None:
         """
         Start the spinner animation in a separate thread.
@@ -347,21 +1000,67 @@ class Yaspin:
 
         If signal handlers are registered, they will be set up before starting the spinner.
 
+        If ``delay`` is set, the spinner thread is started only once the delay
+        expires, so the spinner stopped earlier leaves no output at all.
+
+        If ``reuse_thread`` is set, the parked thread of the previous run is
+        woken up instead of creating a new one.
+
         In case of any failure that prevents the spinner from starting, the cursor will
         be shown to ensure it is not left hidden.
+
+        Raises:
+            RuntimeError: If the spinner is closed.
         """
+        if self._closing:
+            raise RuntimeError("spinner is closed")
+
         if self._sigmap:
             self._register_signal_handlers()
+        if self._job_fd is not None:
+            self._register_job_handlers()
 
-        self._hide_cursor()
-        self._start_time = time.time()
+        self._start_time = time.monotonic_ns()
         # Reset value to properly calculate subsequent spinner starts (if any)
         self._stop_time = None
-        self._stop_spin = threading.Event()
-        self._hide_spin = threading.Event()
-        self._spin_thread = threading.Thread(target=self._spin)
+        if self._resume_spin is None:
+            self._resume_spin = threading.Event()
+            self._hidden_lock = threading.Lock()
+        self._resume_spin.set()
+        if self._reuse_thread and self._stop_spin is not None and self._hide_spin is not None:
+            self._stop_spin.clear()
+            self._hide_spin.clear()
+        else:
+            self._stop_spin = threading.Event()
+            self._hide_spin = threading.Event()
+
+        self._started = True
+        self._context_token = context._enter(self)
+
+        if self._activity is not None:
+            self._activity.clear()
+            self._last_activity = time.monotonic()
+        if self._job_fd is not None:
+            if self._continued is None:
+                self._continued = threading.Event()
+            self._continued.clear()
+        self._backgrounded = False
+
+        if self._delay:
+            self._pending_start = scheduler.call_later(self._delay, self._start_thread)
+        else:
+            self._start_thread()
+
+    def _start_thread(self) -> None:
+        self._push_spinner()
+        self._hide_cursor()
+        self._shown_at = time.monotonic()
         try:
-            self._spin_thread.start()
+            if self._reuse_thread:
+                self._wake_parked_thread()
+            else:
+                self._spin_thread = threading.Thread(target=self._spin)
+                self._spin_thread.start()
         finally:
             # Ensure cursor is not hidden if any failure occurs that prevents
             # getting it back
@@ -375,23 +1074,79 @@ class Yaspin:
         they were modified, stops the spinning thread, clears the spinner
         line, and shows the cursor.
 
+        If the delayed start is still pending, it is cancelled and nothing
+        is written to the stream. If the spinner is shown for less than
+        ``min_visible`` seconds, waits for the remaining time first.
+
         Raises:
             RuntimeError: If the stop_spin event is None.
         """
-        self._stop_time = time.time()
+        self._stop_time = time.monotonic_ns()
 
-        if self._dfl_sigmap:
-            # Reset registered signal handlers to default ones
+        self._started = False
+        context._exit(self, self._context_token)
+        self._context_token = None
+
+        if self._sigmap or self._job_fd is not None:
+            # Stop routing the signals to the handlers of the spinner
             self._reset_signal_handlers()
 
+        pending, self._pending_start = self._pending_start, None
+        if pending is not None:
+            if pending.cancel():
+                return
+            # The delay has just expired, let the spinner start complete
+            pending.wait()
+
+        if self._min_visible and self._shown_at is not None:
+            remaining = self._shown_at + self._min_visible - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+        self._shown_at = None
+
         if self._spin_thread is not None:
             if self._stop_spin is None:
                 raise RuntimeError("stop_spin event is None")
             self._stop_spin.set()
-            self._spin_thread.join()
+            # Wake up the suspended or idle spinner, so it sees the stop flag
+            if self._resume_spin is not None:
+                self._resume_spin.set()
+            if self._activity is not None:
+                self._activity.set()
+            if self._continued is not None:
+                self._continued.set()
+            if self._parked_spin is not None and self._spin_thread.is_alive():
+                self._parked_spin.wait()
+            else:
+                self._spin_thread.join()
+
+        owns_line, outer = self._pop_spinner()
+        if owns_line:
+            with self._stream_lock:
+                # The line of the background job is left alone, while the
+                # cursor is shown in any case
+                if self._job_fd is None or _is_foreground(self._job_fd):
+                    self._clear_line()
+                self._show_cursor()
+        if outer is not None:
+            cast(threading.Event, outer._resume_spin).set()
+
+    def close(self) -> None:
+        """
+        Stop the spinner, if it is running, and terminate the parked spin thread.
 
-        self._clear_line()
-        self._show_cursor()
+        Only needed for spinners created with ``reuse_thread=True``, whose
+        thread is kept between the runs. The spinner can not be restarted
+        once closed.
+        """
+        if self._is_active():
+            self.stop()
+
+        thread = self._spin_thread
+        if self._wake_spin is not None and thread is not None and thread.is_alive():
+            self._closing = True
+            self._wake_spin.set()
+            thread.join()
 
     def hide(self) -> None:
         """
@@ -405,15 +1160,22 @@ class Yaspin:
         Raises:
             RuntimeError: If the hide_spin attribute is None.
         """
-        thr_is_alive = self._spin_thread and self._spin_thread.is_alive()
+        thr_is_alive = self._is_spinning()
         if self._hide_spin is None:
             raise RuntimeError("hide_spin is None")
 
-        if thr_is_alive and not self._hide_spin.is_set():
+        if not thr_is_alive and self._pending_start is not None:
+            # Start hidden once the delay expires
+            self._hide_spin.set()
+        elif thr_is_alive:
             with self._stream_lock:
+                # Checked under the lock, so concurrent calls clear once
+                if self._hide_spin.is_set():
+                    return
                 # set the hidden spinner flag
                 self._hide_spin.set()
-                self._clear_line()
+                if not self._is_suspended():
+                    self._clear_line()
 
                 # flush the stream buffer so the current line
                 # can be rewritten to
@@ -430,15 +1192,21 @@ class Yaspin:
         Yields:
             None: This method is a generator that yields control back to the caller.
         """
-        if self._hidden_level == 0:
-            self.hide()
-        self._hidden_level += 1
+        hidden_lock = self._hidden_lock
+        if hidden_lock is None:
+            # Never started, so there is nothing to hide
+            raise RuntimeError("hide_spin is None")
+        with hidden_lock:
+            if self._hidden_level == 0:
+                self.hide()
+            self._hidden_level += 1
         try:
             yield
         finally:
-            self._hidden_level -= 1
-            if self._hidden_level == 0:
-                self.show()
+            with hidden_lock:
+                self._hidden_level -= 1
+                if self._hidden_level == 0:
+                    self.show()
 
     def show(self) -> None:
         """
@@ -452,16 +1220,23 @@ class Yaspin:
         Raises:
             RuntimeError: If the `_hide_spin` attribute is `None`.
         """
-        thr_is_alive = self._spin_thread and self._spin_thread.is_alive()
+        thr_is_alive = self._is_spinning()
         if self._hide_spin is None:
             raise RuntimeError("hide_spin is None")
 
-        if thr_is_alive and self._hide_spin.is_set():
+        self._mark_active()
+        if not thr_is_alive and self._pending_start is not None:
+            self._hide_spin.clear()
+        elif thr_is_alive:
             with self._stream_lock:
+                # Checked under the lock, so concurrent calls redraw once
+                if not self._hide_spin.is_set():
+                    return
                 # clear the hidden spinner flag
                 self._hide_spin.clear()
                 # clear the current line so the spinner is not appended to it
-                self._clear_line()
+                if not self._is_suspended():
+                    self._clear_line()
 
     def write(self, text: str) -> None:
         """
@@ -473,6 +1248,13 @@ class Yaspin:
         Args:
             text (str): The text to be written to the terminal.
         """
+        self._mark_active()
+        # Messages of the suspended spinner go above the nested one
+        owner = self._line_owner()
+        if owner is not self:
+            owner.write(text)
+            return
+
         # similar to tqdm.write()
         # https://pypi.python.org/pypi/tqdm#writing-messages
         with self._stream_lock:
@@ -481,6 +1263,73 @@ class Yaspin:
             self._stream.write(f"{_text}\n")
             self._cur_line_len = 0
 
+    def writelines(self, lines: Iterable[Any]) -> None:
+        """
+        Write multiple lines in the terminal without breaking the spinner.
+
+        Equivalent to calling ``write`` for every item of ``lines``, but the
+        stream lock is taken and the spinner line is cleared only once. Lines
+        are joined and written in chunks, so large iterables (e.g. generators)
+        are streamed instead of being materialized. The spinner is redrawn
+        once all lines are written.
+
+        Args:
+            lines (Iterable): Items to be written, one per line. Bytes are
+                decoded, other non-str objects are converted with ``str``.
+        """
+        self._mark_active()
+        owner = self._line_owner()
+        if owner is not self:
+            owner.writelines(lines)
+            return
+
+        with self._stream_lock:
+            self._clear_line()
+            chunk: list[str] = []
+            try:
+                for line in lines:
+                    if not isinstance(line, str):
+                        line = to_unicode(line) if isinstance(line, bytes) else str(line)
+                    chunk.append(line)
+                    if len(chunk) == WRITE_CHUNK_SIZE:
+                        chunk.append("")  # trailing newline
+                        self._stream.write("\n".join(chunk))
+                        chunk = []
+            finally:
+                # Lines taken before ``lines`` raised are written all the same
+                if chunk:
+                    chunk.append("")
+                    self._stream.write("\n".join(chunk))
+                self._cur_line_len = 0
+                self._redraw()
+
+    def write_bytes(self, data: bytes) -> None:
+        """
+        Write pre-encoded text in the terminal without breaking the spinner.
+
+        The data is passed to the binary buffer of the stream as is, without
+        decoding and re-encoding it, when the stream exposes one. A trailing
+        newline is added if ``data`` does not end with one. The spinner is
+        redrawn once the data is written.
+
+        Args:
+            data (bytes): Encoded text to be written to the terminal.
+        """
+        self._mark_active()
+        owner = self._line_owner()
+        if owner is not self:
+            owner.write_bytes(data)
+            return
+
+        if not data.endswith(b"\n"):
+            data += b"\n"
+
+        with self._stream_lock:
+            self._clear_line()
+            self._stream.write_bytes(data)
+            self._cur_line_len = 0
+            self._redraw()
+
     def ok(self, text: str = "OK") -> None:
         """Set Ok (success) finalizer to a spinner."""
         _text = text if text else "OK"
@@ -526,24 +1375,165 @@ class Yaspin:
             RuntimeError: If the last frame is None.
         """
         text = to_unicode(final_text)
-        self._last_frame = self._compose_out(text, mode="last")
+        last_frame = self._last_frame = self._compose_out(text, mode="last")
+        # The final line of the suspended spinner goes above the nested one
+        owner = self._line_owner()
 
         # Should be stopped here, otherwise prints after
         # self._freeze call will mess up the spinner
         self.stop()
+        if owner is not self:
+            owner.write(last_frame.removesuffix("\n"))
+            return
         with self._stream_lock:
-            if self._last_frame is None:
+            if last_frame is None:
                 raise RuntimeError("last_frame is None")
-            self._stream.write(self._last_frame)
+            self._stream.write(last_frame)
             self._cur_line_len = 0
 
+    def _push_spinner(self) -> None:
+        """
+        Put the spinner on top of the stack of its stream, suspending
+        the outer spinner, if there is one.
+        """
+        with _spinner_stacks_lock:
+            stack = _spinner_stacks.setdefault(id(self._stream._stream), [])
+            if self in stack:
+                # Started again without being stopped
+                return
+            outer = stack[-1] if stack else None
+            stack.append(self)
+        if outer is not None:
+            outer._suspend()
+
+    def _pop_spinner(self) -> tuple[bool, Yaspin | None]:
+        """
+        Remove the spinner from the stack of its stream.
+
+        Returns:
+            tuple: Whether the spinner owned the line, i.e. was the innermost
+                   one, and the outer spinner to be resumed, if any.
+        """
+        key = id(self._stream._stream)
+        with _spinner_stacks_lock:
+            stack = _spinner_stacks.get(key)
+            if not stack or self not in stack:
+                return True, None
+            owns_line = stack[-1] is self
+            stack.remove(self)
+            outer = stack[-1] if stack and owns_line else None
+            if not stack:
+                del _spinner_stacks[key]
+        return owns_line, outer
+
+    def _line_owner(self) -> Yaspin:
+        """Return the spinner currently rendering the line of the stream."""
+        if not self._is_suspended():
+            return self
+        with _spinner_stacks_lock:
+            stack = _spinner_stacks.get(id(self._stream._stream))
+            return stack[-1] if stack else self
+
+    def _suspend(self) -> None:
+        """Stop rendering and clear the line, which is taken by a nested spinner."""
+        with self._stream_lock:
+            cast(threading.Event, self._resume_spin).clear()
+            self._clear_line()
+            self._stream.flush()
+
+    def _is_suspended(self) -> bool:
+        resume = self._resume_spin
+        return resume is not None and not resume.is_set()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Leave the copy of the running spinner in the child process stopped,
+        so it writes no frames and can be started again. Locks and events
+        are replaced, as they may be held by the threads of the parent.
+        """
+        self._stream_lock = threading.Lock()
+        self._update_lock = threading.Lock()
+        if self._hidden_lock is not None:
+            self._hidden_lock = threading.Lock()
+        if self._calls_lock is not None:
+            self._calls_lock = threading.Lock()
+        self._calls_stopping = False
+
+        self._spin_thread = None
+        self._started = False
+        self._pending_start = None
+        self._context_token = None
+        self._shown_at = None
+        self._stop_time = time.monotonic_ns()
+        self._stop_spin = threading.Event()
+        self._stop_spin.set()
+        hidden = self._hide_spin is not None and self._hide_spin.is_set()
+        self._hide_spin = threading.Event()
+        if hidden:
+            self._hide_spin.set()
+        if self._resume_spin is not None:
+            self._resume_spin = threading.Event()
+            self._resume_spin.set()
+        if self._reuse_thread:
+            self._wake_spin = threading.Event()
+            self._parked_spin = threading.Event()
+        if self._activity is not None:
+            self._activity = threading.Event()
+        if self._continued is not None:
+            self._continued = threading.Event()
+        self._idling = False
+        self._backgrounded = False
+        self._drawn_cells = None
+        self._drawn_key = None
+
+    def _is_active(self) -> bool:
+        # Started and not stopped yet, even if the spin thread has ended,
+        # e.g. on a broken pipe, as stopping releases the signal handlers,
+        # the current spinner and the line of the stream
+        return self._started
+
+    def _is_spinning(self) -> bool:
+        thread = self._spin_thread
+        if thread is None or not thread.is_alive():
+            return False
+        # Parked thread is alive, but does not spin
+        return self._parked_spin is None or not self._parked_spin.is_set()
+
+    def _wake_parked_thread(self) -> None:
+        if self._wake_spin is None or self._parked_spin is None:
+            raise RuntimeError("spin thread is not reused")
+
+        self._parked_spin.clear()
+        if self._spin_thread is None or not self._spin_thread.is_alive():
+            self._spin_thread = threading.Thread(target=self._run_parked, name="yaspin", daemon=True)
+            self._spin_thread.start()
+        self._wake_spin.set()
+
+    def _run_parked(self) -> None:
+        """
+        Run the spinner animation on every wake up, parking in between.
+        """
+        wake, parked = self._wake_spin, self._parked_spin
+        if wake is None or parked is None:
+            raise RuntimeError("spin thread is not reused")
+
+        while True:
+            wake.wait()
+            wake.clear()
+            if self._closing:
+                return
+            try:
+                self._spin()
+            finally:
+                parked.set()
+
     def _spin(self) -> None:
         """
         Handles the spinning animation.
 
         Continuously updates the spinner's output on the terminal until
-        the `_stop_spin` event is set. If the `_hide_spin` event is set,
-        it temporarily pauses the spinning.
+        the `_stop_spin` event is set, or the stream is closed or broken.
+        If the `_hide_spin` event is set, it temporarily pauses the spinning.
 
         Raises:
             RuntimeError: If `_stop_spin` is None.
@@ -551,46 +1541,506 @@ class Yaspin:
         if self._stop_spin is None:
             raise RuntimeError("stop_spin is None")
 
+        # Frames are timed by the deadlines on the monotonic clock, so the
+        # time taken by rendering does not add up, and a frame held for long
+        # costs a single wakeup.
+        deadline = time.monotonic()
+        idle_interval = 0.0
         while not self._stop_spin.is_set():
+            if self._stream.lost:
+                # Nobody reads the output, e.g. ``| head`` exited; the thread
+                # ends, or gets parked if reused, until the spinner stops
+                break
+
+            resume = self._resume_spin
+            if resume is not None and not resume.is_set():
+                # Suspended by a nested spinner until it stops
+                resume.wait()
+                continue
+
+            # The whole frame is rendered from a single state, which
+            # may be replaced by ``update`` at any time
+            state = self._state
+
             if self._hide_spin is not None and self._hide_spin.is_set():
                 # Wait a bit to avoid wasting cycles
-                time.sleep(self._interval)
+                time.sleep(state.interval)
                 continue
 
-            # Compose output
-            spin_phase = next(self._cycle)
-            out = self._compose_out(spin_phase)
+            if self._job_fd is not None and not self._check_foreground():
+                continue
+
+            # Animated colors are looked up in the precomputed table,
+            # otherwise the static style is applied by _compose_out
+            if state.painted_cycle is not None:
+                spin_phase, painted = next(state.painted_cycle)
+            else:
+                spin_phase, painted = next(state.cycle), None
+            self._spin_frame = (spin_phase, painted)
+            written = self._render_frame(spin_phase, painted, state)
+
+            # Wait; frame rate is lowered to keep the output within the
+            # bandwidth budget, if there is any.
+            interval = next(state.timeline) if state.timeline is not None else state.interval
+            if self._bandwidth is not None:
+                interval = max(interval, written / self._bandwidth)
+            if self._activity is not None:
+                idle_interval = self._slow_down(interval, idle_interval)
+                interval = max(interval, idle_interval)
+            now = time.monotonic()
+            # Start over if fell behind, e.g. after being hidden
+            deadline = max(deadline + interval, now)
+
+            if not idle_interval or self._activity is None:
+                self._stop_spin.wait(deadline - now)
+                continue
+            if self._timer is not None and idle_interval >= self._idle_floor:
+                # Draw the idle frames as the displayed time changes, i.e.
+                # half a unit early as the timer rounds, so it is not late
+                elapsed = (self._elapsed_ns() + self._timer._unit // 2) / NS_PER_SEC
+                deadline = now + idle_interval - elapsed % idle_interval
+            if self._activity.wait(deadline - now):
+                # Snap back to the full frame rate
+                self._activity.clear()
+                deadline = time.monotonic()
+
+    def _check_foreground(self) -> bool:
+        """
+        Check if the process is in the foreground of the terminal.
+
+        Frames written by a background job scribble over the foreground one,
+        or stop the process with SIGTTOU, so the background spinner waits for
+        ``BACKGROUND_POLL`` seconds or until SIGCONT instead. Once back in the
+        foreground, the cursor is hidden again and the line is redrawn.
+        """
+        if _is_foreground(cast(int, self._job_fd)):
+            if self._backgrounded:
+                self._backgrounded = False
+                with self._stream_lock:
+                    # The line may have been overwritten meanwhile
+                    self._drawn_cells = None
+                    self._drawn_key = None
+                    self._hide_cursor()
+            return True
+
+        self._backgrounded = True
+        continued = cast(threading.Event, self._continued)
+        continued.wait(BACKGROUND_POLL)
+        continued.clear()
+        return False
+
+    def _slow_down(self, interval: float, idle_interval: float) -> float:
+        """
+        Return the frame interval of the idle spinner, or 0 if it is active.
+
+        The interval grows by ``IDLE_DECAY`` on every frame, from the regular
+        interval up to the floor set by ``idle_fps``.
+        """
+        # The flag is set before checking the activity, so _mark_active
+        # either sees the flag or its activity is seen here
+        self._idling = True
+        if self._idle_after is None or time.monotonic() - self._last_activity < self._idle_after:
+            self._idling = False
+            return 0.0
+        return min(max(interval, idle_interval) * IDLE_DECAY, self._idle_floor)
+
+    def _mark_active(self) -> None:
+        """Restart the idle countdown, waking up the idle spinner."""
+        if self._activity is None:
+            return
+        self._last_activity = time.monotonic()
+        if self._idling:
+            self._activity.set()
+
+    def _render_frame(self, frame: str, painted: str | None = None, state: RenderState | None = None) -> int:
+        """
+        Write the spinner frame, returning the size of the written output.
+
+        On TTY streams only the cells changed since the previous frame
+        are rewritten. Other streams get the whole line rewritten.
+        """
+        state = state or self._state
+        if self._ansi_codes:
+            return self._write_frame_diff(frame, painted, state)
+
+        before, styled, after, width = self._compose_segments(frame, painted, state)
+        with self._stream_lock:
+            if self._is_suspended():
+                return 0
+            written = self._write_out(f"{self._get_clear_seq()}\r{before}{styled}{after}")
+            self._cur_line_len = max(self._cur_line_len, width)
+        return written
+
+    def _write_frame_diff(self, frame: str, painted: str | None, state: RenderState) -> int:
+        """
+        Rewrite the cells of the line changed since the previous frame.
+
+        The drawn line is kept as a sequence of cells. Falls back to the full
+        line rewrite if the line was cleared, contains control sequences
+        that can not be modeled, or if the difference is not smaller. The
+        whole line is also rewritten every ``FULL_REDRAW_INTERVAL`` seconds,
+        as the terminal may have been written to past the spinner.
+
+        For streams with a file descriptor the encoded output is cached per
+        pair of the previous and current frames, as long as the output does
+        not change between the cycles, i.e. the text is a plain string, the
+        timer is disabled and there are no concurrent decorated calls.
+        """
+        cacheable = not self._timer and isinstance(state.text, str) and self._calls < 2
+        frame_cache = state.frame_cache if cacheable else None
+        key = frame if painted is None else painted
 
-            # Write
+        if frame_cache is not None:
             with self._stream_lock:
-                self._clear_line()
-                self._stream.write(out)
-                self._stream.flush()
-                self._cur_line_len = max(self._cur_line_len, len(out))
+                if self._is_suspended():
+                    return 0
+                self._expire_drawn_line()
+                cached = frame_cache.get((self._drawn_key, key))
+                if cached is not None:
+                    data, cached_cells = cached
+                    if data:
+                        self._stream.write_fd(data)
+                    self._drawn_cells, self._drawn_key = cached_cells, key
+                    return len(data)
+
+        before, styled, after, _ = self._compose_segments(frame, painted, state)
+        cells = line_cells(before, styled, after)
+        full = f"\r{before}{styled}{after}"
+        with self._stream_lock:
+            if self._is_suspended():
+                return 0
+            self._expire_drawn_line()
+            drawn, drawn_key = self._drawn_cells, self._drawn_key
+            clear = self._get_clear_seq()
+            out = None
+            if cells is not None and drawn is not None:
+                out = diff_cells(drawn, cells, limit=len(clear) + len(full))
+            if out is None:
+                out = f"{clear}{full}"
+            written = self._write_out(out) if out else 0
+
+            # Cached output is valid only if drawn cells are tracked by key
+            if frame_cache is not None and cells is not None and (drawn is None) == (drawn_key is None):
+                data = out.encode(self._stream.encoding, self._stream.errors)
+                if state.streamed and len(frame_cache) >= FRAME_CACHE_WINDOW:
+                    # Keep a window of the recent frames only
+                    del frame_cache[next(iter(frame_cache))]
+                frame_cache[(drawn_key, key)] = (data, cells)
+            self._drawn_cells = cells
+            self._drawn_key = key if frame_cache is not None and cells is not None else None
+        return written
+
+    def _expire_drawn_line(self) -> None:
+        """
+        Forget the drawn line if it is due for the full rewrite, or is being
+        rewritten as a whole anyway, restarting the countdown.
 
-            # Wait
-            self._stop_spin.wait(self._interval)
+        Must be called with ``_stream_lock`` held.
+        """
+        now = time.monotonic()
+        if self._drawn_cells is None or now >= self._full_redraw_at:
+            self._drawn_cells = None
+            self._drawn_key = None
+            self._full_redraw_at = now + FULL_REDRAW_INTERVAL
 
-    def _compose_color_func(self) -> Callable[..., str] | None:
+    def _write_out(self, out: str) -> int:
         """
-        Compose a color function based on the current environment.
+        Write the output into the file descriptor of the stream, if it is
+        written to directly, or into the stream itself otherwise. Returns
+        the size of the output.
 
-        If the environment is Jupyter, returns None as ANSI color control sequences
-        are problematic in Jupyter notebooks. Otherwise, returns a partial function
-        that applies the specified color, background color, and attributes to text.
+        Must be called with ``_stream_lock`` held.
         """
-        if not self._supports_ansi_codes():
-            # ANSI Color Control Sequences are problematic in non-TTY streams
-            return None
+        if self._stream.direct:
+            data = out.encode(self._stream.encoding, self._stream.errors)
+            self._stream.write_fd(data)
+            return len(data)
+
+        self._stream.write(out)
+        self._stream.flush()
+        return len(out)
+
+    def _redraw(self) -> None:
+        """
+        Immediately redraw the current spinner frame.
+
+        Does nothing if the spinner is not running or is hidden.
+        Must be called with ``_stream_lock`` held.
+        """
+        thr_is_alive = self._is_spinning()
+        stopping = self._stop_spin is not None and self._stop_spin.is_set()
+        hidden = self._hide_spin is not None and self._hide_spin.is_set()
+        suspended = self._is_suspended() or self._backgrounded
+        spin_frame = self._spin_frame
+        if not thr_is_alive or stopping or hidden or suspended or spin_frame is None:
+            return
+
+        before, styled, after, width = self._compose_segments(*spin_frame)
+        self._stream.write(f"\r{before}{styled}{after}")
+        self._stream.flush()
+        self._cur_line_len = max(self._cur_line_len, width)
+
+    def _refresh(self, changes: Mapping[str, Any]) -> None:
+        """
+        Render the current spinner frame from the new render state.
+
+        Does nothing if the spinner is not running, is hidden or suspended,
+        or if the frame is not a part of the new state, e.g. the spinner
+        was changed; the next frame picks up the new state in this case.
+        """
+        stopping = self._stop_spin is not None and self._stop_spin.is_set()
+        hidden = self._hide_spin is not None and self._hide_spin.is_set()
+        suspended = self._is_suspended() or self._backgrounded
+        if not self._is_spinning() or stopping or hidden or suspended:
+            return
+
+        state = self._state
+        spin_frame = self._spin_frame
+        # Animated colors move on with the next frame
+        if spin_frame is None or state.painted_cycle is not None:
+            return
+        frame = spin_frame[0]
+        if frame not in state.frame_widths and not (state.streamed and FRAME_KEYS.isdisjoint(changes)):
+            return
+        self._render_frame(frame, None, state)
+
+    def _apply(self, changes: Mapping[str, Any]) -> None:
+        """
+        Validate the changes of the properties and swap in the new render state.
+
+        Nothing is changed if any of the values is not valid.
+        """
+        if not UPDATE_KEYS.issuperset(changes):
+            unknown = changes.keys() - UPDATE_KEYS
+            raise TypeError(f"update() got an unexpected keyword argument '{min(unknown)}'")
+
+        # Concurrent updates are applied one after another, each on top
+        # of the properties left by the previous one
+        with self._update_lock:
+            # Validate; the groups of properties left unchanged are skipped,
+            # so changing a single property, e.g. by the fluent interface,
+            # costs no more than its own setter
+            reframe = not FRAME_KEYS.isdisjoint(changes)
+            if reframe:
+                spinner = self._set_spinner(changes["spinner"]) if "spinner" in changes else self._spinner
+                reversal = changes.get("reversal", self._reversal)
+                pad_frames = changes.get("pad_frames", self._pad_frames)
+
+            styled = not ALL_STYLE_KEYS.isdisjoint(changes)
+            if styled:
+                color, on_color, attrs = self._color, self._on_color, self._attrs
+                palette, text_palette = self._palette, self._text_palette
+                if "style" in changes:
+                    # Unlike ``attrs``, replaces all of the color attributes
+                    style = changes["style"]
+                    color = self._set_color(style.color) if _is_set(style.color) else None
+                    on_color = self._set_on_color(style.on_color) if _is_set(style.on_color) else None
+                    attrs = self._set_attrs(sorted(style.attrs)) if style.attrs else NO_ATTRS
+                if "color" in changes:
+                    value = changes["color"]
+                    color = self._set_color(value) if _is_set(value) else value
+                if "on_color" in changes:
+                    value = changes["on_color"]
+                    on_color = self._set_on_color(value) if _is_set(value) else value
+                if "attrs" in changes:
+                    value = changes["attrs"]
+                    attrs = attrs.union(self._set_attrs(value) if value else NO_ATTRS)
+                if "palette" in changes:
+                    palette = self._set_palette(changes["palette"]) if changes["palette"] else None
+                if "text_palette" in changes:
+                    value = changes["text_palette"]
+                    text_palette = self._set_palette(value) if value else None
+            if "side" in changes:
+                self._set_side(changes["side"])
+
+            # Commit; the render state is composed once it is read
+            if reframe:
+                self._spinner, self._reversal, self._pad_frames = spinner, reversal, pad_frames
+            if styled:
+                self._color, self._on_color, self._attrs = color, on_color, attrs
+                self._palette, self._text_palette = palette, text_palette
+            if "text" in changes:
+                self._mark_active()
+            pending = self._pending
+            # Never modified, so the mapping of the caller is kept as is
+            self._pending = changes if pending is None else {**pending, **changes}
+
+    def _compose_pending(self) -> None:
+        """
+        Compose the changes applied since the render state was composed
+        into the new render state.
+
+        Must be called with ``_update_lock`` held.
+        """
+        pending = self._pending
+        if pending is None:
+            return
+        state = self._render_state
+        if state is None:
+            # The first state, everything is composed
+            frames = self._set_frames(self._spinner, self._reversal, self._pad_frames)
+            self._render_state = self._compose_state(
+                pending.get("text", ""), pending.get("side", "left"), pending.get("ellipsis", ""), frames
+            )
+        else:
+            frames = None
+            if not FRAME_KEYS.isdisjoint(pending):
+                frames = self._set_frames(self._spinner, self._reversal, self._pad_frames)
+            self._render_state = self._compose_state(
+                pending.get("text", state.text),
+                pending.get("side", state.side),
+                pending.get("ellipsis", state.ellipsis),
+                frames,
+                pending.keys(),
+            )
+        self._pending = None
+
+    def _compose_state(
+        self,
+        text: str,
+        side: str,
+        ellipsis: str,
+        frames: tuple[str | Sequence[str] | Iterable[str] | FrameFunction, dict[str, int]] | None = None,
+        changed: AbstractSet[str] = UPDATE_KEYS,
+    ) -> RenderState:
+        """
+        Derive the render state from the properties of the spinner.
+
+        Frames are carried over from the current state, unless the new
+        ``frames`` along with their widths are given, and so are the styles
+        which do not depend on the ``changed`` properties. Carrying over
+        the frame cycle keeps the animation phase when only the text or
+        the style of the spinner changes.
+        """
+        # There is no current state only when the first one is composed,
+        # which is given the frames and composes everything
+        prev = cast(RenderState, self._render_state)
+        repaint = frames is not None or not PAINT_KEYS.isdisjoint(changed)
+        if (
+            frames is None
+            and repaint
+            and prev.timeline is not None
+            and (prev.painted_cycle is not None or self._palette)
+        ):
+            # Painted frames start over, so do the frames and their
+            # timeline to stay in step
+            frames = prev.frames, prev.frame_widths
+
+        if frames is not None:
+            new_frames, frame_widths = frames
+            streamed = is_streamed(new_frames)
+            interval = self._set_interval(self._spinner)
+            cycle = self._set_cycle(new_frames)
+            timeline = self._set_timeline(self._spinner, self._reversal and not streamed)
+        else:
+            new_frames, frame_widths, streamed = prev.frames, prev.frame_widths, prev.streamed
+            interval, cycle, timeline = prev.interval, prev.cycle, prev.timeline
+
+        restyle, restyle_text = not STYLE_KEYS.isdisjoint(changed), not TEXT_STYLE_KEYS.isdisjoint(changed)
+        style_codes = self._compose_style() if restyle else prev.style_codes
+        text_codes = self._compose_text_codes() if restyle_text else prev.text_codes
+        if not repaint:
+            painted_cycle = prev.painted_cycle
+        else:
+            painted_cycle = self._compose_painted_cycle(new_frames, cycle) if self._palette else None
+
+        return RenderState(
+            text=text,
+            side=side,
+            ellipsis=ellipsis,
+            frames=new_frames,
+            frame_widths=frame_widths,
+            streamed=streamed,
+            interval=interval,
+            cycle=cycle,
+            timeline=timeline,
+            painted_cycle=painted_cycle,
+            style_codes=style_codes,
+            text_codes=text_codes,
+            frame_cache={} if self._frame_cache_enabled else None,
+        )
+
+    def _compose_style(self) -> tuple[str, str] | None:
+        """
+        Compile the color specification into a pair of escape sequences.
 
-        return functools.partial(
-            colored,
-            color=self._color,
-            on_color=self._on_color,
-            attrs=list(self._attrs),
+        Returns None if there is nothing to apply: no color specification
+        is set, or the stream does not support colors (e.g. non-TTY streams,
+        where ANSI Color Control Sequences are problematic). Otherwise, returns
+        the (prefix, suffix) pair downgraded to the terminal color depth.
+        """
+        if self._color_depth == ColorDepth.NONE:
+            return None
+        return _style_codes(
+            self._color if _is_set(self._color) else None,
+            self._on_color if _is_set(self._on_color) else None,
+            self._attrs,
+            self._color_depth,
         )
 
-    def _compose_out(self, frame: str, mode: str | None = None) -> str:
+    def _compose_painted_cycle(
+        self, frames: str | Sequence[str] | Iterable[str] | FrameFunction, cycle: Iterator[str]
+    ) -> Iterator[tuple[str, str]] | None:
+        """
+        Precompute the frames styled with the colors of the palette.
+
+        The table covers a full cycle of both frames and palette, i.e. the
+        least common multiple of their lengths, so picking a styled frame
+        costs the same as picking a plain one. Streamed frames are styled
+        one at a time, as they are taken from the ``cycle``. Returns None
+        if there is no palette or the stream does not support colors.
+        """
+        if not self._palette or self._color_depth == ColorDepth.NONE:
+            return None
+
+        palette = self._palette
+        on_color = self._on_color if _is_set(self._on_color) else None
+        codes = [Style(c, on_color, self._attrs).codes(self._color_depth) for c in palette]
+        if not isinstance(frames, str | Sequence):
+            return (
+                (frame, f"{prefix}{frame}{suffix}")
+                for frame, (prefix, suffix) in zip(cycle, itertools.cycle(codes))
+            )
+
+        table = []
+        for i in range(math.lcm(len(frames), len(palette))):
+            frame = frames[i % len(frames)]
+            prefix, suffix = codes[i % len(codes)]
+            table.append((frame, f"{prefix}{frame}{suffix}"))
+        return itertools.cycle(table)
+
+    def _compose_text_codes(self) -> list[tuple[str, str]] | None:
+        if not self._text_palette or self._color_depth == ColorDepth.NONE:
+            return None
+        return [Style(c).codes(self._color_depth) for c in self._text_palette]
+
+    def _paint_text(self, text: str, codes: list[tuple[str, str]]) -> str:
+        """
+        Spread the text palette over the text, from left to right.
+
+        The result is cached for the last painted text, so static text
+        is painted only once.
+        """
+        cached = self._painted_text
+        if cached is not None and cached[0] == text and cached[1] is codes:
+            return cached[2]
+
+        parts = []
+        length, ncodes = len(text), len(codes)
+        start = 0
+        while start < length:
+            idx = start * ncodes // length
+            # Characters sharing the same color are styled at once
+            end = -(-(idx + 1) * length // ncodes)
+            prefix, suffix = codes[idx]
+            parts.append(f"{prefix}{text[start:end]}{suffix}")
+            start = end
+        painted = "".join(parts)
+
+        self._painted_text = (text, codes, painted)
+        return painted
+
+    def _compose_out(self, frame: str, mode: str | None = None, painted: str | None = None) -> str:
         """
         Compose the output string for the spinner.
 
@@ -600,6 +2050,8 @@ class Yaspin:
                                   the output is generated on the same line with a carriage
                                   return. If a value is provided, the output is generated
                                   on a new line.
+            painted (str, optional): The frame with precomputed palette colors applied.
+                                     Used instead of styling the frame, if provided.
 
         Returns:
             str: The composed output string including the spinner frame, text, timer,
@@ -609,49 +2061,112 @@ class Yaspin:
             ValueError: If the terminal size is too small to display the spinner with
                         the given settings.
         """
-        text = str(self._text)
+        before, frame, after, _ = self._compose_segments(frame, painted)
+
+        # Mode
+        out = f"\r{before}{frame}{after}" if mode is None else f"{before}{frame}{after}\n"
+
+        return out
+
+    def _compose_segments(
+        self, frame: str, painted: str | None = None, state: RenderState | None = None
+    ) -> tuple[str, str, str, int]:
+        """
+        Compose the parts of the spinner line from the render state,
+        the current one by default.
+
+        Returns:
+            tuple: The (before, frame, after) segments of the line, where
+                   ``frame`` is the styled spinner frame, followed by
+                   the display width of the line in terminal cells.
+        """
+        state = state or self._state
+        text = str(state.text)
+        if self._activity is not None and text != self._idle_text:
+            # Dynamic text changes on its own
+            self._idle_text = text
+            self._mark_active()
+        calls = self._calls
+        if calls > 1:
+            text = f"{text} (×{calls})"
 
         # Timer
-        if self._timer:
-            sec, fsec = divmod(round(100 * self.elapsed_time), 100)
-            timer = f" ({timedelta(seconds=sec)}.{fsec:02.0f})"
-        else:
-            timer = ""
+        timer = self._timer(self._elapsed_ns()) if self._timer is not None else ""
 
         # Truncate
-        max_text_len = self._get_max_text_length(len(frame), len(timer))
+        frame_width = state.frame_widths.get(frame)
+        if frame_width is None:
+            frame_width = text_width(frame)
+        max_text_len = self._get_max_text_length(frame_width, len(timer), state.ellipsis)
         if max_text_len < 1:
             raise ValueError(
                 f"Terminal size {self._terminal_width} is too small to display spinner "
                 "with the given settings."
             )
-        text = text[:max_text_len] + self._ellipsis if len(text) > max_text_len else text
+        text, width = self._fit_text(text, max_text_len, state.ellipsis)
+        # There is always a space between frame and text
+        width += frame_width + 1 + len(timer)
 
         # Colors
-        if self._color_func is not None:
-            frame = self._color_func(frame)
+        if state.text_codes is not None and text:
+            text = self._paint_text(text, state.text_codes)
+        if painted is not None:
+            frame = painted
+        elif state.style_codes is not None:
+            prefix, suffix = state.style_codes
+            frame = f"{prefix}{frame}{suffix}"
 
         # Position
-        if self._side == "right":
-            frame, text = text, frame
+        if state.side == "right":
+            return f"{text} ", frame, timer, width
+        return "", frame, f" {text}{timer}", width
 
-        # Mode
-        out = f"\r{frame} {text}{timer}" if mode is None else f"{frame} {text}{timer}\n"
+    def _elapsed_ns(self) -> int:
+        if self._start_time is None:
+            return 0
+        if self._stop_time is None:
+            return time.monotonic_ns() - self._start_time
+        return self._stop_time - self._start_time
 
-        return out
+    def _fit_text(self, text: str, max_width: int, ellipsis: str) -> tuple[str, int]:
+        """
+        Truncate the text to ``max_width`` terminal cells, adding the ellipsis.
+
+        The result of the last fit is cached, so the text is not measured
+        on every frame unless it changes.
+
+        Returns:
+            tuple: The fitted text and its display width.
+        """
+        fitted = self._fitted_text
+        if fitted is not None and fitted[0] == text and fitted[1] == max_width and fitted[2] == ellipsis:
+            return fitted[3], fitted[4]
+
+        width = text_width(text)
+        result = text
+        if width > max_width:
+            result, width = truncate(text, max_width)
+            result += ellipsis
+            width += text_width(ellipsis)
 
-    def _get_max_text_length(self, frame_width: int, timer_width: int) -> int:
+        self._fitted_text = (text, max_width, ellipsis, result, width)
+        return result, width
+
+    def _get_max_text_length(self, frame_width: int, timer_width: int, ellipsis: str | None = None) -> int:
         """
         Calculate the maximum length of text that can be displayed within the terminal width.
 
+        Lengths are measured in terminal cells, so wide characters count twice.
+
         Args:
             frame_width (int): The width of the frame.
             timer_width (int): The width of the timer.
+            ellipsis (str, optional): The ellipsis, the current one by default.
 
         Returns:
             int: The maximum length of text that can be displayed.
         """
-        ellipsis_width = len(self._ellipsis)
+        ellipsis_width = text_width(self._state.ellipsis if ellipsis is None else ellipsis)
         # There is always a space between frame and text
         frame_width += 1
 
@@ -661,10 +2176,11 @@ class Yaspin:
         """
         Registers custom signal handlers for the spinner.
 
-        Sets up signal handlers defined in the `_sigmap` attribute.
-        It ensures that SIGKILL is not included. For each signal in
-        `_sigmap`, stores the default signal handler for later restoration
-        during the cleanup phase.
+        Routes the signals of the `_sigmap` attribute to their handlers
+        through the process-wide dispatcher, see ``yaspin.signals``. It
+        ensures that SIGKILL is not included. Spinners started from worker
+        threads can only handle the signals the dispatcher is installed for
+        from the main thread; a warning is issued for the other ones.
 
         Raises:
             ValueError: If an attempt is made to set a handler for the SIGKILL signal.
@@ -677,29 +2193,48 @@ class Yaspin:
                 "Trying to set handler for SIGKILL signal. "
                 "SIGKILL cannot be caught or ignored in POSIX systems."
             )
+        handlers: dict[int, signals.Handler] = {}
         for sig, sig_handler in self._sigmap.items():
-            # A handler for a particular signal, once set, remains
-            # installed until it is explicitly reset. Store default
-            # signal handlers for subsequent reset at cleanup phase.
-            dfl_handler = signal.getsignal(sig)
-            self._dfl_sigmap[sig] = dfl_handler
-
             # ``signal.SIG_DFL`` and ``signal.SIG_IGN`` are also valid
             # signal handlers and are not callables.
             if callable(sig_handler) and isinstance(sig_handler, SignalHandlerProtocol):
-                # ``signal.signal`` accepts handler function which is
-                # called with two arguments: signal number and the
-                # interrupted stack frame. ``functools.partial`` solves
-                # the problem of passing spinner instance into the handler
-                # function.
+                # Handlers are called with two arguments: signal number
+                # and the interrupted stack frame. ``functools.partial``
+                # solves the problem of passing spinner instance into the
+                # handler function.
                 sig_handler = functools.partial(sig_handler, spinner=self)
+            handlers[sig] = cast(signals.Handler, sig_handler)
 
-            signal.signal(sig, sig_handler)
+        missing = signals.dispatcher.add(self, handlers)
+        if missing:
+            names = ", ".join(signal.Signals(sig).name for sig in missing)
+            warnings.warn(
+                f"{names} not handled by the spinner started off the main thread, "
+                "call yaspin.signals.install() from the main thread first",
+                RuntimeWarning,
+                stacklevel=4,
+            )
 
     def _reset_signal_handlers(self) -> None:
-        """Resets the signal handlers to their default values."""
-        for sig, sig_handler in self._dfl_sigmap.items():
-            signal.signal(sig, sig_handler)
+        """Stops routing the signals to the handlers of the spinner."""
+        signals.dispatcher.remove(self)
+
+    def _register_job_handlers(self) -> None:
+        """
+        Handle SIGCONT to redraw the line once the process is continued,
+        unless the signal is handled already, by ``sigmap`` or by the
+        application. SIGTSTP is left to its default action, so Ctrl-Z stops
+        the process right away; the spin thread notices the background job
+        by polling the foreground process group of the terminal instead.
+        """
+        handlers: dict[int, signals.Handler] = {}
+        if signal.SIGCONT not in self._sigmap and (
+            signals.dispatcher.installed(signal.SIGCONT) or signal.getsignal(signal.SIGCONT) == signal.SIG_DFL
+        ):
+            handlers[signal.SIGCONT] = _on_job_continue
+        # Not routed if started off the main thread before the dispatcher
+        # is installed, job control is only nice to have
+        signals.dispatcher.add(self, handlers, transient=True)
 
     def _hide_cursor(self) -> None:
         if self._stream.isatty():
@@ -714,38 +2249,55 @@ class Yaspin:
             self._stream.flush()
 
     def _clear_line(self) -> None:
+        self._stream.write(self._get_clear_seq())
+        self._drawn_cells = None
+        self._drawn_key = None
+
+    def _get_clear_seq(self) -> str:
         if self._stream.isatty():
             # ANSI Control Sequence EL does not work in Jupyter
-            self._stream.write("\r\033[K")
-        else:
-            fill = " " * self._cur_line_len
-            self._stream.write(f"\r{fill}\r")
+            return "\r\033[K"
+        fill = " " * self._cur_line_len
+        return f"\r{fill}\r"
 
-    def _set_color(self, value: str) -> str:
-        if not self._supports_ansi_codes():
-            Yaspin._warn_color_disabled()
+    def _set_color(self, value: Color) -> Color:
+        self._warn_color_disabled()
 
-        if value not in COLORS:
+        try:
+            return parse_color(value)
+        except ValueError:
             raise ValueError(
-                "'{}': unsupported color value. Use one of the: {}".format(value, ", ".join(COLORS.keys()))
-            )
-        return value
+                "'{}': unsupported color value. Use one of the: {}, "
+                "256-color palette index, RGB tuple or '#rrggbb' string".format(
+                    value, ", ".join(COLORS.keys())
+                )
+            ) from None
 
-    def _set_on_color(self, value: str) -> str:
-        if not self._supports_ansi_codes():
-            Yaspin._warn_color_disabled()
+    def _set_on_color(self, value: Color) -> Color:
+        self._warn_color_disabled()
 
-        if value not in HIGHLIGHTS:
+        try:
+            return parse_color(value, highlight=True)
+        except ValueError:
             raise ValueError(
-                "'{}': unsupported on_color value. Use one of the: {}".format(
+                "'{}': unsupported on_color value. Use one of the: {}, "
+                "256-color palette index, RGB tuple or '#rrggbb' string".format(
                     value, ", ".join(HIGHLIGHTS.keys())
                 )
-            )
-        return value
+            ) from None
 
-    def _set_attrs(self, attrs: Sequence[str]) -> set[str]:
-        if not self._supports_ansi_codes():
-            Yaspin._warn_color_disabled()
+    def _set_palette(self, palette: Sequence[Color]) -> tuple[Color, ...]:
+        self._warn_color_disabled()
+
+        try:
+            return tuple(parse_color(value) for value in palette)
+        except ValueError as err:
+            raise ValueError(
+                f"{err}. Palette colors are specified in the same way as the color value"
+            ) from None
+
+    def _set_attrs(self, attrs: Sequence[str]) -> frozenset[str]:
+        self._warn_color_disabled()
 
         for attr in attrs:
             if attr not in ATTRIBUTES:
@@ -754,17 +2306,23 @@ class Yaspin:
                         attr, ", ".join(ATTRIBUTES.keys())
                     )
                 )
-        return set(attrs)
+        attrs_set = frozenset(attrs)
+        return _interned_attrs.setdefault(attrs_set, attrs_set)
 
-    # Static
-    #
-    @staticmethod
-    def _warn_color_disabled() -> None:
+    def _warn_color_disabled(self) -> None:
+        # Warn only once per spinner instance
+        if self._ansi_codes or self._color_warned:
+            return
         warnings.warn(
             "color, on_color and attrs are not supported when output stream is not a TTY",
-            stacklevel=3,
+            # Points at the user code through the property setter or
+            # ``yaspin()``, ``_apply`` and ``_set_color``
+            stacklevel=5,
         )
+        self._color_warned = True
 
+    # Static
+    #
     @staticmethod
     def _set_spinner(spinner: Spinner) -> Spinner:
         if hasattr(spinner, "frames") and hasattr(spinner, "interval"):
@@ -772,7 +2330,36 @@ class Yaspin:
         else:
             sp = default_spinner
 
-        return sp
+        return _intern_spinner(sp)
+
+    def _set_bandwidth(self, value: int | None) -> int | None:
+        if value is None:
+            # Auto-detect for terminals only
+            if self._stream.fd is None or not self._ansi_codes:
+                return None
+            return _detect_bandwidth(self._stream.fd)
+        if value < 0:
+            raise ValueError(f"'{value}': max_bandwidth should be a positive number of bytes per second")
+        # 0 disables the bandwidth limit
+        return value or None
+
+    @staticmethod
+    def _set_timer(timer: bool | TimerFormat) -> Timer | None:
+        if isinstance(timer, TimerFormat):
+            return Timer(timer)
+        return Timer(TimerFormat()) if timer else None
+
+    @staticmethod
+    def _set_duration(name: str, value: float) -> float:
+        if value < 0:
+            raise ValueError(f"'{value}': {name} should be a non-negative number of seconds")
+        return value
+
+    @staticmethod
+    def _set_idle_floor(fps: float) -> float:
+        if fps <= 0:
+            raise ValueError(f"'{fps}': idle_fps should be a positive number of frames per second")
+        return 1 / fps
 
     @staticmethod
     def _set_side(side: str) -> str:
@@ -781,34 +2368,54 @@ class Yaspin:
         return side
 
     @staticmethod
-    def _set_frames(spinner: Spinner, reversal: bool) -> str | Sequence[str]:
+    def _set_frames(
+        spinner: Spinner, reversal: bool, pad: bool = False
+    ) -> tuple[str | Sequence[str] | Iterable[str] | FrameFunction, dict[str, int]]:
         """
         Set the frames for the spinner, optionally reversing them.
 
+        The result is cached for the listed frames, so the instances using
+        equal spinners share the frames and their widths, which must not be
+        modified. Streamed frames are not cached, so they are
+        collected along with the spinners using them.
+
         Args:
             spinner (Spinner): The spinner object containing the frames.
             reversal (bool): If True, the frames will be reversed.
+            pad (bool): If True, the frames are padded with spaces to the
+                display width of the widest frame.
 
         Returns:
-            Union[str, Sequence[str]]: The frames to be used for the spinner.
-            This can be a single string of frames or a sequence of frame strings.
+            tuple: The frames to be used for the spinner, along with the
+            mapping of the frames to their display widths. The frames can be
+            a single string of frames or a sequence of frame strings. Streamed
+            frames are returned as is, with no widths.
 
         Raises:
             ValueError: If no frames are found in the spinner.
         """
+        if is_streamed(spinner.frames):
+            # Measured on every frame instead
+            return spinner.frames, {}
+        return Yaspin._measure_frames(spinner, reversal, pad)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _measure_frames(
+        spinner: Spinner, reversal: bool, pad: bool
+    ) -> tuple[str | Sequence[str], dict[str, int]]:
         uframes = None  # unicode frames
         uframes_seq = None  # sequence of unicode frames
 
         if isinstance(spinner.frames, str):
             uframes = spinner.frames
 
-        # TODO (pavdmyt): support any type that implements iterable
         if isinstance(spinner.frames, list | tuple):
             # Empty ``spinner.frames`` is handled by ``Yaspin._set_spinner``
             if spinner.frames and isinstance(spinner.frames[0], bytes):
-                uframes_seq = [to_unicode(frame) for frame in spinner.frames]
+                uframes_seq = tuple(to_unicode(frame) for frame in spinner.frames)
             else:
-                uframes_seq = spinner.frames
+                uframes_seq = tuple(spinner.frames)
 
         _frames = uframes or uframes_seq
         if not _frames:
@@ -821,15 +2428,52 @@ class Yaspin:
         # which adds unnecessary difficulty for returning
         # unicode value;
         # Hence using [::-1] syntax
-        frames = _frames[::-1] if reversal else _frames
+        frames: str | Sequence[str] = _frames[::-1] if reversal else _frames
 
-        return frames
+        # Display widths are measured once per spinner,
+        # so the render loop never measures the frames.
+        widths = {frame: text_width(frame) for frame in frames}
+        max_width = max(widths.values())
+        if pad and min(widths.values()) < max_width:
+            frames = tuple(frame + " " * (max_width - widths[frame]) for frame in frames)
+            widths = dict.fromkeys(frames, max_width)
+
+        return frames, widths
 
     @staticmethod
     def _set_interval(spinner: Spinner) -> float:
-        # Milliseconds to Seconds
-        return spinner.interval * 0.001
+        # Milliseconds to Seconds; the shortest frame of the timeline.
+        # Timelines of the spinners set by ``_set_spinner`` are tuples.
+        interval = spinner.interval
+        if isinstance(interval, tuple):
+            return min(interval) * 0.001
+        return cast(int, interval) * 0.001
 
     @staticmethod
-    def _set_cycle(frames: str | Sequence[str]) -> Iterator[str]:
+    def _set_timeline(spinner: Spinner, reversal: bool) -> Iterator[float] | None:
+        if not isinstance(spinner.interval, tuple):
+            return None
+        # Milliseconds to Seconds, in the order of the frames
+        durations = [duration * 0.001 for duration in spinner.interval]
+        return itertools.cycle(durations[::-1] if reversal else durations)
+
+    def _set_cycle(self, frames: str | Sequence[str] | Iterable[str] | FrameFunction) -> Iterator[str]:
+        if isinstance(frames, str | tuple):
+            return itertools.cycle(frames)
+        if callable(frames):
+            return generate_frames(
+                frames,
+                lambda: self._elapsed_ns() / NS_PER_SEC,
+                lambda: self._terminal_width,
+            )
+        if is_streamed(frames):
+            return stream_frames(frames)
         return itertools.cycle(frames)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
@@ -0,0 +1,57 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.frames
+~~~~~~~~~~~~~
+
+Spinner frames produced on the fly.
+
+Besides a string or a sequence, the frames of a spinner can come from
+a function of the frame number, the elapsed time and the terminal width,
+or from any other iterable, e.g. a generator. Such frames are produced
+one at a time, so they are never kept in memory as a whole.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+
+import itertools
+
+# Called with the frame number, the elapsed time in seconds and the
+# terminal width in columns, returns the frame.
+FrameFunction = Callable[[int, float, int], str]
+
+
+def is_streamed(frames: object) -> bool:
+    """Check if the frames are produced on the fly, rather than listed."""
+    if isinstance(frames, str | bytes | list | tuple):
+        return False
+    return callable(frames) or isinstance(frames, Iterable)
+
+
+def generate_frames(
+    func: FrameFunction, elapsed: Callable[[], float], width: Callable[[], int]
+) -> Iterator[str]:
+    """Call the frame function for every frame."""
+    for tick in itertools.count():
+        yield func(tick, elapsed(), width())
+
+
+def stream_frames(frames: Iterable[str]) -> Iterator[str]:
+    """Cycle through the frames without keeping them in memory.
+
+    Iterables are iterated over again once exhausted, while one-shot
+    iterators, e.g. generators, keep showing their last frame.
+    """
+    last = ""
+    while True:
+        empty = True
+        for frame in frames:
+            empty = False
+            last = frame
+            yield frame
+        if empty or isinstance(frames, Iterator):
+            break
+    yield from itertools.repeat(last)
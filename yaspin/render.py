@@ -0,0 +1,135 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.render
+~~~~~~~~~~~~~
+
+Differential rendering of the spinner line.
+
+The line drawn in the terminal is modeled as a sequence of cells, so that
+only the cells changed since the previous frame have to be rewritten.
+Each cell stands for a single terminal column.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+import functools
+import re
+
+from .styles import RESET
+from .width import clusters
+
+# SGR (Select Graphic Rendition) control sequence, e.g. "\033[1;31m"
+SGR_RE: Final[re.Pattern[str]] = re.compile(r"\033\[[0-9;]*m")
+
+# Equal cells between two changed runs that are still rewritten, as
+# moving the cursor over them costs about the same number of bytes.
+MAX_GAP: Final[int] = 4
+
+# Terminal cell: (SGR sequences in effect, grapheme cluster). Wide
+# clusters are followed by a cell with an empty string.
+Cell = tuple[str, str]
+
+
+@functools.lru_cache(maxsize=256)
+def to_cells(text: str) -> tuple[Cell, ...] | None:
+    """Split styled text into cells.
+
+    Returns None if the text contains control characters or sequences
+    other than SGR, or starts with a zero-width character, as their
+    effect on the line can not be modeled.
+    """
+    cells: list[Cell] = []
+    style = ""
+    pos = 0
+    for match in SGR_RE.finditer(text):
+        if not _add_cells(cells, style, text[pos : match.start()]):
+            return None
+        seq = match.group()
+        style = "" if seq in (RESET, "\033[m") else style + seq
+        pos = match.end()
+    if not _add_cells(cells, style, text[pos:]):
+        return None
+    return tuple(cells)
+
+
+def _add_cells(cells: list[Cell], style: str, chunk: str) -> bool:
+    for cluster, width in clusters(chunk):
+        if width == 0 or any(char < " " or "\x7f" <= char <= "\x9f" for char in cluster):
+            return False
+        cells.append((style, cluster))
+        if width == 2:
+            # The right half of a wide character
+            cells.append((style, ""))
+    return True
+
+
+def line_cells(*segments: str) -> tuple[Cell, ...] | None:
+    """Compose cells of the line from its styled segments."""
+    cells: tuple[Cell, ...] = ()
+    for segment in segments:
+        segment_cells = to_cells(segment)
+        if segment_cells is None:
+            return None
+        cells += segment_cells
+    return cells
+
+
+def render_cells(cells: tuple[Cell, ...]) -> str:
+    """Compose styled text out of the cells."""
+    parts = []
+    current = ""
+    for style, char in cells:
+        if style != current:
+            if current:
+                parts.append(RESET)
+            parts.append(style)
+            current = style
+        parts.append(char)
+    if current:
+        parts.append(RESET)
+    return "".join(parts)
+
+
+def diff_cells(old: tuple[Cell, ...], new: tuple[Cell, ...], limit: int) -> str | None:
+    """Compose the output turning the ``old`` line into the ``new`` one.
+
+    Only changed runs of cells are rewritten, using the cursor horizontal
+    absolute positioning. Returns an empty string if the lines are equal
+    and None if the output would not be shorter than ``limit``.
+    """
+    common = min(len(old), len(new))
+    runs: list[list[int]] = []  # [start, end) pairs
+    for i in range(common):
+        if old[i] != new[i]:
+            if runs and i - runs[-1][1] <= MAX_GAP:
+                runs[-1][1] = i + 1
+            else:
+                runs.append([i, i + 1])
+    if len(new) > len(old):
+        if runs and common - runs[-1][1] <= MAX_GAP:
+            runs[-1][1] = len(new)
+        else:
+            runs.append([common, len(new)])
+
+    parts = []
+    cursor = None
+    for start, end in runs:
+        parts.append(_move_to(start))
+        parts.append(render_cells(new[start:end]))
+        cursor = end
+    if len(new) < len(old):
+        # Erase the leftover of the previous line
+        if cursor != len(new):
+            parts.append(_move_to(len(new)))
+        parts.append("\033[K")
+
+    out = "".join(parts)
+    return out if len(out) < limit else None
+
+
+def _move_to(column: int) -> str:
+    return "\r" if column == 0 else f"\033[{column + 1}G"
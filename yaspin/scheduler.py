@@ -0,0 +1,106 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.scheduler
+~~~~~~~~~~~~~~~~
+
+Delayed calls run by a single shared thread.
+
+Arming a delayed call is a heap push, so spinners that are stopped before
+their delay expires never start a thread of their own.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+
+
+class ScheduledCall:
+    """Handle of a delayed call, which can be cancelled until it runs."""
+
+    def __init__(self, deadline: float, callback: Callable[[], Any]) -> None:
+        self.deadline = deadline
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._claimed = False
+        self._cancelled = False
+        self._done = threading.Event()
+
+    def cancel(self) -> bool:
+        """Cancel the call. Returns False if the call already runs or ran."""
+        with self._lock:
+            if self._claimed:
+                return False
+            self._cancelled = True
+            return True
+
+    def wait(self) -> None:
+        """Wait for the call to complete, unless it was cancelled."""
+        if not self._cancelled:
+            self._done.wait()
+
+    def _run(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._claimed = True
+        try:
+            self._callback()
+        finally:
+            self._done.set()
+
+
+class Scheduler:
+    """Runs delayed calls in a daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._queue: list[tuple[float, int, ScheduledCall]] = []
+        self._counter = itertools.count()  # keeps equal deadlines in order
+        self._thread: threading.Thread | None = None
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> ScheduledCall:
+        """Arrange for ``callback`` to be called after ``delay`` seconds."""
+        call = ScheduledCall(time.monotonic() + delay, callback)
+        with self._cond:
+            heapq.heappush(self._queue, (call.deadline, next(self._counter), call))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="yaspin-scheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return call
+
+    def _after_fork_in_child(self) -> None:
+        """Drop the calls of the parent process, whose thread does not exist in the child."""
+        self._cond = threading.Condition()
+        self._queue = []
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue or self._queue[0][0] > time.monotonic():
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._cond.wait(timeout)
+                _, _, call = heapq.heappop(self._queue)
+            try:
+                call._run()
+            except Exception as err:
+                # Keep serving other calls
+                sys.excepthook(type(err), err, err.__traceback__)
+
+
+# Shared by all spinners
+scheduler = Scheduler()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=scheduler._after_fork_in_child)
@@ -0,0 +1,264 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.signals
+~~~~~~~~~~~~~~
+
+Process-wide dispatcher of the signals handled by spinners.
+
+Python runs signal handlers in the main thread, and only the main thread
+may install them. The dispatcher installs its handler once per signal and
+keeps it, routing the signal to the handlers of the running spinners.
+Spinners started from worker threads are routed the signals installed
+earlier, e.g. by ``install()`` at startup. Signals installed only for
+transient handlers, e.g. of job control, get their previous handler back
+once no spinner handles them.
+
+The handler itself only writes the signal number into a self-pipe. The
+handlers of the spinners are called by a daemon thread reading the pipe,
+so stopping a spinner, which joins its thread and takes the stream lock,
+never blocks the interrupted main thread. Exceptions raised by them, e.g.
+``SystemExit`` of ``sys.exit()``, are raised in the main thread then, by
+sending it the signal again, which interrupts a blocking call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any, cast, TYPE_CHECKING
+
+import _thread
+import contextlib
+import os
+import signal
+import threading
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+# A callable handler, or ``signal.SIG_DFL`` or ``signal.SIG_IGN``
+Handler = Callable[[int, "FrameType | None"], Any] | int
+
+
+class SignalDispatcher:
+    """Routes signals to the handlers of the running spinners."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Handlers per signal, in the order of start, replaced as a whole,
+        # so the signal handler reads them without the lock
+        self._routes: dict[int, list[tuple[object, Handler]]] = {}
+        # Handlers replaced by the dispatcher, called if no spinner
+        # handles the signal
+        self._previous: dict[int, Any] = {}
+        # Signals installed for transient handlers only, restored to their
+        # previous handlers once no spinner handles them
+        self._transient: set[int] = set()
+        # Exceptions raised by the handlers, to be raised in the main thread
+        self._pending: dict[int, BaseException] = {}
+        # Signals sent to the main thread by the dispatcher to raise them
+        self._resent: set[int] = set()
+        self._pipe: tuple[int, int] | None = None
+
+    def install(self, sig: int) -> bool:
+        """
+        Install the handler of the signal, unless it is installed already.
+
+        Returns False if the handler is not installed, and can not be
+        installed from the current thread.
+        """
+        with self._lock:
+            return self._install(sig)
+
+    def installed(self, sig: int) -> bool:
+        """Check if the handler of the signal is installed."""
+        return sig in self._previous and signal.getsignal(sig) == self._handle
+
+    def _install(self, sig: int, transient: bool = False) -> bool:
+        if self.installed(sig):
+            if not transient:
+                self._transient.discard(sig)
+            # The pipe is created again in the forked child
+            self._start()
+            return True
+        if threading.current_thread() is not threading.main_thread():
+            return False
+
+        self._start()
+        self._previous[sig] = signal.signal(sig, self._handle)
+        if transient:
+            self._transient.add(sig)
+        return True
+
+    def add(self, owner: object, handlers: Mapping[int, Handler], transient: bool = False) -> list[int]:
+        """
+        Route the signals to the handlers of the owner, e.g. a spinner.
+
+        The signals installed for ``transient`` handlers only are restored
+        to their previous handlers once no spinner handles them.
+
+        Returns the signals which are not routed, as the dispatcher is not
+        installed for them and the current thread is not the main one.
+        """
+        missing = []
+        with self._lock:
+            for sig, handler in handlers.items():
+                if not self._install(sig, transient):
+                    missing.append(sig)
+                    continue
+                self._routes[sig] = [*self._routes.get(sig, ()), (owner, handler)]
+            self._restore_unused()
+        return missing
+
+    def remove(self, owner: object) -> None:
+        """Stop routing the signals to the handlers of the owner."""
+        with self._lock:
+            for sig, routes in self._routes.items():
+                if any(route_owner is owner for route_owner, _ in routes):
+                    self._routes[sig] = [route for route in routes if route[0] is not owner]
+            self._restore_unused()
+
+    def _restore_unused(self) -> None:
+        """
+        Restore the previous handlers of the transient signals no spinner
+        handles. Left for the next call if not in the main thread.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for sig in [sig for sig in self._transient if not self._routes.get(sig)]:
+            previous = self._previous.pop(sig)
+            if signal.getsignal(sig) == self._handle:
+                signal.signal(sig, signal.SIG_DFL if previous is None else previous)
+            self._transient.discard(sig)
+
+    def _start(self) -> None:
+        """Create the self-pipe and start the thread reading it."""
+        if self._pipe is not None:
+            return
+        read_fd, write_fd = os.pipe()
+        # The signal handler must never block on a full pipe
+        os.set_blocking(write_fd, False)
+        self._pipe = read_fd, write_fd
+        threading.Thread(target=self._run, args=(read_fd,), name="yaspin-signals", daemon=True).start()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Drop the routes of the parent process. The pipe is closed, as it is
+        read by the thread of the parent; handlers are kept installed.
+        """
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._pending = {}
+        self._resent = set()
+        if self._pipe is not None:
+            for fd in self._pipe:
+                os.close(fd)
+            self._pipe = None
+
+    def _handle(self, signum: int, frame: FrameType | None) -> None:
+        """
+        Signal handler, run in the main thread.
+
+        Must not block or take locks, as it may interrupt the main thread
+        holding them.
+        """
+        if signum in self._resent:
+            # Sent by the dispatcher, not routed again even if the error
+            # was raised already, by the signal arriving meanwhile
+            self._resent.discard(signum)
+            pending = self._pending.pop(signum, None)
+            if pending is not None:
+                raise pending
+            return
+        pending = self._pending.pop(signum, None)
+        if pending is not None:
+            raise pending
+
+        routes = self._routes.get(signum)
+        if not routes:
+            self._forward(signum, frame)
+            return
+        # The innermost spinner decides whether to ignore the signal,
+        # or let the default action happen
+        handler = routes[-1][1]
+        if handler == signal.SIG_IGN:
+            return
+        if handler == signal.SIG_DFL:
+            self._default_action(signum)
+            return
+        if self._pipe is not None:
+            with contextlib.suppress(BlockingIOError):
+                os.write(self._pipe[1], bytes([signum]))
+
+    def _forward(self, signum: int, frame: FrameType | None) -> None:
+        """Call the handler replaced by the dispatcher."""
+        previous = self._previous.get(signum)
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            self._default_action(signum)
+
+    def _default_action(self, signum: int) -> None:
+        """Let the default action of the signal happen, e.g. terminate the process."""
+        signal.signal(signum, signal.SIG_DFL)
+        signal.raise_signal(signum)
+        # Carrying on, if the default action is to ignore or to stop
+        signal.signal(signum, self._handle)
+
+    def _run(self, read_fd: int) -> None:
+        while True:
+            for signum in os.read(read_fd, 64):
+                self._dispatch(signum)
+
+    def _dispatch(self, signum: int) -> None:
+        """Call the handlers of the signal, the innermost spinner first."""
+        error: BaseException | None = None
+        called: list[Handler] = []
+        for _, handler in reversed(self._routes.get(signum, ())):
+            # Handlers shared by several spinners are called once
+            if not callable(handler) or handler in called:
+                continue
+            called.append(handler)
+            try:
+                handler(signum, None)
+            except BaseException as exc:
+                # Each spinner is finalized, the first error is raised
+                error = error or exc
+        if error is not None:
+            self._pending[signum] = error
+            # Runs the signal handler in the main thread, raising the error.
+            # Unlike ``interrupt_main()``, a signal interrupts the blocking
+            # call of the main thread, e.g. ``time.sleep()``, right away
+            if hasattr(signal, "pthread_kill"):
+                self._resent.add(signum)
+                signal.pthread_kill(cast(int, threading.main_thread().ident), signum)
+            else:
+                _thread.interrupt_main(signal.Signals(signum))
+
+
+dispatcher = SignalDispatcher()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=dispatcher._after_fork_in_child)
+
+
+def install(*signals: signal.Signals) -> None:
+    """
+    Install the dispatcher for the signals, so spinners started from
+    worker threads can handle them. Should be called from the main thread,
+    e.g. at startup.
+
+    Example::
+
+        from signal import SIGINT, SIGTERM
+        from yaspin import signals
+
+        signals.install(SIGINT, SIGTERM)
+
+    Raises:
+        ValueError: If not called from the main thread.
+    """
+    for sig in signals:
+        if not dispatcher.install(sig):
+            raise ValueError("signal handlers can only be installed from the main thread")
@@ -14,6 +14,8 @@ from typing import Any
 import json
 import pkgutil
 
+from .core import _register_spinner, Spinner
+
 spinners_json = pkgutil.get_data(__name__, "data/spinners.json")
 if spinners_json is not None:
     SPINNERS_DATA = spinners_json.decode("utf-8")
@@ -22,7 +24,11 @@ else:
 
 
 def _hook(dct: dict[str, Any]) -> Any:
-    return namedtuple("Spinner", dct.keys())(*dct.values())
+    if dct.keys() == {"frames", "interval"}:
+        # Catalogue entries share the spinner type and are interned,
+        # so spinners equal to them share the measured frames
+        return _register_spinner(Spinner(dct["frames"], dct["interval"]))
+    return namedtuple("Spinners", dct.keys())(*dct.values())
 
 
 Spinners = json.loads(SPINNERS_DATA, object_hook=_hook)
@@ -0,0 +1,256 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.styles
+~~~~~~~~~~~~~
+
+ANSI styles for the spinner output.
+
+A style is compiled once into a pair of ANSI escape sequences, so applying
+it to a frame is plain string concatenation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Final, TextIO
+
+import colorsys
+import functools
+import os
+
+from termcolor import ATTRIBUTES, COLORS, HIGHLIGHTS
+
+# Color name, 256-color palette index or RGB triplet
+Color = str | int | tuple[int, int, int]
+
+RESET: Final[str] = "\033[0m"
+
+# Default RGB values of the 16 basic colors (xterm)
+BASIC_RGB: Final[tuple[tuple[int, int, int], ...]] = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+# Channel values of the 6x6x6 color cube of the 256-color palette
+CUBE_LEVELS: Final[tuple[int, ...]] = (0, 95, 135, 175, 215, 255)
+
+
+class ColorDepth(IntEnum):
+    """Number of colors supported by a terminal."""
+
+    NONE = 0
+    ANSI16 = 16
+    ANSI256 = 256
+    TRUECOLOR = 1 << 24
+
+
+def detect_color_depth(stream: TextIO) -> ColorDepth:
+    """Detect the color depth supported by the terminal behind ``stream``.
+
+    Respects the ``ANSI_COLORS_DISABLED``, ``NO_COLOR`` and ``FORCE_COLOR``
+    environment variables, in the same way as ``termcolor`` does.
+    """
+    if os.environ.get("ANSI_COLORS_DISABLED") or os.environ.get("NO_COLOR"):
+        return ColorDepth.NONE
+
+    term = os.environ.get("TERM", "")
+    if not os.environ.get("FORCE_COLOR") and (term == "dumb" or not stream.isatty()):
+        return ColorDepth.NONE
+
+    if os.environ.get("COLORTERM") in ("truecolor", "24bit"):
+        return ColorDepth.TRUECOLOR
+    if "256" in term:
+        return ColorDepth.ANSI256
+    return ColorDepth.ANSI16
+
+
+def parse_color(value: Color, highlight: bool = False) -> Color:
+    """Validate the color value and convert ``#rrggbb`` strings to RGB.
+
+    Named colors are looked up in ``termcolor.HIGHLIGHTS`` if ``highlight``
+    is True and in ``termcolor.COLORS`` otherwise.
+
+    Raises:
+        ValueError: If the color value is not supported.
+    """
+    names = HIGHLIGHTS if highlight else COLORS
+    if isinstance(value, str):
+        if value in names:
+            return value
+        if len(value) == 7 and value.startswith("#"):
+            try:
+                return (int(value[1:3], 16), int(value[3:5], 16), int(value[5:7], 16))
+            except ValueError:
+                pass
+    elif isinstance(value, int) and not isinstance(value, bool):
+        if 0 <= value <= 255:
+            return value
+    elif (
+        isinstance(value, tuple)
+        and len(value) == 3
+        and all(isinstance(c, int) and 0 <= c <= 255 for c in value)
+    ):
+        return value
+    raise ValueError(f"{value!r}: unsupported color value")
+
+
+@dataclass(frozen=True)
+class Style:
+    """Immutable set of color, highlight and attributes.
+
+    Compiled escape sequences are cached and shared by equal styles,
+    so the same style can be reused by any number of spinners.
+    """
+
+    color: Color | None = None
+    on_color: Color | None = None
+    attrs: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.color is not None or self.on_color is not None or self.attrs)
+
+    def codes(self, depth: ColorDepth) -> tuple[str, str]:
+        """Return the (prefix, suffix) pair of escape sequences for ``depth``."""
+        return _compile(self, depth)
+
+    def apply(self, text: str, depth: ColorDepth) -> str:
+        prefix, suffix = _compile(self, depth)
+        return f"{prefix}{text}{suffix}"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(style: Style, depth: ColorDepth) -> tuple[str, str]:
+    if depth == ColorDepth.NONE or not style:
+        return "", ""
+
+    params: list[str] = []
+    if style.color is not None:
+        params.append(_color_params(style.color, depth, highlight=False))
+    if style.on_color is not None:
+        params.append(_color_params(style.on_color, depth, highlight=True))
+    params.extend(str(ATTRIBUTES[attr]) for attr in sorted(style.attrs))
+
+    return f"\033[{';'.join(params)}m", RESET
+
+
+def _color_params(value: Color, depth: ColorDepth, highlight: bool) -> str:
+    """Compose SGR parameters for the color, downgraded to ``depth``."""
+    if isinstance(value, str):
+        value = parse_color(value, highlight)
+    if isinstance(value, str):
+        return str(HIGHLIGHTS[value] if highlight else COLORS[value])
+
+    if isinstance(value, tuple):
+        if depth >= ColorDepth.TRUECOLOR:
+            r, g, b = value
+            return f"{48 if highlight else 38};2;{r};{g};{b}"
+        value = rgb_to_256(*value) if depth >= ColorDepth.ANSI256 else rgb_to_16(*value)
+
+    if value >= 16 and depth < ColorDepth.ANSI256:
+        value = rgb_to_16(*palette_to_rgb(value))
+
+    if value < 16:
+        base = 40 if highlight else 30
+        return str(base + value if value < 8 else base + 60 + value - 8)
+    return f"{48 if highlight else 38};5;{value}"
+
+
+def to_rgb(value: Color) -> tuple[int, int, int]:
+    """Convert any supported foreground color value into RGB."""
+    value = parse_color(value)
+    if isinstance(value, tuple):
+        return value
+    if isinstance(value, int):
+        return palette_to_rgb(value)
+    code = COLORS[value]
+    return BASIC_RGB[code - 30 if code < 90 else code - 90 + 8]
+
+
+def gradient(start: Color, end: Color, steps: int) -> list[tuple[int, int, int]]:
+    """Interpolate ``steps`` RGB colors from ``start`` to ``end``, inclusive."""
+    if steps < 2:
+        return [to_rgb(start)][:steps]
+    (r1, g1, b1), (r2, g2, b2) = to_rgb(start), to_rgb(end)
+    last = steps - 1
+    return [
+        (
+            r1 + (r2 - r1) * i // last,
+            g1 + (g2 - g1) * i // last,
+            b1 + (b2 - b1) * i // last,
+        )
+        for i in range(steps)
+    ]
+
+
+def pulse(start: Color, end: Color, steps: int) -> list[tuple[int, int, int]]:
+    """Gradient from ``start`` to ``end`` and back, suitable for cycling."""
+    colors = gradient(start, end, steps)
+    return colors + colors[-2:0:-1]
+
+
+def rainbow(steps: int) -> list[tuple[int, int, int]]:
+    """Sweep ``steps`` colors over the hue circle."""
+    colors = []
+    for i in range(steps):
+        r, g, b = colorsys.hsv_to_rgb(i / steps, 1.0, 1.0)
+        colors.append((round(r * 255), round(g * 255), round(b * 255)))
+    return colors
+
+
+def palette_to_rgb(index: int) -> tuple[int, int, int]:
+    """Convert the 256-color palette index into RGB."""
+    if index < 16:
+        return BASIC_RGB[index]
+    if index < 232:
+        index -= 16
+        return (
+            CUBE_LEVELS[index // 36],
+            CUBE_LEVELS[index // 6 % 6],
+            CUBE_LEVELS[index % 6],
+        )
+    gray = 8 + (index - 232) * 10
+    return gray, gray, gray
+
+
+def rgb_to_256(r: int, g: int, b: int) -> int:
+    """Find the closest color of the 256-color palette."""
+
+    def cube_index(value: int) -> int:
+        return 0 if value < 48 else 1 if value < 115 else (value - 35) // 40
+
+    ri, gi, bi = cube_index(r), cube_index(g), cube_index(b)
+    cube = 16 + 36 * ri + 6 * gi + bi
+
+    gray_index = min(23, max(0, (round((r + g + b) / 3) - 8) // 10))
+    gray = 232 + gray_index
+
+    if _distance((r, g, b), palette_to_rgb(gray)) < _distance((r, g, b), palette_to_rgb(cube)):
+        return gray
+    return cube
+
+
+def rgb_to_16(r: int, g: int, b: int) -> int:
+    """Find the closest of the 16 basic colors."""
+    return min(range(16), key=lambda i: _distance((r, g, b), BASIC_RGB[i]))
+
+
+def _distance(a: Iterable[int], b: Iterable[int]) -> int:
+    return sum((x - y) ** 2 for x, y in zip(a, b, strict=True))
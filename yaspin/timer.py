@@ -0,0 +1,99 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.timer
+~~~~~~~~~~~~
+
+Elapsed time display for the spinner.
+
+Time is measured with the monotonic clock in nanoseconds and formatted
+with integer arithmetic only. The whole seconds part changes once per
+second, so it is cached between frames.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+
+NS_PER_SEC: Final[int] = 1_000_000_000
+
+# Fractions are looked up in a precomputed table up to this precision
+MAX_TABLE_PRECISION: Final[int] = 3
+
+
+@dataclass(frozen=True)
+class TimerFormat:
+    """Format of the elapsed time shown along with the spinner.
+
+    Attributes:
+        precision: Number of digits of fractional seconds, from 0 to 9.
+        compact: Use the compact format, e.g. ``1m23.45s``, instead of
+            ``0:01:23.45``.
+        threshold: Number of seconds to pass before the timer is shown.
+    """
+
+    precision: int = 2
+    compact: bool = False
+    threshold: float = 0
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.precision <= 9:
+            raise ValueError(f"'{self.precision}': timer precision should be in range from 0 to 9")
+        if self.threshold < 0:
+            raise ValueError(f"'{self.threshold}': timer threshold should not be negative")
+
+
+class Timer:
+    """Formats the elapsed time according to the ``TimerFormat``."""
+
+    def __init__(self, fmt: TimerFormat) -> None:
+        self.format = fmt
+        self._unit = 10 ** (9 - fmt.precision)  # nanoseconds per displayed unit
+        self._scale = 10**fmt.precision
+        self._threshold_ns = round(fmt.threshold * NS_PER_SEC)
+        closing = "s)" if fmt.compact else ")"
+        self._closing = closing
+        self._fractions: tuple[str, ...] | None = None
+        if fmt.precision == 0:
+            self._fractions = (closing,)
+        elif fmt.precision <= MAX_TABLE_PRECISION:
+            self._fractions = tuple(f".{i:0{fmt.precision}d}{closing}" for i in range(self._scale))
+        # (whole seconds, formatted prefix) of the last call
+        self._prefix: tuple[int, str] = (-1, "")
+
+    def __call__(self, elapsed_ns: int) -> str:
+        """Return the timer segment of the spinner line, e.g. `` (0:00:01.23)``."""
+        if elapsed_ns < self._threshold_ns:
+            return ""
+
+        # Round half up to the displayed precision
+        ticks = (elapsed_ns + self._unit // 2) // self._unit
+        sec, frac = divmod(ticks, self._scale)
+
+        cached_sec, prefix = self._prefix
+        if cached_sec != sec:
+            prefix = self._format_prefix(sec)
+            self._prefix = (sec, prefix)
+
+        if self._fractions is not None:
+            return prefix + self._fractions[frac]
+        return f"{prefix}.{frac:0{self.format.precision}d}{self._closing}"
+
+    def _format_prefix(self, sec: int) -> str:
+        minutes, sec = divmod(sec, 60)
+        hours, minutes = divmod(minutes, 60)
+        if self.format.compact:
+            if hours:
+                return f" ({hours}h{minutes:02d}m{sec:02d}"
+            if minutes:
+                return f" ({minutes}m{sec:02d}"
+            return f" ({sec}"
+
+        # Same as ``str(datetime.timedelta)``
+        days, hours = divmod(hours, 24)
+        if days:
+            plural = "s" if days != 1 else ""
+            return f" ({days} day{plural}, {hours}:{minutes:02d}:{sec:02d}"
+        return f" ({hours}:{minutes:02d}:{sec:02d}"
@@ -0,0 +1,103 @@
+# :copyright: (c) 2021 by Pavlo Dmytrenko.
+# :license: MIT, see LICENSE for more details.
+
+"""
+yaspin.width
+~~~~~~~~~~~~
+
+Display width of the text in terminal cells.
+
+East Asian wide and fullwidth characters, including most emoji, take two
+cells, while combining marks, variation selectors and other format
+characters take none. Character widths are looked up once and kept in
+a table.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Final
+
+import unicodedata
+
+ZWJ: Final[str] = "\u200d"
+
+# Regional indicator symbols, a pair of which forms a flag emoji
+REGIONAL_INDICATORS: Final[range] = range(0x1F1E6, 0x1F200)
+
+# Display widths of the characters seen so far, prefilled with printable
+# ASCII. The table is bounded by the number of distinct characters.
+_WIDTHS: dict[str, int] = {chr(code): 1 for code in range(0x20, 0x7F)}
+
+
+def char_width(char: str) -> int:
+    """Return the number of terminal cells taken by the character."""
+    width = _WIDTHS.get(char)
+    if width is None:
+        width = _WIDTHS[char] = _lookup_width(char)
+    return width
+
+
+def _lookup_width(char: str) -> int:
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def clusters(text: str) -> Iterator[tuple[str, int]]:
+    """Split the text into grapheme clusters along with their widths.
+
+    Approximates extended grapheme clusters: zero-width characters and
+    characters following ZWJ stick to the preceding cluster, and pairs of
+    regional indicators form a single two-cell flag.
+    """
+    cluster = ""
+    width = 0
+    joined = False
+    for char in text:
+        char_w = char_width(char)
+        if cluster and (char_w == 0 or joined):
+            cluster += char
+        elif len(cluster) == 1 and _is_regional(cluster) and _is_regional(char):
+            cluster += char
+            width = 2
+        else:
+            if cluster:
+                yield cluster, width
+            cluster, width = char, char_w
+        joined = char == ZWJ
+    if cluster:
+        yield cluster, width
+
+
+def _is_regional(char: str) -> bool:
+    return ord(char) in REGIONAL_INDICATORS
+
+
+def text_width(text: str) -> int:
+    """Return the number of terminal cells taken by the text."""
+    if text.isascii():
+        return len(text)
+    return sum(width for _, width in clusters(text))
+
+
+def truncate(text: str, max_width: int) -> tuple[str, int]:
+    """Cut the text to fit into ``max_width`` cells.
+
+    The text is cut on grapheme cluster boundaries only. Returns the
+    truncated text along with its width.
+    """
+    if text.isascii():
+        text = text[:max_width]
+        return text, len(text)
+
+    end = 0
+    total = 0
+    for cluster, width in clusters(text):
+        if total + width > max_width:
+            break
+        end += len(cluster)
+        total += width
+    return text[:end], total